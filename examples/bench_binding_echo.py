@@ -0,0 +1,27 @@
+import time
+import tkinter as tk
+from tkkit import *
+
+# one field bound to N tk variables, a keystroke in one of them is written once to each of the others
+# and never echoed back: the cost per keystroke grows by one variable write per extra widget
+
+interpreter = tk.Tcl() # no display needed, variables and traces are plain Tcl
+
+def keystroke_cost(widget_count, rounds=2000):
+    vm = ViewModel()
+    vm.text = ''
+    variables = [tk.StringVar(master=interpreter, value='') for _ in range(widget_count)]
+    subscriptions = [vm.text_.connect_tk_var(variable) for variable in variables]
+    started_at = time.perf_counter()
+    for i in range(rounds):
+        variables[0].set(f'typed {i}') # what an Entry does on a keystroke
+    elapsed = (time.perf_counter() - started_at) / rounds
+    assert all(variable.get() == vm.text for variable in variables)
+    for subscription in subscriptions:
+        subscription.dispose()
+    return elapsed
+
+for widget_count in (1, 2, 10, 50):
+    cost = keystroke_cost(widget_count)
+    print(f'{widget_count:>3} widgets: {cost * 1e6:8.1f} us per keystroke, '
+          f'{cost * 1e6 / widget_count:6.1f} us per widget')
@@ -0,0 +1,41 @@
+import sys
+import time
+from tkkit import *
+
+# time to first frame for generated forms of 1k/5k/10k widgets, in the default, deferred and flattened build modes.
+# flattening only merges stacks nested in a stack of the same direction (an HStack in an HStack, a VStack in a VStack):
+# the sectioned form nests that way and loses most of its frames, the alternating form (an HStack holding a VStack
+# holding an HStack) has nothing to merge, merging across directions would couple the column widths of unrelated rows.
+# needs a display, pass --null to build on a NullBackend, which leaves mostly the python side of building.
+
+def sectioned_form(widget_count):
+    sections = []
+    for section in range(widget_count // 100): # 20 rows of 5 tk widgets per section
+        rows = [HStack([Label(f'Field {section}.{i}'), HStack([TextBox(f'value {i}'), CheckBox('on')]),
+                        HStack([Button('Go'), Button('Reset')])]) for i in range(20)]
+        sections.append(VStack(rows))
+    return VStack(sections)
+
+def alternating_form(widget_count):
+    rows = []
+    for i in range(widget_count // 7): # 7 tk widgets per row
+        rows.append(HStack([Label(f'Field {i}'), VStack([TextBox(f'value {i}'), HStack([CheckBox('on'), Button('Go')])])]))
+    return VStack(rows)
+
+def time_to_first_frame(make_form, widget_count, **show_options):
+    app = TKApp('Build benchmark', backend=NullBackend() if '--null' in sys.argv else None)
+    started_at = time.perf_counter()
+    app.show(make_form(widget_count), **show_options)
+    app.el.update()
+    elapsed = time.perf_counter() - started_at
+    app.el.destroy()
+    return elapsed, app
+
+for make_form in (sectioned_form, alternating_form):
+    print(make_form.__name__)
+    for widget_count in (1000, 5000, 10000):
+        default_time, _ = time_to_first_frame(make_form, widget_count)
+        deferred_time, _ = time_to_first_frame(make_form, widget_count, deferred=True)
+        flat_time, app = time_to_first_frame(make_form, widget_count, deferred=True, flatten=True)
+        print(f'{widget_count:>6} widgets: default {default_time * 1000:8.1f}ms, deferred {deferred_time * 1000:8.1f}ms, '
+              f'deferred+flatten {flat_time * 1000:8.1f}ms  {app.layout_report}')
@@ -0,0 +1,33 @@
+import sys
+import time
+from tkkit import *
+
+# a status screen of 300 named labels updated every tick, one set_text() per label against one set_texts().
+# needs a display, pass --null to count tcl calls on a NullBackend instead.
+
+LABELS = 300
+TICKS = 200
+
+backend = NullBackend() if '--null' in sys.argv else None
+app = TKApp('Status', backend=backend)
+app.show(VStack([HStack([Label('-', name=f'status_{row}_{column}') for column in range(10)])
+                 for row in range(LABELS // 10)]))
+names = list(app.name_registry)
+
+def per_name(tick):
+    for name in names:
+        app.set_text(name, f'{tick}:{name}')
+
+def bulk(tick):
+    app.set_texts({name: f'{tick}:{name}' for name in names})
+
+for label, update in (('set_text loop', per_name), ('set_texts', bulk)):
+    if backend is not None:
+        backend.reset_ops()
+    started_at = time.perf_counter()
+    for tick in range(TICKS):
+        update(tick)
+    elapsed = time.perf_counter() - started_at
+    app.el.update()
+    calls = f', {backend.total_ops / TICKS:.0f} tcl calls per tick' if backend is not None else ''
+    print(f'{label:>13}: {TICKS * LABELS / elapsed:,.0f} label updates/s, {TICKS / elapsed:,.0f} ticks/s{calls}')
@@ -0,0 +1,110 @@
+import copy
+import time
+from tkkit import *
+
+# an order form of 30 bound fields, edited one field at a time: the order kept as a dict and reassigned whole,
+# against nested ViewModels bound by path. counts the field listeners called and the tcl calls per edit.
+
+EDITS = 3000
+SECTIONS = {'customer': ['name', 'email', 'phone', 'company', 'vat_id'],
+            'shipping': ['street', 'city', 'zip', 'country', 'carrier'],
+            'billing': ['street', 'city', 'zip', 'country', 'iban']}
+LINES = 15 # order.line_<i>, also bound
+
+class Section(ViewModel):
+    def __init__(self, fields):
+        super().__init__()
+        for field, value in fields.items():
+            setattr(self, field, value)
+
+class Order(ViewModel):
+    def __init__(self, order):
+        super().__init__()
+        for key, value in order.items():
+            setattr(self, key, Section(value) if isinstance(value, dict) else value)
+
+def new_order():
+    order = {section: {field: f'{section} {field}' for field in fields} for section, fields in SECTIONS.items()}
+    order.update({f'line_{line}': line for line in range(LINES)})
+    return order
+
+PATHS = [(section, field) for section, fields in SECTIONS.items() for field in fields] + \
+        [(f'line_{line}',) for line in range(LINES)]
+calls = 0
+
+def count(value):
+    global calls
+    calls += 1
+
+def dict_field(path):
+    def get(order):
+        for key in path:
+            order = order[key]
+        return order
+    return get
+
+def flat():
+    vm = ViewModel()
+    vm.order = new_order()
+    labels = []
+    for path in PATHS:
+        field = vm.order_.map(dict_field(path))
+        field.subscribe(count)
+        labels.append(Label(field))
+    def edit(path, value):
+        order = copy.deepcopy(vm.order) # reassigned whole, so it must be a new dict
+        target = order
+        for key in path[:-1]:
+            target = target[key]
+        target[path[-1]] = value
+        vm.order = order
+    return labels, edit
+
+def nested():
+    vm = ViewModel()
+    vm.order = Order(new_order())
+    labels = []
+    for path in PATHS:
+        field = vm.order
+        for key in path[:-1]:
+            field = getattr(field, key)
+        field = getattr(field, path[-1] + '_')
+        field.subscribe(count)
+        labels.append(Label(field))
+    def edit(path, value):
+        target = vm.order
+        for key in path[:-1]:
+            target = getattr(target, key)
+        setattr(target, path[-1], value)
+    return labels, edit
+
+for label, setup in (('dict', flat), ('nested', nested)):
+    backend = NullBackend()
+    app = TKApp('Order', backend=backend)
+    labels, edit = setup()
+    app.show(VStack(labels))
+    backend.update()
+    backend.reset_ops()
+    calls = 0
+    started_at = time.perf_counter()
+    for number in range(EDITS):
+        edit(PATHS[number % len(PATHS)], f'edit {number}')
+    elapsed = time.perf_counter() - started_at
+    backend.update()
+    print(f'{label:>6}: {calls / EDITS:.1f} listener calls and {backend.total_ops / EDITS:.1f} tcl calls per edit, '
+          f'{EDITS / elapsed:,.0f} edits/s')
+    app.el.destroy()
+
+# a path binding follows the models through a broken path: the order is removed, then a new one comes in
+backend = NullBackend()
+app = TKApp('Order', backend=backend)
+vm = ViewModel()
+vm.order = Order(new_order())
+name = Label(vm.order.customer.name_)
+app.show(VStack([name]))
+vm.order = None
+vm.order = Order(new_order())
+vm.order.customer.name = 'restored'
+backend.update()
+assert name.el.cget('text') == 'restored', name.el.cget('text')
+print('binding restored after the path was broken')
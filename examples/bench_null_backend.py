@@ -0,0 +1,34 @@
+import time
+from tkkit import *
+
+# builds and updates bound forms without a display, and prints how many tk commands each scenario costs
+
+class FormViewModel(ViewModel):
+    def __init__(self, fields):
+        super().__init__()
+        self.title = 'Customer'
+        self.values = [f'value {i}' for i in range(fields)]
+        self.rows = [[i, f'row {i}'] for i in range(20)]
+
+def make_form(vm, fields):
+    rows = [HStack([Label(f'Field {i}'), TextBox(f'value {i}'), CheckBox('on')]) for i in range(fields)]
+    return VStack([Label(vm.title_)] + rows + [DataTable(['id', 'name'], vm.rows_)])
+
+def run(forms, fields):
+    backend = NullBackend()
+    app = TKApp('Null backend benchmark', backend=backend)
+    started_at = time.perf_counter()
+    for _ in range(forms):
+        vm = FormViewModel(fields)
+        app.show(make_form(vm, fields))
+        vm.title = 'Supplier'
+        vm.rows.append([20, 'row 20'])
+        backend.update()
+        app.window.release()
+    return time.perf_counter() - started_at, backend
+
+for forms, fields in ((100, 10), (1000, 10), (100, 100)):
+    elapsed, backend = run(forms, fields)
+    print(f'{forms:>5} forms of {fields:>3} fields: {elapsed:6.2f}s, {elapsed / forms * 1000:6.2f}ms per form, '
+          f'{backend.total_ops / forms:7.0f} tk commands per form')
+    print('       most called:', ', '.join(f'{name} {count // forms}' for name, count in backend.ops.most_common(6)))
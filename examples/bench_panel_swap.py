@@ -0,0 +1,32 @@
+import time
+import tracemalloc
+from tkkit import *
+
+# swap a bound panel 10k times: listener count, python memory and notify cost should stay flat
+
+app = TKApp('Panel swap benchmark')
+vm = ViewModel()
+vm.text = 'hello'
+vm.progress = 0
+
+def make_panel(index):
+    return VStack([Label(vm.text_), Button(vm.text_), TextBox(vm.text_), ProgressBar(vm.progress_)], name='panel')
+
+app.show(VStack([make_panel(0)]))
+app.el.update()
+
+def notify_cost(rounds=100):
+    started_at = time.perf_counter()
+    for i in range(rounds):
+        vm.text = f'value {i}'
+    return (time.perf_counter() - started_at) / rounds
+
+tracemalloc.start()
+for swap in range(1, 10001):
+    app.replace('panel', make_panel(swap))
+    if swap % 2000 == 0:
+        app.el.update()
+        current, _ = tracemalloc.get_traced_memory()
+        print(f'{swap:>6} swaps: {len(vm.text_.listeners)} listeners, {current / 1024:8.0f} KiB, '
+              f'notify {notify_cost() * 1e6:6.1f}us')
+app.el.destroy()
@@ -0,0 +1,55 @@
+import multiprocessing
+import random
+import time
+from tkkit import *
+
+# an engine process edits a 100k-row table, the ui process mirrors it through a pipe.
+# the mirror is drained in a loop here instead of app.el.after(), so this runs without a display.
+
+ROWS = 100_000
+UPDATES = 200_000
+
+def engine(connection):
+    vm = ViewModel()
+    vm.rows = [[i, f'part {i}', 0.0] for i in range(ROWS)]
+    vm.status = 'starting'
+    publisher = ViewModelPublisher(vm, connection, fields=['rows', 'status'])
+    rng = random.Random(1)
+    for i in range(UPDATES):
+        choice = rng.random()
+        if choice < 0.8:
+            vm.rows.set_cell(rng.randrange(ROWS), 2, i / 10)
+        elif choice < 0.9:
+            vm.rows[rng.randrange(ROWS)] = [i, f'replaced {i}', 1.0]
+        else:
+            vm.status = f'{i} updates' # coalesced, only the newest queued status is sent
+    vm.rows.append([ROWS, 'last', 0.0])
+    publisher.flush()
+    print(f'engine: {publisher.sent_records:,} records in {publisher.sent_batches:,} batches, '
+          f'{publisher.sent_bytes / 1e6:.1f} MB sent')
+    publisher.close()
+    connection.close()
+
+if __name__ == '__main__':
+    ui_end, engine_end = multiprocessing.Pipe()
+    vm = ViewModel()
+    vm.rows = []
+    cell_updates = 0
+
+    def count(rows, change_type=None, data=None): # stands in for a bound DataTable
+        global cell_updates
+        if change_type is not None:
+            cell_updates += 1
+
+    vm.rows_.on_change(count)
+    mirror = ViewModelMirror(vm, ui_end)
+    process = multiprocessing.Process(target=engine, args=(engine_end,))
+    started_at = time.perf_counter()
+    process.start()
+    while len(vm.rows) <= ROWS:
+        if not mirror.apply_pending():
+            time.sleep(0.001)
+    elapsed = time.perf_counter() - started_at
+    process.join()
+    print(f'ui: {mirror.applied_records:,} records applied in {elapsed:.2f}s, '
+          f'{mirror.applied_records / elapsed:,.0f} updates/s, {cell_updates:,} list notifications, status "{vm.status}"')
@@ -0,0 +1,46 @@
+import gc
+import sys
+import time
+from functools import partial
+from tkkit import *
+
+# thousands of the same card: subtrees built per second from the plain factory and from its Template.
+# needs a display, pass --null to build on a NullBackend, which leaves mostly the python side of building.
+
+CARDS = 3000
+
+class Task(ViewModel):
+    def __init__(self, index):
+        super().__init__()
+        self.title = f'Task {index}'
+        self.owner = f'user {index % 17}'
+        self.done = index % 3 == 0
+
+def make_card(task, on_open):
+    return HStack([
+        Label(task.title_, expand=1),
+        VStack([Label(task.owner_, align='left'), Label('due soon', align='left', foreground='gray')]),
+        CheckBox('Done', checked=task.done_),
+        Button('Open', on_click=on_open),
+        Button('Delete', on_click=on_open),
+    ], padding=2, gap=4)
+
+def open_task(task):
+    pass
+
+def build(factory):
+    tasks = [Task(i) for i in range(CARDS)]
+    app = TKApp('Cards', backend=NullBackend() if '--null' in sys.argv else None)
+    gc.collect()
+    started_at = time.perf_counter()
+    app.show(VStack([factory(task, partial(open_task, task)) for task in tasks]), deferred=True)
+    elapsed = time.perf_counter() - started_at
+    app.el.destroy()
+    return elapsed
+
+best = {}
+for round in range(3): # alternated, best of three
+    for label, factory in (('plain', make_card), ('template', Template(make_card))):
+        best[label] = min(best.get(label, float('inf')), build(factory))
+for label, elapsed in best.items():
+    print(f'{label:>8}: {CARDS} cards in {elapsed * 1000:.0f}ms, {CARDS / elapsed:,.0f} subtrees/s')
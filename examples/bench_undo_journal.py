@@ -0,0 +1,41 @@
+import time
+import tracemalloc
+from tkkit import *
+
+# undo for cell edits on a 100k row table: what the journal keeps against one snapshot of the table,
+# and the tk work of an undo, which only touches the cells it restores.
+
+ROWS = 100_000
+EDITS = 5_000
+
+vm = ViewModel()
+vm.rows = [[i, f'part-{i}', i * 0.5] for i in range(ROWS)]
+backend = NullBackend()
+app = TKApp('Parts', backend=backend)
+app.show(VStack([DataTable(['id', 'name', 'price'], vm.rows_)]))
+
+tracemalloc.start()
+started_at = tracemalloc.get_traced_memory()[0]
+snapshot = [list(row) for row in vm.rows]
+snapshot_bytes = tracemalloc.get_traced_memory()[0] - started_at
+del snapshot
+
+journal = UndoJournal(vm.rows_, max_steps=1000, merge_within=0)
+started_at = tracemalloc.get_traced_memory()[0]
+for first in range(0, EDITS, 5):
+    with journal.step(): # five edits per undo step
+        for edit in range(first, first + 5):
+            vm.rows.set_cell(edit * 17 % ROWS, 2, edit)
+journal_bytes = tracemalloc.get_traced_memory()[0] - started_at
+tracemalloc.stop()
+print(f'{EDITS} edits journaled in {journal_bytes / 1024:,.0f} KiB, one snapshot of the table takes {snapshot_bytes / 1024:,.0f} KiB')
+
+backend.update()
+backend.reset_ops()
+started_at = time.perf_counter()
+steps = 0
+while journal.undo():
+    steps += 1
+backend.update()
+elapsed = time.perf_counter() - started_at
+print(f'{steps} undo steps in {elapsed * 1000:.0f}ms, {backend.total_ops / steps:.1f} tk commands per step')
@@ -0,0 +1,18 @@
+import tracemalloc
+from tkkit import *
+
+# memory held by 100k widget specs of a generated inspection form, before anything is built
+
+def make_specs(count):
+    specs = []
+    for i in range(count // 2):
+        specs.append(Label(f'Field {i}', width=20))
+        specs.append(TextBox(f'value {i}', width=30, padding=2))
+    return specs
+
+tracemalloc.start()
+baseline, _ = tracemalloc.get_traced_memory()
+specs = make_specs(100000)
+current, peak = tracemalloc.get_traced_memory()
+print(f'{len(specs)} specs: {(current - baseline) / 1024 / 1024:.1f} MiB, '
+      f'{(current - baseline) / len(specs):.0f} bytes per spec, peak {peak / 1024 / 1024:.1f} MiB')
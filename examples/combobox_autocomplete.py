@@ -0,0 +1,20 @@
+import random
+from tkkit import *
+
+# type-ahead over 200k part numbers, the dropdown only ever holds the first 50 matches
+
+app = TKApp('Part Search')
+vm = ViewModel()
+vm.parts = [f'{random.choice("ABCDEFGH")}{random.choice("XYZ")}-{n:06d}' for n in range(200_000)]
+vm.part = ''
+
+def add_part():
+    vm.parts.append(f'NEW-{len(vm.parts):06d}') # indexed incrementally, no rebuild
+
+window = VStack([
+    ComboBox(vm.parts_, selected=vm.part_, autocomplete=True, width=30),
+    HStack([Label('Selected:'), Label(vm.part_), Button('Add Part', on_click=add_part)]),
+])
+
+app.show(window)
+app.run()
@@ -0,0 +1,18 @@
+import os
+import sys
+from tkkit import *
+
+# thumbnails of every image in a folder, decoded on worker threads and cached on disk for the next run
+# usage: python demo_image_browser.py <folder>
+
+folder = sys.argv[1] if len(sys.argv) > 1 else '.'
+paths = sorted(os.path.join(folder, name) for name in os.listdir(folder)
+               if name.lower().endswith(('.png', '.gif', '.ppm', '.jpg', '.jpeg', '.bmp')))
+ImageLoader.set_default(ImageLoader(thumbnail_dir='~/.cache/tkkit-demo/thumbnails'))
+
+app = TKApp('Image Browser')
+rows = [HStack([PictureBox(path, size=(128, 128)) for path in paths[i:i + 6]]) for i in range(0, len(paths), 6)]
+window = VStack(rows or [Label('no images found in ' + folder)])
+
+app.show(window)
+app.run()
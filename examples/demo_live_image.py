@@ -0,0 +1,36 @@
+import threading
+import time
+import numpy as np
+from tkkit import *
+
+# a simulated camera pushes 640x480 frames at ~120 fps, PictureBox shows what it can and drops the rest
+
+app = TKApp('Live Image')
+vm = ViewModel()
+vm.frame = np.zeros((480, 640, 3), dtype=np.uint8)
+vm.stats = ''
+picture = PictureBox(vm.frame_)
+
+def simulate():
+    y, x = np.mgrid[0:480, 0:640]
+    t = 0
+    while True:
+        red = (128 + 127 * np.sin(x / 40 + t)).astype(np.uint8)
+        green = (128 + 127 * np.sin(y / 30 - t)).astype(np.uint8)
+        vm.frame = np.dstack((red, green, np.full_like(red, 96)))
+        t += 0.05
+        time.sleep(1 / 120)
+
+def show_stats():
+    stats = picture.frame_stats()
+    if stats is not None:
+        vm.stats = (f"{stats['fps']:.0f} fps shown, {stats['dropped']} dropped, "
+                    f"conversion {stats['conversion_ms']:.1f}ms, latency {stats['latency_ms']:.1f}ms")
+    app.el.after(500, show_stats)
+
+window = VStack([picture, Label(vm.stats_)])
+
+threading.Thread(target=simulate, daemon=True).start()
+app.show(window)
+show_stats()
+app.run()
@@ -0,0 +1,36 @@
+import threading
+import time
+from tkkit import *
+
+# a worker thread streams 50k lines/s into a LogView, the ui stays responsive
+
+app = TKApp('LogView')
+vm = ViewModel()
+vm.rate = ''
+log = LogView(lines=25, max_lines=5000, width=100)
+running = threading.Event()
+
+def produce():
+    sent = 0
+    started_at = time.perf_counter()
+    while running.is_set():
+        for _ in range(500):
+            log.append(f'{time.time():.6f} sample line number {sent}')
+            sent += 1
+        time.sleep(0.01)
+        vm.rate = f'{sent / (time.perf_counter() - started_at):,.0f} lines/s'
+
+def toggle():
+    if running.is_set():
+        running.clear()
+    else:
+        running.set()
+        produce()
+
+window = VStack([
+    HStack([Button('Start / Stop', on_click=toggle), Label(vm.rate_)]),
+    log,
+])
+
+app.show(window)
+app.run()
@@ -0,0 +1,32 @@
+import math
+import random
+import threading
+import time
+from tkkit import *
+
+# three series of 1M samples each, fed by a worker thread and redrawn at 30 fps
+
+app = TKApp('Streaming Plot')
+vm = ViewModel()
+vm.sine = RingBuffer(1_000_000)
+vm.noise = RingBuffer(1_000_000)
+vm.ramp = RingBuffer(1_000_000)
+
+def produce():
+    t = 0
+    while True:
+        batch = range(t, t + 2000)
+        vm.sine.extend([math.sin(i / 5000) for i in batch])
+        vm.noise.extend([random.gauss(0, 0.2) for i in batch])
+        vm.ramp.extend([(i % 200000) / 100000 - 1 for i in batch])
+        t += 2000
+        time.sleep(0.01)
+
+window = VStack([
+    Plot([vm.sine_, vm.noise_, vm.ramp_], y_range=(-1.5, 1.5), fps=30, width=800, height=300,
+         align='fill', vertical_align='fill', expand=1),
+])
+
+threading.Thread(target=produce, daemon=True).start()
+app.show(window)
+app.run()
@@ -0,0 +1,30 @@
+from tkkit import *
+
+# switching panels with app.replace reuses the tk widgets of the old panel through the widget pool
+
+app = TKApp('Widget Pool', pool=WidgetPool(max_size=200))
+vm = ViewModel()
+vm.stats = ''
+panel_index = 0
+
+def make_panel(index):
+    return VStack([
+        Label(f'Panel {index}'),
+        HStack([TextBox(f'value {index}'), CheckBox('enabled'), Button('Apply')]),
+    ], name='panel')
+
+def switch_panel():
+    global panel_index
+    panel_index += 1
+    app.replace('panel', make_panel(panel_index))
+    stats = app.widget_pool.stats()
+    vm.stats = f"hit rate {stats['hit_rate']:.0%}, {stats['widgets_saved']} widgets reused, {stats['idle']} idle"
+
+window = VStack([
+    Button('Switch Panel', on_click=lambda: app.el.after(0, switch_panel)),
+    Label(vm.stats_),
+    make_panel(panel_index),
+])
+
+app.show(window)
+app.run()
@@ -0,0 +1,36 @@
+from tkkit import *
+
+# search runs once typing pauses, the "query" runs at most 10 times per second while the slider moves,
+# and the level label only changes when the level crosses a threshold
+
+WORDS = ['apple', 'apricot', 'banana', 'blueberry', 'cherry', 'grape', 'grapefruit', 'lemon', 'lime', 'mango']
+
+app = TKApp('Rate operators')
+vm = ViewModel()
+vm.query = ''
+vm.results = ''
+vm.searches = 0
+vm.volume = 0
+vm.queries = 0
+
+def search(query):
+    vm.searches += 1
+    vm.results = ', '.join(word for word in WORDS if query and word.startswith(query.lower()))
+
+def run_query(volume):
+    vm.queries += 1
+
+vm.query_.debounce(0.3, app).on_change(search)
+vm.volume_.throttle(0.1, app).on_change(run_query)
+
+view = VStack([
+    HStack([Label('Search'), TextBox(vm.query_)]),
+    Label(vm.results_),
+    Label(vm.searches_.map(lambda count: f'{count} searches')),
+    Slider(vm.volume_),
+    Label(vm.volume_.map(lambda volume: 'loud' if volume > 70 else 'normal').distinct()),
+    Label(vm.queries_.map(lambda count: f'{count} queries')),
+])
+
+app.show(view)
+app.run()
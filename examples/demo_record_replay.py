@@ -0,0 +1,33 @@
+import sys
+from tkkit import *
+
+# python demo_record_replay.py record session.jsonl.gz   type, drag and click, then close the window
+# python demo_record_replay.py replay session.jsonl.gz   replays the session as fast as possible and prints timings
+
+def build():
+    app = TKApp('Record and Replay')
+    vm = ViewModel()
+    vm.query = ''
+    vm.level = 50
+    vm.rows = [[i, f'item {i}'] for i in range(1000)]
+
+    def add_row():
+        vm.rows.append([len(vm.rows), vm.query])
+
+    window = VStack([
+        HStack([TextBox(vm.query_, name='query'), Label(vm.query_)]),
+        HStack([Slider(vm.level_, name='level'), ProgressBar(vm.level_)]),
+        Button('Add Row', on_click=add_row, name='add'),
+        DataTable(['id', 'name'], vm.rows_, name='table'),
+    ])
+    app.show(window)
+    return app
+
+mode, path = sys.argv[1], sys.argv[2]
+app = build()
+if mode == 'record':
+    app.record(path)
+    app.run()
+    app.stop_recording()
+else:
+    print(app.replay(path, speed=None))
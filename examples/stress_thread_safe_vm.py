@@ -0,0 +1,81 @@
+import random
+import threading
+import time
+from tkkit import *
+
+# 8 writer threads mutate one bound list and a pair of fields while 2 reader threads check snapshots.
+# a replica rebuilt only from change notifications must end up equal to the list,
+# and snapshots must never show a half-applied pair of writes.
+
+vm = ViewModel(thread_safe=True)
+vm.items = []
+vm.left = 0
+vm.right = 0
+replica = []
+errors = []
+
+def apply_change(items, change_type=None, data=None):
+    if change_type == BindedListUpdateType.INSERT:
+        replica.append(data)
+    elif change_type == BindedListUpdateType.EXTEND:
+        replica.extend(data)
+    elif change_type == BindedListUpdateType.INSERT_AT:
+        replica.insert(*data)
+    elif change_type == BindedListUpdateType.DELETE_ROW:
+        del replica[data]
+    elif change_type == BindedListUpdateType.SETITEM:
+        replica[data[0]] = data[1]
+    if change_type is not None and len(replica) != len(items): # the full comparison is done at the end
+        errors.append(f'{change_type} {data} does not match the state it describes')
+
+vm.items_.on_change(apply_change)
+
+def writer(seed, operations=3000):
+    rng = random.Random(seed)
+    for i in range(operations):
+        choice = rng.random()
+        if choice < 0.3:
+            vm.items.append((seed, i))
+        elif choice < 0.35:
+            vm.items.extend([(seed, i, 'a'), (seed, i, 'b')])
+        elif choice < 0.45:
+            vm.items.insert(rng.randint(0, 10), (seed, i))
+        elif choice < 0.8:
+            with vm.synchronized(): # the length check and the pop are one step
+                if vm.items:
+                    vm.items.pop(rng.randrange(len(vm.items)))
+        elif choice < 0.9:
+            with vm.synchronized():
+                if vm.items:
+                    vm.items[rng.randrange(len(vm.items))] = (seed, i, 'set')
+        else:
+            with vm.synchronized():
+                vm.left += 1
+                vm.right += 1
+
+def reader(stop):
+    reads = 0
+    while not stop.is_set():
+        snapshot = vm.snapshot()
+        if snapshot['left'] != snapshot['right']:
+            errors.append(f"torn snapshot: left={snapshot['left']} right={snapshot['right']}")
+        reads += 1
+        time.sleep(0.0001)
+    print(f'reader: {reads:,} snapshots')
+
+stop = threading.Event()
+readers = [threading.Thread(target=reader, args=(stop,)) for _ in range(2)]
+writers = [threading.Thread(target=writer, args=(seed,)) for seed in range(8)]
+started_at = time.perf_counter()
+for thread in readers + writers:
+    thread.start()
+for thread in writers:
+    thread.join()
+stop.set()
+for thread in readers:
+    thread.join()
+
+print(f'{8 * 3000:,} writes in {time.perf_counter() - started_at:.2f}s, {len(vm.items):,} items left')
+assert replica == list(vm.items) and tuple(vm.items) == vm.snapshot()['items'], 'replica diverged'
+assert not errors, errors[:5]
+print('notifications matched the list state and snapshots were never torn')
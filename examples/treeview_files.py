@@ -0,0 +1,47 @@
+import os
+from tkkit import *
+
+# browses the whole file system, only opened folders are listed, on a worker thread
+
+class FolderProvider(NodeProvider):
+    def children(self, node):
+        path = node or os.path.abspath(os.sep)
+        try:
+            names = sorted(os.listdir(path), key=str.lower)
+        except OSError:
+            return []
+        return [os.path.join(path, name) for name in names]
+
+    def text(self, node):
+        return os.path.basename(node) or node
+
+    def has_children(self, node):
+        return os.path.isdir(node) and not os.path.islink(node)
+
+    def values(self, node):
+        try:
+            return ('' if os.path.isdir(node) else f'{os.path.getsize(node):,}',)
+        except OSError:
+            return ('',)
+
+app = TKApp('Files')
+vm = ViewModel()
+vm.selected_path = ''
+vm.tree_changes = []
+
+def new_file():
+    if not vm.selected_path:
+        return
+    folder = vm.selected_path if os.path.isdir(vm.selected_path) else os.path.dirname(vm.selected_path)
+    path = os.path.join(folder, 'new file.txt')
+    open(path, 'a').close()
+    vm.tree_changes.append((NodeChangeType.ADD, path, folder))
+
+window = VStack([
+    HStack([Button('New File Here', on_click=new_file), Label(vm.selected_path_)]),
+    TreeView(FolderProvider(), columns=['Size'], changes=vm.tree_changes_, selected_node=vm.selected_path_,
+             vertical_align='fill', expand=1),
+])
+
+app.show(window)
+app.run()
@@ -0,0 +1,12 @@
+import pytest
+from tkkit import TKApp, NullBackend
+
+@pytest.fixture
+def backend():
+    return NullBackend()
+
+@pytest.fixture
+def app(backend):
+    app = TKApp('test', backend=backend)
+    yield app
+    app.el.destroy()
@@ -0,0 +1,37 @@
+import csv
+import json
+from tkkit import *
+
+def test_export_streams_filtered_sorted_view(app, tmp_path):
+    vm = ViewModel()
+    vm.rows = [[i, f'part-{i}'] for i in range(2500)]
+    vm.progress = 0
+    table = DataTable(['id', 'name'], vm.rows_)
+    app.show(VStack([table]))
+    job = table.export(str(tmp_path / 'parts.csv'), where=lambda row: row[0] % 2 == 0, key=lambda row: -row[0],
+                       progress=vm.progress_, chunk_size=100)
+    assert job.wait(10)
+    assert job.error is None
+    with open(tmp_path / 'parts.csv', newline='') as f:
+        rows = list(csv.reader(f))
+    assert rows[0] == ['id', 'name']
+    assert len(rows) == 1251
+    assert rows[1] == ['2498', 'part-2498']
+    assert vm.progress == 100
+
+def test_export_jsonl_and_cancel(app, tmp_path):
+    vm = ViewModel()
+    vm.rows = [[i, 'x'] for i in range(10)]
+    table = DataTable(['id', 'name'], vm.rows_)
+    app.show(VStack([table]))
+    job = table.export(str(tmp_path / 'rows.jsonl'))
+    assert job.wait(10)
+    with open(tmp_path / 'rows.jsonl') as f:
+        assert [json.loads(line) for line in f][3] == {'id': 3, 'name': 'x'}
+
+    rows = [[i] for i in range(200_000)]
+    job = TableExport(['id'], rows, str(tmp_path / 'big.csv'), chunk_size=10)
+    job.cancel()
+    job.start()
+    assert job.wait(10)
+    assert job.cancelled and not (tmp_path / 'big.csv').exists()
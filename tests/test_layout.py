@@ -0,0 +1,24 @@
+from tkkit import VStack, HStack, Label, TextBox, CheckBox, Button
+from tkkit.layout import compile_layout
+
+
+def row(i):
+    return HStack([Label(f'Field {i}'), HStack([TextBox(f'value {i}'), CheckBox('on')]), HStack([Button('Go')])])
+
+
+def test_same_direction_stacks_are_merged(app, backend):
+    compiled, report = compile_layout(VStack([row(i) for i in range(10)]))
+    assert report.merged == 20
+    assert report.frames_before - report.frames_after == 20
+    assert [len(child.children) for child in compiled.children] == [4] * 10
+    app.show(VStack([row(i) for i in range(10)]), flatten=True, deferred=True)
+    assert app.layout_report.merged == 20
+    first = app.window.children[0]
+    assert [backend.widget(child).geometry['column'] for child in first.children] == [0, 1, 2, 3]
+
+
+def test_stacks_of_the_other_direction_keep_their_frame():
+    form = VStack([HStack([Label('a'), VStack([TextBox('b'), HStack([CheckBox('c'), Button('d')])])])])
+    _, report = compile_layout(form)
+    assert report.merged == 0
+    assert report.frames_before == report.frames_after
@@ -0,0 +1,40 @@
+import tkinter
+from tkkit import *
+
+def make_app():
+    app = TKApp('test', backend=NullBackend())
+    vm = ViewModel()
+    vm.choice = 'b'
+    radio = RadioGroup([RadioButton('a'), RadioButton('b')], value=vm.choice_)
+    app.show(VStack([
+        ListBox(['a', 'b', 'c'], name='list'),
+        TextBox('hello', name='text'),
+        radio,
+    ]))
+    return app, vm, radio
+
+def test_two_live_apps_keep_their_own_variables():
+    first, _, _ = make_app()
+    second, vm, radio = make_app()
+    try:
+        second.set_value('list', 'c')
+        assert second.get_value('list') == 'c'
+        assert second.get_value('text') == 'hello'
+        second.set_value('text', 'second')
+        assert first.get_value('text') == 'hello'
+        vm.choice = 'a'
+        assert radio.var_to_bind.get() == 'a'
+        assert second.name_registry['list'].var_to_bind._tk is second.el.tk
+        assert tkinter._default_root is None
+    finally:
+        first.el.destroy()
+        second.el.destroy()
+
+def test_ops_are_counted(app, backend):
+    vm = ViewModel()
+    vm.rows = [[1, 'a']]
+    app.show(VStack([DataTable(['id', 'name'], vm.rows_)]))
+    backend.reset_ops()
+    vm.rows.append([2, 'b'])
+    backend.update()
+    assert backend.ops['Treeview insert'] == 1
@@ -0,0 +1,56 @@
+from multiprocessing import Pipe
+from tkkit import *
+
+def mirror_pair(vm, fields):
+    engine_end, ui_end = Pipe()
+    mirror_vm = ViewModel()
+    mirror = ViewModelMirror(mirror_vm, ui_end)
+    publisher = ViewModelPublisher(vm, engine_end, fields=fields, batch_ms=1)
+    return publisher, mirror, mirror_vm
+
+def sync(publisher, mirror):
+    # the mirror is applied by hand instead of on a tk loop, the publisher waits for its acks
+    for _ in range(500):
+        mirror.apply_pending()
+        if publisher.flush(timeout=0.01):
+            return
+    raise AssertionError('mirror did not catch up')
+
+def test_mirror_of_thread_safe_model(app):
+    vm = ViewModel(thread_safe=True)
+    vm.rows = [[1, 'a'], [2, 'b']]
+    vm.status = 'idle'
+    publisher, mirror, mirror_vm = mirror_pair(vm, ['rows', 'status'])
+    try:
+        sync(publisher, mirror)
+        table = DataTable(['id', 'name'], mirror_vm.rows_)
+        app.show(VStack([table, Label(mirror_vm.status_)]))
+        vm.rows.append([3, 'c'])
+        vm.rows.set_cell(0, 1, 'A')
+        vm.rows = vm.rows + [[4, 'd']] # replaced, arrives as a frozen snapshot
+        vm.rows.append([5, 'e'])
+        vm.status = 'done'
+        sync(publisher, mirror)
+        assert mirror_vm.rows == [[1, 'A'], [2, 'b'], [3, 'c'], [4, 'd'], [5, 'e']]
+        assert isinstance(mirror_vm.rows[0], list)
+        assert mirror_vm.status == 'done'
+        assert [table.el.item(item, 'values') for item in table.el.get_children()][0] == ('1', 'A')
+        assert len(table.el.get_children()) == 5
+    finally:
+        publisher.close()
+        mirror.close()
+
+def test_row_set_is_sent_once():
+    vm = ViewModel()
+    vm.rows = [[1, 'a'], [2, 'b']]
+    publisher, mirror, mirror_vm = mirror_pair(vm, ['rows'])
+    try:
+        sync(publisher, mirror)
+        records = publisher.sent_records
+        vm.rows[1] = [2, 'B'] # one changed cell, notified as the cell and the row
+        sync(publisher, mirror)
+        assert publisher.sent_records - records == 1
+        assert mirror_vm.rows == [[1, 'a'], [2, 'B']]
+    finally:
+        publisher.close()
+        mirror.close()
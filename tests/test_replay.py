@@ -0,0 +1,21 @@
+from tkkit import ViewModel, TextBox, CheckBox, VStack
+from tkkit.replay import read_events
+
+
+def test_record_leaves_out_programmatic_writes(app, backend, tmp_path):
+    vm = ViewModel()
+    vm.title = 'start'
+    box = TextBox(vm.title_, name='title')
+    check = CheckBox('done', name='done')
+    app.show(VStack([box, check]))
+    path = tmp_path / 'session.jsonl'
+    app.record(path)
+    box.set_value('from code')
+    app.set_values({'title': 'bulk', 'done': 1})
+    check.set_value(0)
+    vm.title = 'from the model'
+    app.el.setvar(str(box.var_to_bind), 'typed') # what an entry does on a key press
+    backend.update()
+    app.stop_recording()
+    assert [event[1:] for event in read_events(path)] == [['title', 'set', 'typed']]
+    assert vm.title == 'typed'
@@ -0,0 +1,23 @@
+import tkinter as tk
+from tkkit import VStack, Label, TabControl
+
+
+def test_deferred_geometry_suspends_the_manager_in_use(app, backend, monkeypatch):
+    calls = []
+    for manager in ('grid', 'pack'):
+        original = getattr(tk.Misc, f'{manager}_propagate')
+        def record(el, *flag, manager=manager, original=original):
+            if flag:
+                calls.append((str(el), manager, flag[0]))
+            return original(el, *flag)
+        monkeypatch.setattr(tk.Misc, f'{manager}_propagate', record)
+    tabs = TabControl({'A': [Label('a')], 'B': [Label('b')]})
+    app.show(VStack([tabs]), deferred=True)
+    notebook = str(tabs.el)
+    assert (notebook, 'pack', False) in calls and (notebook, 'pack', True) in calls
+    assert not [call for call in calls if call[0] == notebook and call[1] == 'grid']
+    grid_masters = {path for path, manager, flag in calls if manager == 'grid'}
+    assert str(tabs.tab_columns[0].el) in grid_masters
+    widgets = backend.interpreter.widgets
+    assert all(widgets[path].propagate for path in grid_masters)
+    assert widgets[notebook].pack_propagate
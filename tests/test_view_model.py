@@ -0,0 +1,104 @@
+import random
+from tkkit import ViewModel, FrozenList, Label, TextBox, VStack, UndoJournal
+
+
+def test_frozen_list_follows_changes():
+    FrozenList.CHUNK, chunk = 4, FrozenList.CHUNK # small chunks, so changes cross chunk borders
+    try:
+        vm = ViewModel(thread_safe=True)
+        vm.items_.subscribe(lambda items: None) # a bound list reports its changes
+        vm.items = [[i, str(i)] for i in range(10)]
+        rng = random.Random(1)
+        for i in range(300):
+            choice = rng.random()
+            if choice < 0.3:
+                vm.items.append([i, 'a'])
+            elif choice < 0.4:
+                vm.items.extend([[i, 'b'], [i, 'c']])
+            elif choice < 0.55:
+                vm.items.insert(rng.randrange(-3, len(vm.items) + 3), [i, 'd'])
+            elif choice < 0.75 and len(vm.items):
+                vm.items.pop(rng.randrange(-len(vm.items), len(vm.items)))
+            elif choice < 0.9 and len(vm.items):
+                vm.items[rng.randrange(len(vm.items))] = [i, 'e']
+            elif len(vm.items):
+                vm.items.set_cell(rng.randrange(len(vm.items)), 1, 'f')
+            snapshot = vm.snapshot()['items']
+            assert isinstance(snapshot, FrozenList)
+            assert snapshot == [tuple(row) for row in vm.items]
+            assert len(snapshot) == len(vm.items)
+            if len(vm.items):
+                assert snapshot[-1] == tuple(vm.items[-1])
+    finally:
+        FrozenList.CHUNK = chunk
+
+
+def test_old_snapshot_is_unchanged():
+    vm = ViewModel(thread_safe=True)
+    vm.items_.subscribe(lambda items: None)
+    vm.items = list(range(2000))
+    before = vm.snapshot()['items']
+    vm.items.insert(0, 'first')
+    vm.items.pop(1500)
+    vm.items[10] = 'ten'
+    vm.items.append('last')
+    assert before == tuple(range(2000))
+    assert vm.snapshot()['items'] == vm.items
+
+
+def test_unset_field_changes_to_zero_in_both_modes():
+    for thread_safe in (False, True):
+        vm = ViewModel(thread_safe=thread_safe)
+        seen = []
+        vm.count_.subscribe(seen.append)
+        seen.clear()
+        vm.count = 0 # unset is None in both modes, so 0 is a change
+        assert seen == [0], thread_safe
+
+
+class Customer(ViewModel):
+    def __init__(self, name):
+        super().__init__()
+        self.name = name
+
+
+class Order(ViewModel):
+    def __init__(self, name):
+        super().__init__()
+        self.customer = Customer(name)
+
+
+def test_broken_path_clears_bound_widgets(app, backend):
+    vm = ViewModel()
+    vm.order = Order('Ada')
+    name = vm.order.customer.name_
+    label = Label(name)
+    entry = TextBox(name)
+    app.show(VStack([label, entry]))
+    backend.update()
+    assert label.el.cget('text') == 'Ada'
+    vm.order = None
+    backend.update()
+    assert name.get_value() == ''
+    assert label.el.cget('text') == ''
+    assert entry.get_value() == ''
+    vm.order = Order('Grace')
+    backend.update()
+    assert label.el.cget('text') == 'Grace'
+    assert entry.get_value() == 'Grace'
+
+
+def test_undo_step_merged_by_time_is_capped():
+    vm = ViewModel()
+    vm.rows = [[0] for _ in range(50)]
+    journal = UndoJournal(vm.rows_, merge_within=60, max_step_size=10)
+    for row in range(25): # all within merge_within
+        vm.rows.set_cell(row, 0, 1)
+    assert [len(step) for step in journal._undo] == [10, 10, 5]
+    with journal.step(): # an explicit step is never split
+        for row in range(25, 50):
+            vm.rows.set_cell(row, 0, 1)
+    assert len(journal._undo[-1]) == 25
+    while journal.undo():
+        pass
+    assert vm.rows == [[0] for _ in range(50)]
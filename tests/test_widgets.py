@@ -0,0 +1,79 @@
+import threading
+import time
+import tkinter as tk
+from tkkit import ViewModel, LogView, PictureBox, RawImage, VStack
+
+
+def log_text(log):
+    return log.el.get('1.0', 'end-1c')
+
+
+def test_log_view_follows_pop_and_insert(app, backend):
+    vm = ViewModel()
+    vm.lines = ['a', 'b', 'c']
+    log = LogView(vm.lines_)
+    app.show(VStack([log]))
+    backend.advance(20)
+    assert log_text(log) == 'a\nb\nc'
+    vm.lines.pop(0)
+    vm.lines.insert(1, 'x')
+    vm.lines.append('d')
+    backend.advance(20)
+    assert log_text(log) == 'b\nx\nc\nd'
+    vm.lines.sort(reverse=True)
+    backend.advance(20)
+    assert log_text(log) == 'x\nd\nc\nb'
+
+
+def test_log_view_stops_flushing_when_destroyed(app, backend):
+    log = LogView()
+    app.show(VStack([log]))
+    backend.advance(20)
+    assert log._flush_id is not None
+    log.el.master.destroy() # without release
+    assert log._flush_id is None
+    backend.reset_ops()
+    backend.advance(100)
+    assert backend.total_ops == 0
+
+
+def test_picture_box_streams_only_frames(app, backend, tmp_path):
+    path = tmp_path / 'dot.ppm'
+    path.write_bytes(b'P6\n1 1\n255\n\x00\x00\x00')
+    vm = ViewModel()
+    vm.image = str(path)
+    box = PictureBox(vm.image_)
+    app.show(VStack([box]))
+    assert box.stream is None
+    vm.image = RawImage(1, 1, b'\xff\x00\x00')
+    assert box.stream is not None
+    for _ in range(200): # the frame is converted on the stream's thread
+        time.sleep(0.005)
+        backend.advance(10)
+        if box.photo is box._frame_photo:
+            break
+    assert str(box.el.cget('image')) == str(box._frame_photo)
+    vm.image = None
+    assert box.stream is None
+    assert str(box.el.cget('image')) == ''
+    photo = tk.PhotoImage(master=app.el)
+    vm.image = photo
+    assert str(box.el.cget('image')) == str(photo)
+
+
+def test_picture_box_takes_values_from_other_threads(app, backend):
+    vm = ViewModel()
+    vm.image = None
+    box = PictureBox(vm.image_)
+    app.show(VStack([box]))
+    writer = threading.Thread(target=lambda: setattr(vm, 'image', RawImage(1, 1, b'\x00\x00\x00')))
+    writer.start()
+    writer.join()
+    assert box.stream is None # started on the tk thread
+    backend.update()
+    assert box.stream is not None
+    writer = threading.Thread(target=lambda: setattr(vm, 'image', None))
+    writer.start()
+    writer.join()
+    backend.update()
+    assert box.stream is None
@@ -1,3 +1,6 @@
 from .tkapp import *
 from .widgets import *
-from .view_model import *
\ No newline at end of file
+from .view_model import *
+from .remote import ViewModelPublisher, ViewModelMirror
+from .undo import UndoJournal
+from .template import Template
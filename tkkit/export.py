@@ -0,0 +1,148 @@
+import csv
+import json
+import os
+import threading
+import time
+from typing import Any, Callable, List, Optional, Self
+from .view_model import ViewModelBindable
+
+class TableExport:
+    """
+        Streams the rows of a table to a CSV or JSONL file on a worker thread.
+        usage:
+            job = data_table.export("people.csv", progress=vm.export_progress_)
+            job.cancel() # stop early, the partial file is removed
+    """
+    FORMATS = ('csv', 'jsonl')
+
+    def __init__(
+        self,
+        header: List[str],
+        rows: List[List[Any]],
+        path: str,
+        format: Optional[str] = None,
+        where: Optional[Callable[[List[Any]], bool]] = None,
+        key: Optional[Callable[[List[Any]], Any]] = None,
+        reverse: bool = False,
+        progress: Optional[ViewModelBindable] = None,
+        throughput: Optional[ViewModelBindable] = None,
+        chunk_size: int = 1000,
+        buffer_size: int = 1 << 16,
+        report_interval: float = 0.1,
+        on_done: Optional[Callable[[Self], None]] = None,
+    ):
+        if format is None:
+            format = os.path.splitext(path)[1].lstrip('.').lower()
+        if format not in self.FORMATS:
+            raise ValueError(f'unsupported export format "{format}", use one of {self.FORMATS}')
+        self.header = list(header) if header is not None else []
+        self.rows = rows
+        self.path = path
+        self.format = format
+        self.where = where
+        self.key = key
+        self.reverse = reverse
+        self.order = None # row indices in view order, None for the natural order
+        self.progress = progress
+        self.throughput = throughput
+        self.chunk_size = chunk_size
+        self.buffer_size = buffer_size
+        self.report_interval = report_interval
+        self.on_done = on_done
+        self.total = len(rows)
+        self.rows_written = 0
+        self.error = None
+        self._cancelled = threading.Event()
+        self._done = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    @property
+    def done(self) -> bool:
+        return self._done.is_set()
+
+    def start(self) -> Self:
+        self._thread.start()
+        return self
+
+    def cancel(self) -> None:
+        self._cancelled.set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        return self._done.wait(timeout)
+
+    def _build_order(self):
+        # only row indices are kept for a filtered or sorted view, never copies of the rows
+        if self.where is None and self.key is None and not self.reverse:
+            return None
+        order = [i for i in range(self.total) if self.where is None or self.where(self.rows[i])]
+        if self.key is not None:
+            order.sort(key=lambda i: self.key(self.rows[i]), reverse=self.reverse)
+        elif self.reverse:
+            order.reverse()
+        return order
+
+    def _iter_rows(self):
+        # index the live list instead of copying it, so memory stays flat for any table size
+        indices = self.order if self.order is not None else range(self.total)
+        for index in indices:
+            try:
+                yield self.rows[index]
+            except IndexError: # rows were removed while exporting
+                return
+
+    def _write_chunk(self, out, writer, chunk):
+        if writer is not None:
+            writer.writerows(chunk)
+        else:
+            out.write(''.join(json.dumps(dict(zip(self.header, row)), ensure_ascii=False, default=str) + '\n'
+                              for row in chunk))
+
+    def _report(self, started_at):
+        if isinstance(self.progress, ViewModelBindable):
+            self.progress.set_value(100 * self.rows_written / self.total if self.total else 100)
+        if isinstance(self.throughput, ViewModelBindable):
+            elapsed = time.perf_counter() - started_at
+            self.throughput.set_value(int(self.rows_written / elapsed) if elapsed > 0 else 0)
+
+    def _run(self):
+        started_at = time.perf_counter()
+        last_report = started_at
+        try:
+            self.order = self._build_order()
+            if self.order is not None:
+                self.total = len(self.order)
+            with open(self.path, 'w', newline='', encoding='utf-8', buffering=self.buffer_size) as out:
+                writer = None
+                if self.format == 'csv':
+                    writer = csv.writer(out)
+                    writer.writerow(self.header)
+                chunk = []
+                for row in self._iter_rows():
+                    if self._cancelled.is_set():
+                        break
+                    chunk.append(row)
+                    if len(chunk) >= self.chunk_size:
+                        self._write_chunk(out, writer, chunk)
+                        self.rows_written += len(chunk)
+                        chunk = []
+                        now = time.perf_counter()
+                        if now - last_report >= self.report_interval:
+                            last_report = now
+                            self._report(started_at)
+                if chunk and not self._cancelled.is_set():
+                    self._write_chunk(out, writer, chunk)
+                    self.rows_written += len(chunk)
+            if self._cancelled.is_set():
+                os.remove(self.path)
+            else:
+                self._report(started_at)
+        except Exception as e:
+            self.error = e
+        finally:
+            self._done.set()
+            if self.on_done is not None:
+                self.on_done(self)
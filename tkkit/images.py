@@ -0,0 +1,279 @@
+import hashlib
+import math
+import os
+import queue
+import threading
+import time
+import tkinter as tk
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from PIL import Image
+except ImportError: # without Pillow, files are read off-thread and decoded by tk (png, gif, ppm)
+    Image = None
+
+class RawImage:
+    """
+        8-bit pixels without any container format, mode is "RGB" (3 bytes per pixel) or "L" (grayscale).
+        numpy arrays of shape (height, width), (height, width, 3) or (height, width, 4) can be used directly instead.
+    """
+    __slots__ = ('width', 'height', 'data', 'mode')
+
+    def __init__(self, width:int, height:int, data:bytes, mode='RGB'):
+        self.width = width
+        self.height = height
+        self.data = data
+        self.mode = mode
+
+def is_raw_frame(value) -> bool:
+    return isinstance(value, RawImage) or (hasattr(value, 'shape') and hasattr(value, 'tobytes'))
+
+def to_pnm(frame) -> bytes:
+    """Encode a RawImage or numpy array as binary PPM (color) or PGM (grayscale), which tk decodes natively"""
+    if isinstance(frame, RawImage):
+        magic = b'P6' if frame.mode == 'RGB' else b'P5'
+        return b'%s\n%d %d\n255\n' % (magic, frame.width, frame.height) + bytes(frame.data)
+    shape = frame.shape
+    if len(shape) == 3:
+        frame = frame[:, :, :3] # drop alpha
+    if frame.dtype.kind != 'u' or frame.dtype.itemsize != 1:
+        frame = frame.clip(0, 255).astype('uint8')
+    magic = b'P6' if len(shape) == 3 else b'P5'
+    return b'%s\n%d %d\n255\n' % (magic, shape[1], shape[0]) + frame.tobytes()
+
+class FrameStream:
+    """
+        Converts raw frames to PNM on a worker thread. Only the newest frame is kept:
+        frames that arrive while one is converting, or that are not shown before the next one is ready, are dropped.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._latest = None # (frame, arrival time)
+        self._ready = None # (pnm bytes, arrival time)
+        self._closed = False
+        self.received = 0
+        self.shown = 0
+        self.dropped = 0
+        self.conversion_time = 0.0 # moving average in seconds
+        self.latency = 0.0 # moving average from arrival to display, in seconds
+        self._first_shown_at = None
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def submit(self, frame):
+        """Queue a frame for conversion, can be called from any thread"""
+        with self._lock:
+            if self._latest is not None:
+                self.dropped += 1
+            self._latest = (frame, time.perf_counter())
+            self.received += 1
+        self._wake.set()
+
+    def take(self):
+        """Returns the newest converted frame as PNM bytes, or None when nothing new is ready"""
+        with self._lock:
+            ready = self._ready
+            self._ready = None
+        if ready is None:
+            return None
+        now = time.perf_counter()
+        self.latency = self.latency * 0.9 + (now - ready[1]) * 0.1 if self.shown else now - ready[1]
+        if self._first_shown_at is None:
+            self._first_shown_at = now
+        self.shown += 1
+        return ready[0]
+
+    def close(self):
+        self._closed = True
+        self._wake.set()
+
+    def stats(self):
+        elapsed = time.perf_counter() - self._first_shown_at if self._first_shown_at is not None else 0
+        return {
+            'received': self.received,
+            'shown': self.shown,
+            'dropped': self.dropped,
+            'fps': (self.shown - 1) / elapsed if elapsed > 0 else 0.0,
+            'conversion_ms': self.conversion_time * 1000,
+            'latency_ms': self.latency * 1000,
+        }
+
+    def _run(self):
+        while True:
+            self._wake.wait()
+            self._wake.clear()
+            if self._closed:
+                return
+            with self._lock:
+                latest = self._latest
+                self._latest = None
+            if latest is None:
+                continue
+            started_at = time.perf_counter()
+            data = to_pnm(latest[0])
+            elapsed = time.perf_counter() - started_at
+            self.conversion_time = self.conversion_time * 0.9 + elapsed * 0.1 if self.conversion_time else elapsed
+            with self._lock:
+                if self._ready is not None:
+                    self.dropped += 1
+                self._ready = (data, latest[1])
+
+class ImageCache:
+    """LRU cache of decoded PhotoImages, bounded by their pixel memory (4 bytes per pixel)"""
+    def __init__(self, max_bytes=64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._images = OrderedDict() # key -> PhotoImage
+
+    def get(self, key):
+        photo = self._images.get(key)
+        if photo is None:
+            self.misses += 1
+            return None
+        self._images.move_to_end(key)
+        self.hits += 1
+        return photo
+
+    def put(self, key, photo):
+        if key in self._images:
+            self.size -= self._cost(self._images.pop(key))
+        self._images[key] = photo
+        self.size += self._cost(photo)
+        # widgets showing an evicted image keep their own reference to it
+        while self.size > self.max_bytes and len(self._images) > 1:
+            _, evicted = self._images.popitem(last=False)
+            self.size -= self._cost(evicted)
+
+    @staticmethod
+    def _cost(photo):
+        return photo.width() * photo.height() * 4
+
+class ImageLoader:
+    """
+        Loads image files for PictureBox: decoding and scaling run on a worker pool, decoded images are
+        shared across widgets through an ImageCache, and with thumbnail_dir the scaled images are also
+        kept on disk, so later runs skip decoding altogether.
+        usage:
+            ImageLoader.set_default(ImageLoader(thumbnail_dir="~/.cache/my_app/thumbnails"))
+            PictureBox("photos/cat.png", size=(128, 128))
+    """
+    _default = None
+
+    def __init__(self, cache:ImageCache=None, workers=4, thumbnail_dir=None, poll_ms=15):
+        self.cache = cache if cache is not None else ImageCache()
+        self.thumbnail_dir = os.path.expanduser(thumbnail_dir) if thumbnail_dir is not None else None
+        self.poll_ms = poll_ms
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='tkkit-image')
+        self._done = queue.SimpleQueue() # (key, kind, payload) decoded by workers, applied on the tk thread
+        self._pending = {} # key -> [callback]
+        self._master = None
+        self._polling = False
+        if self.thumbnail_dir is not None:
+            os.makedirs(self.thumbnail_dir, exist_ok=True)
+
+    @classmethod
+    def default(cls):
+        if cls._default is None:
+            cls._default = cls()
+        return cls._default
+
+    @classmethod
+    def set_default(cls, loader):
+        cls._default = loader
+
+    def load(self, master, path, size=None, callback=None):
+        """
+        Call callback(photo) on the tk thread once the image is decoded and scaled to fit size (width, height).
+        Returns the photo right away when it is cached, None otherwise."""
+        key = (os.path.abspath(path), tuple(size) if size is not None else None)
+        photo = self.cache.get(key)
+        if photo is not None:
+            if callback is not None:
+                callback(photo)
+            return photo
+        callbacks = self._pending.get(key)
+        if callbacks is None:
+            self._pending[key] = [callback] if callback is not None else []
+            self._executor.submit(self._decode, key)
+        elif callback is not None:
+            callbacks.append(callback)
+        self._master = master.winfo_toplevel() # outlives the requesting widget
+        if not self._polling:
+            self._polling = True
+            self._master.after(self.poll_ms, self._poll)
+        return None
+
+    def _thumbnail_path(self, key):
+        path, size = key
+        stamp = f'{path}|{os.path.getmtime(path)}|{size}'
+        return os.path.join(self.thumbnail_dir, hashlib.sha1(stamp.encode('utf-8')).hexdigest() + '.ppm')
+
+    def _decode(self, key):
+        try:
+            path, size = key
+            thumbnail = self._thumbnail_path(key) if self.thumbnail_dir is not None else None
+            if thumbnail is not None and os.path.exists(thumbnail):
+                with open(thumbnail, 'rb') as f:
+                    self._done.put((key, 'data', f.read()))
+                return
+            if Image is None:
+                with open(path, 'rb') as f: # tk decodes the file on its own thread, only the read happens here
+                    self._done.put((key, 'file', f.read()))
+                return
+            with Image.open(path) as image:
+                image = image.convert('RGB')
+                if size is not None:
+                    image.thumbnail(size)
+                data = b'P6\n%d %d\n255\n' % image.size + image.tobytes()
+            if thumbnail is not None:
+                self._write_thumbnail(thumbnail, data)
+            self._done.put((key, 'data', data))
+        except Exception as e:
+            self._done.put((key, 'error', e))
+
+    @staticmethod
+    def _write_thumbnail(thumbnail, data):
+        partial = thumbnail + '.partial'
+        with open(partial, 'wb') as f:
+            f.write(data)
+        os.replace(partial, thumbnail)
+
+    def _poll(self):
+        while True:
+            try:
+                key, kind, payload = self._done.get_nowait()
+            except queue.Empty:
+                break
+            callbacks = self._pending.pop(key, [])
+            if kind == 'error':
+                continue
+            try:
+                photo = tk.PhotoImage(master=self._master, data=payload)
+            except tk.TclError: # a format tk can't decode without Pillow
+                continue
+            if kind == 'file' and key[1] is not None:
+                factor = math.ceil(max(photo.width() / key[1][0], photo.height() / key[1][1]))
+                if factor > 1:
+                    photo = photo.subsample(factor)
+                if self.thumbnail_dir is not None:
+                    photo.write(self._thumbnail_path(key), format='ppm')
+            self.cache.put(key, photo)
+            for callback in callbacks:
+                callback(photo)
+        if self._pending:
+            self._master.after(self.poll_ms, self._poll)
+        else:
+            self._polling = False
+
+    def placeholder(self, master, size):
+        """A blank image of the requested size, so layouts don't jump when the real image arrives"""
+        key = ('placeholder', tuple(size))
+        photo = self.cache.get(key)
+        if photo is None:
+            photo = tk.PhotoImage(master=master, width=size[0], height=size[1])
+            self.cache.put(key, photo)
+        return photo
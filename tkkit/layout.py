@@ -0,0 +1,140 @@
+import copy
+import math
+from fractions import Fraction
+from .widgets import *
+
+COLUMN_TYPES = (Column, VStack, Window)
+ROW_TYPES = (Row, HStack)
+
+class LayoutReport:
+    """Widget and frame counts of a tree before and after compile_layout, build_time is filled by TKApp.show"""
+    def __init__(self, widgets_before, frames_before, widgets_after, frames_after, merged):
+        self.widgets_before = widgets_before
+        self.frames_before = frames_before
+        self.widgets_after = widgets_after
+        self.frames_after = frames_after
+        self.merged = merged
+        self.build_time = None
+
+    @property
+    def widgets_saved(self):
+        return self.widgets_before - self.widgets_after
+
+    def __repr__(self):
+        build_time = '' if self.build_time is None else f', build {self.build_time * 1000:.1f}ms'
+        return (f'<LayoutReport widgets {self.widgets_before} -> {self.widgets_after}, '
+                f'frames {self.frames_before} -> {self.frames_after}, {self.merged} stacks merged{build_time}>')
+
+def count_widgets(widget) -> tuple[int, int]:
+    """
+    Returns (tk widgets, frames) that building the widget tree will create."""
+    if isinstance(widget, WrapperWidget): # wrappers are inlined into their container
+        counts = [count_widgets(child) for child in widget.children]
+        return sum(c[0] for c in counts), sum(c[1] for c in counts)
+    if isinstance(widget, Container):
+        counts = [count_widgets(child) for child in widget.children]
+        return 1 + sum(c[0] for c in counts), 1 + sum(c[1] for c in counts)
+    if isinstance(widget, GroupBox): # LabelFrame and its inner Column
+        widgets, frames = count_widgets(Column(widget.children))
+        return widgets + 1, frames + 1
+    if isinstance(widget, TabControl):
+        counts = [count_widgets(Column(children)) for children in widget.tabs.values()]
+        return 1 + sum(c[0] for c in counts), sum(c[1] for c in counts)
+    if isinstance(widget, FilePicker): # a Row with a Button and a Label
+        return 3, 1
+    return 1, 0
+
+def _direction(widget):
+    if type(widget) in COLUMN_TYPES:
+        return 'column'
+    if type(widget) in ROW_TYPES:
+        return 'row'
+    return None
+
+def _real_weights(container):
+    children = container.get_real_children()
+    if container.weights is not None:
+        return list(container.weights)
+    return [child.expand for child in children]
+
+def _can_merge(parent, child, inner_weights):
+    """
+    A nested stack can only be dissolved into its parent when the merged grid looks the same:
+    it has no frame styling, no name, padding or gap, and its children get the same space."""
+    direction = _direction(child)
+    if direction is None or direction != _direction(parent):
+        return False
+    if child.styles or child.name is not None or tuple(child.padding) != (0, 0) or child.gap != 0 or parent.gap != 0:
+        return False
+    # children inherit align from a non-filling parent, but never from the filling child stack
+    if child.align != 'fill' or parent.align != 'fill' or child.vertical_align not in (None, 'fill'):
+        return False
+    if child.expand != 0:
+        # the child frame must stretch along the main axis, and something inside must take the space
+        if direction == 'column' and child.vertical_align != 'fill':
+            return False
+        if sum(inner_weights) == 0:
+            return False
+    if direction == 'row' and child.vertical_align != 'fill':
+        # a row frame keeps its natural height, so its children must not stick to the top or bottom
+        for grandchild in child.get_real_children():
+            if get_sticky(None, grandchild.vertical_align) is not None:
+                return False
+    return True
+
+def _compile(widget, stats):
+    if getattr(type(widget), '_template', None) is not None: # built by its template's compiled plan, as it is
+        return widget
+    if isinstance(widget, Container):
+        return _compile_container(widget, stats)
+    if isinstance(widget, GroupBox):
+        compiled = copy.copy(widget)
+        compiled.children = [_compile(child, stats) for child in widget.children]
+        return compiled
+    if isinstance(widget, TabControl):
+        compiled = copy.copy(widget)
+        compiled.tabs = {label: [_compile(child, stats) for child in children] for label, children in widget.tabs.items()}
+        return compiled
+    return widget
+
+def _compile_container(container, stats):
+    children = []
+    weights = []
+    for child in container.children:
+        if isinstance(child, WrapperWidget):
+            # ShowIf and RadioGroup keep references to their own children, so they are left as they are
+            children.append(child)
+            weights.extend(Fraction(grandchild.expand) for grandchild in child.children)
+            continue
+        child = _compile(child, stats)
+        inner_weights = _real_weights(child) if isinstance(child, Container) else None
+        if inner_weights is not None and _can_merge(container, child, inner_weights):
+            total = sum(inner_weights)
+            children.extend(child.children)
+            if child.expand == 0:
+                weights.extend(Fraction(0) for _ in inner_weights)
+            else:
+                weights.extend(Fraction(child.expand * weight, total) for weight in inner_weights)
+            stats['merged'] += 1
+        else:
+            children.append(child)
+            weights.append(Fraction(child.expand))
+    compiled = copy.copy(container)
+    compiled.children = children
+    # tk grid weights are integers, scale all of them by the common denominator
+    scale = math.lcm(*(weight.denominator for weight in weights)) if weights else 1
+    compiled.weights = [int(weight * scale) for weight in weights]
+    return compiled
+
+def compile_layout(widget) -> tuple[Widget, LayoutReport]:
+    """
+    Returns a copy of the widget tree where VStacks in a VStack and HStacks in an HStack without styling are
+    merged into the grid of their parent, and a LayoutReport of the widgets and frames saved. A stack in a stack
+    of the other direction keeps its frame, merging it would couple the column widths of unrelated rows.
+    Leaf widgets are shared with the original tree, so each tree should only be built once.
+    """
+    stats = {'merged': 0}
+    widgets_before, frames_before = count_widgets(widget)
+    compiled = _compile(widget, stats)
+    widgets_after, frames_after = count_widgets(compiled)
+    return compiled, LayoutReport(widgets_before, frames_before, widgets_after, frames_after, stats['merged'])
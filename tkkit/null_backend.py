@@ -0,0 +1,1232 @@
+import base64
+import heapq
+import math
+import re
+import struct
+import tkinter
+from collections import Counter, deque
+from tkinter import TclError
+
+_BIND_COMMAND = re.compile(r'\[(\S+) %#')
+_TEXT_MODIFIER = re.compile(r'([+-])\s*(\d+)\s*(chars|char|c|lines|line|l)\b')
+# positions in tkinter's substitution format (%# serial, %T type, %W widget), the other fields are left unknown
+_SUBST_FIELDS = 19
+_SUBST_SERIAL = 0
+_SUBST_TYPE = 15
+_SUBST_WIDGET = 14
+
+def split_tcl_list(text:str) -> tuple:
+    """Split a Tcl list as tkinter formats them: braced, quoted or backslash-escaped words"""
+    items = []
+    i, n = 0, len(text)
+    while i < n:
+        while i < n and text[i].isspace():
+            i += 1
+        if i >= n:
+            break
+        if text[i] == '{':
+            depth, j = 1, i + 1
+            while j < n and depth:
+                if text[j] == '\\':
+                    j += 2
+                    continue
+                if text[j] == '{':
+                    depth += 1
+                elif text[j] == '}':
+                    depth -= 1
+                j += 1
+            items.append(text[i + 1:j - 1])
+            i = j
+            continue
+        quoted = text[i] == '"'
+        j = i + 1 if quoted else i
+        word = []
+        while j < n and (text[j] != '"' if quoted else not text[j].isspace()):
+            if text[j] == '\\' and j + 1 < n:
+                word.append({'n': '\n', 't': '\t'}.get(text[j + 1], text[j + 1]))
+                j += 2
+            else:
+                word.append(text[j])
+                j += 1
+        items.append(''.join(word))
+        i = j + 1 if quoted else j
+    return tuple(items)
+
+def _widget_class(command):
+    name = command.split('::')[-1]
+    if command.startswith('ttk::') and name != 'treeview':
+        return 'T' + name.capitalize()
+    return name.capitalize()
+
+def _pairs(args):
+    return {str(args[i])[1:]: args[i + 1] for i in range(0, len(args) - 1, 2)}
+
+def _image_size(data):
+    """(width, height) read from the header of ppm/pgm, png or gif data"""
+    if isinstance(data, str):
+        try:
+            data = base64.b64decode(data, validate=True)
+        except ValueError:
+            data = data.encode('latin-1', 'replace')
+    data = bytes(data)
+    if data[:2] in (b'P5', b'P6'):
+        fields = re.sub(rb'#[^\n]*', b'', data[2:64]).split()
+        return int(fields[0]), int(fields[1])
+    if data[:8] == b'\x89PNG\r\n\x1a\n':
+        return struct.unpack('>II', data[16:24])
+    if data[:4] == b'GIF8':
+        return struct.unpack('<HH', data[6:10])
+    raise TclError("couldn't recognize image data")
+
+class _Item:
+    __slots__ = ('parent', 'children', 'options')
+
+    def __init__(self, parent, options):
+        self.parent = parent
+        self.children = []
+        self.options = options
+
+class NullWidget:
+    """In-memory state of one widget: its options, geometry and the contents of trees, texts, lists and canvases"""
+    def __init__(self, path, cls, options):
+        self.path = path
+        self.cls = cls
+        self.options = options
+        self.manager = ''
+        self.geometry = {} # grid or pack options, kept by grid remove
+        self.rows = {} # grid row/column index -> options of rowconfigure/columnconfigure
+        self.columns = {}
+        self.propagate = True # grid propagate
+        self.pack_propagate = True
+        self.children = {} # child path -> NullWidget
+        self.items = {'': _Item(None, {})} # Treeview items by iid, '' is the root
+        self.selection = []
+        self.focus = ''
+        self.text = '' # Text content without its final newline, or Entry text without a variable
+        self.canvas_items = {} # id -> [type, coords, options]
+        self.headings = {} # Treeview column -> heading options
+        self.tree_columns = {} # Treeview column -> column options
+        self.tabs = []
+        self.current_tab = ''
+        self.list_items = [] # Listbox items without a listvariable
+        self.list_selection = set()
+
+    @property
+    def master(self):
+        return self.path.rpartition('.')[0] or '.'
+
+    def __repr__(self):
+        return f'<NullWidget {self.cls} {self.path}>'
+
+class NullInterpreter:
+    """
+        Stands in for the Tcl interpreter of a Tk root (root.tk): tkinter's widget classes call it as usual and
+        it keeps widgets, variables, bindings and timers in memory, counting each command in backend.ops.
+    """
+    def __init__(self, backend):
+        self.backend = backend
+        self.ops = backend.ops
+        self.widgets = {'.': NullWidget('.', 'Tk', {})}
+        self.commands = {} # python callbacks registered by tkinter
+        self.variables = {}
+        self.traces = {} # variable name -> [(operations, command name)]
+        self.bindings = {} # widget path or tag -> {sequence: script}
+        self.images = {} # image name -> {'width', 'height'}
+        self.now = 0 # virtual time in ms
+        self.quit_requested = False
+        self.wm = {'title': 'tk', 'state': 'normal'}
+        self.focus = ''
+        self._timers = [] # heap of (due, sequence, id)
+        self._scripts = {} # after id -> (command name, 'timer' or 'idle')
+        self._idle = deque() # after ids
+        self._events = deque() # (path, sequence) queued virtual events
+        self._sequence = 0
+        self._tracing = set() # variables whose traces are running, tcl doesn't re-enter them
+
+    # the methods _tkinter's tkapp objects provide
+
+    def call(self, *args):
+        if len(args) == 1 and isinstance(args[0], tuple):
+            args = args[0]
+        words = []
+        for arg in args:
+            if arg is None: # _tkinter ends the command at the first None
+                break
+            words.append(arg if isinstance(arg, (str, int, float, bytes, tuple, list)) else str(arg))
+        return self._dispatch(words)
+
+    def createcommand(self, name, func):
+        self.commands[name] = func
+
+    def deletecommand(self, name):
+        if self.commands.pop(name, None) is None:
+            raise TclError("can't delete Tcl command")
+
+    def splitlist(self, value):
+        if isinstance(value, (tuple, list)):
+            return tuple(value)
+        if value is None or value == '':
+            return ()
+        if isinstance(value, str):
+            return split_tcl_list(value)
+        return (value,)
+
+    split = splitlist
+
+    def getint(self, value):
+        if isinstance(value, bool) or isinstance(value, int):
+            return int(value)
+        try:
+            return int(str(value).strip(), 0)
+        except ValueError:
+            raise TclError(f'expected integer but got "{value}"') from None
+
+    def getdouble(self, value):
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            raise TclError(f'expected floating-point number but got "{value}"') from None
+
+    def getboolean(self, value):
+        if isinstance(value, (bool, int, float)):
+            return bool(value)
+        text = str(value).strip().lower()
+        if text in ('1', 'true', 'yes', 'on'):
+            return True
+        if text in ('0', 'false', 'no', 'off'):
+            return False
+        try:
+            return float(text) != 0
+        except ValueError:
+            raise TclError(f'expected boolean value but got "{value}"') from None
+
+    def globalsetvar(self, name, value):
+        self.ops['setvar'] += 1
+        self.variables[name] = value
+        self._fire_traces(name, 'write')
+        return value
+
+    setvar = globalsetvar
+
+    def globalgetvar(self, name):
+        self.ops['getvar'] += 1
+        if name not in self.variables:
+            raise TclError(f'can\'t read "{name}": no such variable')
+        self._fire_traces(name, 'read')
+        return self.variables[name]
+
+    getvar = globalgetvar
+
+    def globalunsetvar(self, name):
+        self.ops['unsetvar'] += 1
+        if self.variables.pop(name, None) is not None:
+            self._fire_traces(name, 'unset')
+        self.traces.pop(name, None)
+
+    unsetvar = globalunsetvar
+
+    def wantobjects(self, *args):
+        return 1
+
+    def mainloop(self, n=0):
+        """No events come in without a display: run timers in virtual time until quit() or nothing is scheduled"""
+        self.quit_requested = False
+        while not self.quit_requested and (self._timers or self._idle or self._events):
+            due = self._timers[0][0] if self._timers else self.now
+            self.advance(max(0, due - self.now))
+
+    def quit(self):
+        self.quit_requested = True
+
+    def dooneevent(self, flags=0):
+        self.update()
+        return 0
+
+    def eval(self, script):
+        return self._dispatch(list(split_tcl_list(script)))
+
+    def interpaddr(self):
+        return id(self)
+
+    # event processing
+
+    def _run(self, name, *args):
+        command = self.commands.get(name)
+        if command is None:
+            raise TclError(f'invalid command name "{name}"')
+        return command(*args)
+
+    def _fire_traces(self, name, operation):
+        traces = self.traces.get(name)
+        if not traces or name in self._tracing:
+            return
+        self._tracing.add(name)
+        try:
+            for operations, command in list(traces):
+                if operation in operations and command in self.commands:
+                    self._run(command, name, '', operation)
+        finally:
+            self._tracing.discard(name)
+
+    def _dispatch_event(self, path, sequence):
+        script = self.bindings.get(path, {}).get(sequence)
+        if not script:
+            return
+        self._sequence += 1
+        fields = ['??'] * _SUBST_FIELDS
+        fields[_SUBST_SERIAL] = self._sequence
+        fields[_SUBST_TYPE] = '35' if sequence.startswith('<<') else '??' # VirtualEvent
+        fields[_SUBST_WIDGET] = path
+        for name in _BIND_COMMAND.findall(script):
+            if name in self.commands and self._run(name, *fields) == 'break':
+                break
+
+    def _queue_event(self, path, sequence):
+        self._events.append((path, sequence))
+
+    def update(self, idle_only=False):
+        """Deliver queued virtual events, idle callbacks and timers that are due, like tk's update"""
+        if not idle_only:
+            while self._events:
+                self._dispatch_event(*self._events.popleft())
+        for _ in range(len(self._idle)):
+            after_id = self._idle.popleft()
+            script = self._scripts.pop(after_id, None)
+            if script is not None and script[0] in self.commands:
+                self._run(script[0])
+        if idle_only:
+            return
+        last = self._sequence # timers scheduled by the callbacks below wait for the next update
+        while self._timers and self._timers[0][0] <= self.now and self._timers[0][1] <= last:
+            _, _, after_id = heapq.heappop(self._timers)
+            script = self._scripts.pop(after_id, None)
+            if script is not None and script[0] in self.commands:
+                self._run(script[0])
+
+    def advance(self, ms):
+        """Move virtual time ms forward, running the events and timers that become due in order"""
+        until = self.now + ms
+        self.update()
+        while self._timers and self._timers[0][0] <= until:
+            self.now = max(self.now, self._timers[0][0])
+            self.update()
+        self.now = until
+        self.update()
+
+    # commands
+
+    def _dispatch(self, words):
+        head = words[0]
+        widget = self.widgets.get(head) if isinstance(head, str) else None
+        if widget is not None:
+            operation = words[1] if len(words) > 1 else ''
+            self.ops[f'{widget.cls} {operation}'] += 1
+            return self._widget_command(widget, operation, words[2:])
+        if head in self.images:
+            self.ops[f'photo {words[1]}'] += 1
+            return self._photo_command(head, words[1], words[2:])
+        handler = _COMMANDS.get(head)
+        if handler is not None:
+            sub = words[1] if len(words) > 1 and isinstance(words[1], str) and words[1].isalpha() else None
+            self.ops[f'{head} {sub}' if sub else head] += 1
+            return handler(self, words[1:])
+        if head in self.commands:
+            self.ops['command'] += 1
+            return self._run(head, *words[1:])
+        if len(words) > 1 and isinstance(words[1], str) and words[1].startswith('.') and not head.startswith('.'):
+            cls = _widget_class(head)
+            self.ops[f'{cls} create'] += 1
+            return self._create(cls, words[1], words[2:])
+        if head.startswith('.'):
+            raise TclError(f'invalid command name "{head}"')
+        self.ops[head] += 1 # styles, fonts, options: accepted and ignored
+        return ''
+
+    def _create(self, cls, path, args):
+        options = _pairs(args)
+        options.pop('class', None)
+        self.widgets[path] = widget = NullWidget(path, cls, options)
+        master = self.widgets.get(widget.master)
+        if master is not None:
+            master.children[path] = widget
+        if cls == 'Text':
+            widget.options.setdefault('state', 'normal')
+        return path
+
+    def _cmd_destroy(self, args):
+        for path in args:
+            if path == '.':
+                continue
+            widget = self.widgets.get(path)
+            if widget is None:
+                continue
+            master = self.widgets.get(widget.master)
+            if master is not None:
+                master.children.pop(path, None)
+            destroyed = []
+            stack = [widget]
+            while stack:
+                widget = stack.pop()
+                destroyed.append(widget.path)
+                stack.extend(widget.children.values())
+            for path in destroyed: # like tk, <Destroy> handlers still see the widget
+                self._dispatch_event(path, '<Destroy>')
+            for path in destroyed:
+                self.widgets.pop(path, None)
+                self.bindings.pop(path, None)
+        return ''
+
+    def _cmd_after(self, args):
+        first = args[0]
+        if first == 'cancel':
+            after_id = args[1]
+            if self._scripts.pop(after_id, None) is None: # cancelled by script
+                for key, script in list(self._scripts.items()):
+                    if script[0] == after_id:
+                        del self._scripts[key]
+            return ''
+        if first == 'info':
+            if len(args) == 1:
+                return tuple(self._scripts)
+            script = self._scripts.get(args[1])
+            if script is None:
+                raise TclError(f'event "{args[1]}" doesn\'t exist')
+            return script
+        self._sequence += 1
+        after_id = f'after#{self._sequence}'
+        if first == 'idle':
+            self._scripts[after_id] = (args[1], 'idle')
+            self._idle.append(after_id)
+            return after_id
+        if len(args) == 1: # a plain sleep
+            self.advance(self.getint(first))
+            return ''
+        self._scripts[after_id] = (args[1], 'timer')
+        heapq.heappush(self._timers, (self.now + max(0, self.getint(first)), self._sequence, after_id))
+        return after_id
+
+    def _cmd_update(self, args):
+        self.update(idle_only=bool(args) and args[0] == 'idletasks')
+        return ''
+
+    def _cmd_trace(self, args):
+        action, _, name = args[0], args[1], args[2]
+        if action == 'add':
+            operations = self.splitlist(args[3])
+            command = self.splitlist(args[4])[0]
+            self.traces.setdefault(name, []).insert(0, (operations, command))
+        elif action == 'remove':
+            operations = self.splitlist(args[3])
+            traces = self.traces.get(name, [])
+            for trace in traces:
+                if trace[1] == args[4] and set(trace[0]) == set(operations):
+                    traces.remove(trace)
+                    break
+        elif action == 'info':
+            return tuple((operations, (command,)) for operations, command in self.traces.get(name, []))
+        return ''
+
+    def _cmd_info(self, args):
+        if args[0] == 'exists':
+            return int(args[1] in self.variables)
+        if args[0] == 'patchlevel':
+            return tkinter.TclVersion
+        return ''
+
+    def _cmd_set(self, args):
+        if len(args) > 1:
+            return self.globalsetvar(args[0], args[1])
+        return self.globalgetvar(args[0])
+
+    def _cmd_bind(self, args):
+        target = args[0]
+        bindings = self.bindings.setdefault(target, {})
+        if len(args) == 1:
+            return tuple(sequence for sequence, script in bindings.items() if script)
+        sequence = args[1]
+        if len(args) == 2:
+            return bindings.get(sequence, '')
+        script = args[2]
+        if not script:
+            bindings.pop(sequence, None)
+        elif script.startswith('+'):
+            bindings[sequence] = bindings.get(sequence, '') + script[1:]
+        else:
+            bindings[sequence] = script
+        return ''
+
+    def _cmd_bindtags(self, args):
+        widget = self._widget(args[0])
+        return (widget.path, widget.cls, '.', 'all')
+
+    def _cmd_event(self, args):
+        if args[0] == 'generate':
+            self._widget(args[1])
+            self._dispatch_event(args[1], args[2])
+        return ''
+
+    def _cmd_focus(self, args):
+        if not args:
+            return self.focus
+        if args[0].startswith('.'):
+            self.focus = args[0]
+        return ''
+
+    def _cmd_wm(self, args):
+        operation = args[0]
+        if operation in ('withdraw', 'iconify'):
+            self.wm['state'] = 'withdrawn' if operation == 'withdraw' else 'iconic'
+        elif operation == 'deiconify':
+            self.wm['state'] = 'normal'
+        elif operation in ('title', 'geometry', 'state'):
+            if len(args) > 2:
+                self.wm[operation] = args[2]
+            else:
+                return self.wm.get(operation, '1x1+0+0')
+        return ''
+
+    def _cmd_winfo(self, args):
+        operation, widget = args[0], self._widget(args[1]) if len(args) > 1 and args[0] != 'exists' else None
+        if operation == 'exists':
+            return int(args[1] in self.widgets)
+        if operation == 'manager':
+            return widget.manager
+        if operation == 'class':
+            return widget.cls
+        if operation == 'toplevel':
+            path = widget.path
+            while path != '.' and self.widgets[path].cls != 'Toplevel':
+                path = self.widgets[path].master
+            return path
+        if operation == 'children':
+            return tuple(widget.children)
+        if operation in ('width', 'reqwidth', 'height', 'reqheight'): # nothing is laid out, sizes are as configured
+            try:
+                return max(1, self.getint(widget.options.get(operation.replace('req', ''), 1)))
+            except TclError:
+                return 1
+        if operation in ('ismapped', 'viewable'):
+            return int(widget.path == '.' or widget.manager != '')
+        if operation == 'id':
+            return id(widget)
+        if operation == 'name':
+            return widget.path.rpartition('.')[2]
+        return 0
+
+    def _cmd_grid(self, args):
+        operation = args[0]
+        if operation.startswith('.'): # grid .w -row 0
+            args = ('configure',) + tuple(args)
+            operation = 'configure'
+        if operation == 'configure':
+            paths = self._leading_paths(args[1:])
+            options = _pairs(args[1 + len(paths):])
+            for path in paths:
+                widget = self._widget(path)
+                if widget.manager != 'grid':
+                    self._forget_geometry(widget)
+                    defaults = {'in': widget.master, 'column': 0, 'row': 0, 'columnspan': 1, 'rowspan': 1,
+                                'ipadx': 0, 'ipady': 0, 'padx': 0, 'pady': 0, 'sticky': ''}
+                    widget.geometry = dict(defaults, **widget.geometry) if widget.geometry.get('in') else defaults
+                widget.geometry.update(options)
+                widget.manager = 'grid'
+            return ''
+        if operation in ('forget', 'remove'):
+            for path in args[1:]:
+                widget = self._widget(path)
+                if widget.manager == 'grid':
+                    widget.manager = ''
+                    if operation == 'forget':
+                        widget.geometry = {}
+            return ''
+        if operation == 'info':
+            widget = self._widget(args[1])
+            if widget.manager != 'grid':
+                return ''
+            return tuple(word for key, value in widget.geometry.items() for word in ('-' + key, value))
+        if operation in ('columnconfigure', 'rowconfigure'):
+            master = self._widget(args[1])
+            table = master.columns if operation == 'columnconfigure' else master.rows
+            indexes = self.splitlist(args[2]) if isinstance(args[2], str) else (args[2],)
+            if len(args) == 3:
+                current = table.get(str(indexes[0]), {})
+                return ('-minsize', current.get('minsize', 0), '-pad', current.get('pad', 0),
+                        '-uniform', current.get('uniform', ''), '-weight', current.get('weight', 0))
+            if len(args) == 4:
+                return table.get(str(indexes[0]), {}).get(args[3][1:], 0)
+            for index in indexes:
+                table.setdefault(str(index), {}).update(_pairs(args[3:]))
+            return ''
+        if operation == 'size':
+            slaves = self._slaves(args[1], 'grid')
+            columns = max([int(w.geometry['column']) + int(w.geometry['columnspan']) for w in slaves] or [0])
+            rows = max([int(w.geometry['row']) + int(w.geometry['rowspan']) for w in slaves] or [0])
+            master = self._widget(args[1])
+            columns = max([columns] + [int(index) + 1 for index in master.columns])
+            rows = max([rows] + [int(index) + 1 for index in master.rows])
+            return (columns, rows)
+        if operation == 'propagate':
+            master = self._widget(args[1])
+            if len(args) == 2:
+                return int(master.propagate)
+            master.propagate = self.getboolean(args[2])
+            return ''
+        if operation == 'slaves':
+            return tuple(w.path for w in self._slaves(args[1], 'grid'))
+        if operation == 'bbox':
+            return (0, 0, 0, 0)
+        return ''
+
+    def _cmd_pack(self, args):
+        operation = args[0]
+        if operation.startswith('.'):
+            args = ('configure',) + tuple(args)
+            operation = 'configure'
+        if operation == 'configure':
+            paths = self._leading_paths(args[1:])
+            for path in paths:
+                widget = self._widget(path)
+                if widget.manager != 'pack':
+                    self._forget_geometry(widget)
+                    widget.geometry = {'in': widget.master}
+                widget.geometry.update(_pairs(args[1 + len(paths):]))
+                widget.manager = 'pack'
+        elif operation == 'forget':
+            for path in args[1:]:
+                widget = self._widget(path)
+                if widget.manager == 'pack':
+                    widget.manager = ''
+                    widget.geometry = {}
+        elif operation == 'info':
+            widget = self._widget(args[1])
+            return tuple(word for key, value in widget.geometry.items() for word in ('-' + key, value))
+        elif operation == 'slaves':
+            return tuple(w.path for w in self._slaves(args[1], 'pack'))
+        elif operation == 'propagate':
+            master = self._widget(args[1])
+            if len(args) == 2:
+                return int(master.pack_propagate)
+            master.pack_propagate = self.getboolean(args[2])
+        return ''
+
+    def _cmd_place(self, args):
+        operation = args[0]
+        if operation == 'configure':
+            widget = self._widget(args[1])
+            self._forget_geometry(widget)
+            widget.geometry = _pairs(args[2:])
+            widget.manager = 'place'
+        elif operation == 'forget':
+            widget = self._widget(args[1])
+            if widget.manager == 'place':
+                widget.manager = ''
+        return ''
+
+    @staticmethod
+    def _leading_paths(args):
+        paths = []
+        for arg in args:
+            if not (isinstance(arg, str) and arg.startswith('.')):
+                break
+            paths.append(arg)
+        return paths
+
+    def _forget_geometry(self, widget):
+        widget.manager = ''
+
+    def _slaves(self, master, manager):
+        return [w for w in self.widgets.values() if w.manager == manager and str(w.geometry.get('in')) == master]
+
+    def _cmd_image(self, args):
+        operation = args[0]
+        if operation == 'create':
+            name, options = args[2], _pairs(args[3:])
+            self.images[name] = self._image_options(options)
+            return name
+        if operation == 'delete':
+            for name in args[1:]:
+                self.images.pop(name, None)
+            return ''
+        if operation in ('width', 'height'):
+            return self._image(args[1])[operation]
+        if operation == 'names':
+            return tuple(self.images)
+        if operation == 'type':
+            self._image(args[1])
+            return 'photo'
+        return ''
+
+    def _image(self, name):
+        image = self.images.get(name)
+        if image is None:
+            raise TclError(f'image "{name}" doesn\'t exist')
+        return image
+
+    def _image_options(self, options, image=None):
+        image = image if image is not None else {'width': 0, 'height': 0}
+        if options.get('data'):
+            image['width'], image['height'] = _image_size(options['data'])
+        elif options.get('file'):
+            with open(options['file'], 'rb') as f:
+                image['width'], image['height'] = _image_size(f.read(64))
+        for key in ('width', 'height'):
+            if options.get(key):
+                image[key] = self.getint(options[key])
+        return image
+
+    def _photo_command(self, name, operation, args):
+        image = self.images[name]
+        if operation in ('configure', 'config'):
+            if len(args) == 1:
+                key = args[0][1:]
+                return (args[0], '', '', '', image.get(key, ''))
+            self._image_options(_pairs(args), image)
+        elif operation == 'cget':
+            return image.get(args[0][1:], '')
+        elif operation == 'copy':
+            source = self._image(args[0])
+            options = args[1:]
+            x, y = 1, 1
+            if '-subsample' in options:
+                x = self.getint(options[options.index('-subsample') + 1])
+                y = self.getint(options[options.index('-subsample') + 2]) if len(options) > options.index('-subsample') + 2 else x
+            if '-zoom' in options:
+                zoom = self.getint(options[options.index('-zoom') + 1])
+                x, y = 1 / zoom, 1 / zoom
+            image['width'] = math.ceil(source['width'] / x)
+            image['height'] = math.ceil(source['height'] / y)
+        elif operation == 'blank':
+            pass
+        return '' # put, write and the rest draw or save nothing here
+
+    # stand-ins for the procs TKApp defines for bulk updates, counted once per call as in tcl
+
+    def _configure_many(self, args):
+        updates = self.splitlist(args[0])
+        for path, options in zip(updates[::2], updates[1::2]):
+            self._widget_command(self._widget(path), 'configure', self.splitlist(options))
+        return ''
+
+    def _set_many(self, args):
+        updates = self.splitlist(args[0])
+        for name, value in zip(updates[::2], updates[1::2]):
+            self.variables[name] = value
+            self._fire_traces(name, 'write')
+        return ''
+
+    def _grid_many(self, args):
+        updates = self.splitlist(args[0])
+        for command, path, options in zip(updates[::3], updates[1::3], updates[2::3]):
+            self._cmd_grid((command, path) + self.splitlist(options))
+        return ''
+
+    def _widget(self, path):
+        widget = self.widgets.get(str(path))
+        if widget is None:
+            raise TclError(f'bad window path name "{path}"')
+        return widget
+
+    def _widget_command(self, widget, operation, args):
+        if operation in ('configure', 'config'):
+            if not args:
+                return tuple(('-' + key, key, key.capitalize(), '', value) for key, value in widget.options.items())
+            if len(args) == 1:
+                key = args[0][1:]
+                return (args[0], key, key.capitalize(), '', widget.options.get(key, ''))
+            widget.options.update(_pairs(args))
+            return ''
+        if operation == 'cget':
+            return widget.options.get(args[0][1:], '')
+        if operation == 'yview':
+            return (0.0, 1.0) if not args else ''
+        handler = _CLASS_COMMANDS.get(widget.cls)
+        if handler is not None:
+            return handler(self, widget, operation, args)
+        return '' # state, xview, tag and the like only change how a widget looks
+
+    # widget classes
+
+    def _button(self, widget, operation, args):
+        if operation != 'invoke' or widget.options.get('state') == 'disabled':
+            return ''
+        variable = widget.options.get('variable')
+        if variable and widget.cls in ('TCheckbutton', 'Checkbutton'):
+            on, off = widget.options.get('onvalue', 1), widget.options.get('offvalue', 0)
+            self.globalsetvar(variable, off if str(self.variables.get(variable)) == str(on) else on)
+        elif variable and widget.cls in ('TRadiobutton', 'Radiobutton'):
+            self.globalsetvar(variable, widget.options.get('value', ''))
+        command = widget.options.get('command')
+        return self._run(command) if command else ''
+
+    def _entry_text(self, widget):
+        variable = widget.options.get('textvariable')
+        if variable:
+            return str(self.variables.get(variable, ''))
+        return widget.text
+
+    def _set_entry_text(self, widget, text):
+        variable = widget.options.get('textvariable')
+        if variable:
+            self.globalsetvar(variable, text)
+        else:
+            widget.text = text
+
+    def _entry_index(self, widget, index):
+        text = self._entry_text(widget)
+        if index in ('end', 'insert'):
+            return len(text)
+        return min(len(text), self.getint(index))
+
+    def _entry(self, widget, operation, args):
+        if operation == 'get':
+            return self._entry_text(widget)
+        if operation == 'set':
+            self._set_entry_text(widget, str(args[0]))
+        elif operation == 'insert':
+            text, index = self._entry_text(widget), self._entry_index(widget, args[0])
+            self._set_entry_text(widget, text[:index] + str(args[1]) + text[index:])
+        elif operation == 'delete':
+            text, first = self._entry_text(widget), self._entry_index(widget, args[0])
+            last = self._entry_index(widget, args[1]) if len(args) > 1 else first + 1
+            self._set_entry_text(widget, text[:first] + text[last:])
+        elif operation == 'current':
+            values = self.splitlist(widget.options.get('values', ''))
+            if not args:
+                text = self._entry_text(widget)
+                return values.index(text) if text in values else -1
+            self._set_entry_text(widget, values[self.getint(args[0])])
+        elif operation == 'invoke': # spinbox arrows
+            command = widget.options.get('command')
+            return self._run(command) if command else ''
+        return ''
+
+    def _scale(self, widget, operation, args):
+        variable = widget.options.get('variable')
+        if operation == 'get':
+            return self.variables.get(variable, 0) if variable else widget.options.get('value', 0)
+        if operation == 'set':
+            if variable:
+                self.globalsetvar(variable, args[0])
+            else:
+                widget.options['value'] = args[0]
+        return ''
+
+    def _treeview(self, widget, operation, args):
+        items = widget.items
+        if operation == 'insert':
+            parent, index, options = str(args[0]), args[1], list(args[2:])
+            iid = None
+            if options[:1] == ['-id']:
+                iid, options = str(options[1]), options[2:]
+            if iid is None:
+                self._sequence += 1
+                iid = f'I{self._sequence:03X}'
+            if iid in items:
+                raise TclError(f'Item {iid} already exists')
+            if parent not in items:
+                raise TclError(f'Item {parent} not found')
+            siblings = items[parent].children
+            position = len(siblings) if index == 'end' else min(self.getint(index), len(siblings))
+            siblings.insert(position, iid)
+            items[iid] = _Item(parent, _pairs(options))
+            return iid
+        if operation in ('delete', 'detach'):
+            removed = set()
+            for iid in self._tree_items(widget, args):
+                if iid in removed:
+                    continue
+                items[items[iid].parent].children.remove(iid)
+                stack = [iid]
+                while stack:
+                    current = stack.pop()
+                    removed.add(current)
+                    stack.extend(items.pop(current).children)
+            if removed & set(widget.selection):
+                widget.selection = [iid for iid in widget.selection if iid not in removed]
+                self._queue_event(widget.path, '<<TreeviewSelect>>')
+            if widget.focus in removed:
+                widget.focus = ''
+            return ''
+        if operation == 'item':
+            item = self._tree_item(widget, args[0])
+            if len(args) == 1:
+                return tuple(word for key in sorted(set(item.options) | {'text', 'values', 'open'})
+                             for word in ('-' + key, self._item_option(item, key)))
+            if len(args) == 2:
+                return self._item_option(item, args[1][1:])
+            item.options.update(_pairs(args[1:]))
+            return ''
+        if operation == 'children':
+            item = self._tree_item(widget, args[0])
+            if len(args) == 1:
+                return tuple(item.children)
+            for child in list(item.children):
+                items[child].parent = None
+            item.children = list(self.splitlist(args[1]))
+            for child in item.children:
+                items[child].parent = str(args[0])
+            return ''
+        if operation == 'exists':
+            return int(str(args[0]) in items)
+        if operation == 'parent':
+            return self._tree_item(widget, args[0]).parent or ''
+        if operation == 'index':
+            item = self._tree_item(widget, args[0])
+            return items[item.parent].children.index(str(args[0]))
+        if operation == 'move':
+            iid, parent = str(args[0]), str(args[1])
+            item = self._tree_item(widget, iid)
+            items[item.parent].children.remove(iid)
+            siblings = self._tree_item(widget, parent).children
+            siblings.insert(len(siblings) if args[2] == 'end' else self.getint(args[2]), iid)
+            item.parent = parent
+            return ''
+        if operation in ('next', 'prev'):
+            item = self._tree_item(widget, args[0])
+            siblings = items[item.parent].children
+            position = siblings.index(str(args[0])) + (1 if operation == 'next' else -1)
+            return siblings[position] if 0 <= position < len(siblings) else ''
+        if operation == 'selection':
+            if not args:
+                return tuple(widget.selection)
+            chosen = self._tree_items(widget, args[1:])
+            if args[0] == 'set':
+                selection = list(dict.fromkeys(chosen))
+            elif args[0] == 'add':
+                selection = list(dict.fromkeys(widget.selection + chosen))
+            elif args[0] == 'remove':
+                selection = [iid for iid in widget.selection if iid not in chosen]
+            else: # toggle
+                selection = [iid for iid in widget.selection if iid not in chosen]
+                selection += [iid for iid in chosen if iid not in widget.selection]
+            if selection != widget.selection:
+                widget.selection = selection
+                self._queue_event(widget.path, '<<TreeviewSelect>>') # tk delivers it once idle
+            return ''
+        if operation == 'focus':
+            if not args:
+                return widget.focus
+            widget.focus = str(args[0])
+            return ''
+        if operation in ('heading', 'column'):
+            store = (widget.headings if operation == 'heading' else widget.tree_columns).setdefault(str(args[0]), {})
+            if len(args) == 1:
+                return tuple(word for key, value in store.items() for word in ('-' + key, value))
+            if len(args) == 2:
+                return store.get(args[1][1:], '')
+            store.update(_pairs(args[1:]))
+            return ''
+        if operation == 'set':
+            item = self._tree_item(widget, args[0])
+            columns = list(self.splitlist(widget.options.get('columns', '')))
+            values = list(self._item_option(item, 'values') or ())
+            if len(args) == 1:
+                return tuple(word for column, value in zip(columns, values) for word in (column, value))
+            position = columns.index(args[1]) if args[1] in columns else int(str(args[1]).lstrip('#')) - 1
+            if len(args) == 2:
+                return values[position] if position < len(values) else ''
+            values += [''] * (position + 1 - len(values))
+            values[position] = args[2]
+            item.options['values'] = tuple(values)
+            return ''
+        return '' # see and the rest only scroll or draw
+
+    def _tree_item(self, widget, iid):
+        item = widget.items.get(str(iid))
+        if item is None:
+            raise TclError(f'Item {iid} not found')
+        return item
+
+    def _tree_items(self, widget, args):
+        chosen = []
+        for arg in args:
+            for iid in (arg if isinstance(arg, (tuple, list)) else self.splitlist(arg)):
+                self._tree_item(widget, iid)
+                chosen.append(str(iid))
+        return chosen
+
+    def _item_option(self, item, key):
+        value = item.options.get(key, 0 if key == 'open' else '')
+        if key == 'values' and isinstance(value, str):
+            return self.splitlist(value)
+        return value
+
+    def _text_index(self, widget, index):
+        """Offset into widget.text + the final newline"""
+        full_length = len(widget.text) + 1
+        index = str(index).strip()
+        base = re.split(r'\s*[+-]|\s+', index, maxsplit=1)[0]
+        if base in ('end', 'insert', 'current'):
+            offset = full_length if base == 'end' else len(widget.text)
+        elif re.match(r'^\d+\.(\d+|end)$', base):
+            line, column = base.split('.')
+            lines = widget.text.split('\n')
+            line = int(line)
+            if line < 1:
+                offset = 0
+            elif line > len(lines):
+                offset = full_length
+            else:
+                offset = sum(len(text) + 1 for text in lines[:line - 1])
+                length = len(lines[line - 1])
+                offset += length if column == 'end' else min(int(column), length)
+        else:
+            raise TclError(f'bad text index "{index}"')
+        for sign, count, unit in _TEXT_MODIFIER.findall(index[len(base):]):
+            count = int(count) * (1 if sign == '+' else -1)
+            if unit.startswith('c'):
+                offset += count
+            else: # whole lines, keeping the column where possible
+                text = widget.text + '\n'
+                line_start = text.rfind('\n', 0, offset) + 1
+                column = offset - line_start
+                starts = [0] + [i + 1 for i, c in enumerate(text) if c == '\n']
+                line = max(0, min(len(starts) - 1, starts.index(line_start) + count))
+                offset = starts[line] + column
+        if index.endswith('lineend'):
+            end = widget.text.find('\n', offset)
+            offset = len(widget.text) if end < 0 else end
+        elif index.endswith('linestart'):
+            offset = widget.text.rfind('\n', 0, offset) + 1
+        return max(0, min(full_length, offset))
+
+    def _text(self, widget, operation, args):
+        text = widget.text
+        if operation in ('insert', 'delete', 'replace') and widget.options.get('state') == 'disabled':
+            return '' # like tk, a disabled Text ignores edits
+        if operation == 'get':
+            first = self._text_index(widget, args[0])
+            last = self._text_index(widget, args[1]) if len(args) > 1 else first + 1
+            return (text + '\n')[first:last]
+        if operation == 'insert':
+            offset = min(self._text_index(widget, args[0]), len(text))
+            inserted = ''.join(str(chunk) for chunk in args[1::2]) # chars tags chars tags...
+            widget.text = text[:offset] + inserted + text[offset:]
+            return ''
+        if operation == 'delete':
+            first = min(self._text_index(widget, args[0]), len(text))
+            last = min(self._text_index(widget, args[1]) if len(args) > 1 else first + 1, len(text))
+            if last > first:
+                widget.text = text[:first] + text[last:]
+            return ''
+        if operation == 'index':
+            offset = self._text_index(widget, args[0])
+            before = (text + '\n')[:offset]
+            return f"{before.count(chr(10)) + 1}.{len(before) - before.rfind(chr(10)) - 1}"
+        if operation == 'count':
+            return abs(self._text_index(widget, args[-1]) - self._text_index(widget, args[-2]))
+        return ''
+
+    def _canvas(self, widget, operation, args):
+        items = widget.canvas_items
+        if operation == 'create':
+            coords = []
+            rest = list(args[1:])
+            while rest and not (isinstance(rest[0], str) and rest[0].startswith('-') and not rest[0][1:2].isdigit()):
+                value = rest.pop(0)
+                coords.extend(value if isinstance(value, (tuple, list)) else self.splitlist(value))
+            self._sequence += 1
+            items[self._sequence] = [args[0], [self.getdouble(c) for c in coords], _pairs(rest)]
+            return self._sequence
+        if operation == 'coords':
+            item = items.get(self._canvas_id(args[0]))
+            if item is None:
+                return ()
+            if len(args) == 1:
+                return tuple(item[1])
+            coords = []
+            for value in args[1:]:
+                coords.extend(value if isinstance(value, (tuple, list)) else self.splitlist(value))
+            item[1] = [self.getdouble(c) for c in coords]
+            return ''
+        if operation == 'delete':
+            for tag in args:
+                if tag == 'all':
+                    items.clear()
+                else:
+                    items.pop(self._canvas_id(tag), None)
+            return ''
+        if operation in ('itemconfigure', 'itemconfig'):
+            item = items.get(self._canvas_id(args[0]))
+            if item is not None and len(args) > 2:
+                item[2].update(_pairs(args[1:]))
+            return ''
+        if operation == 'find':
+            return tuple(items)
+        if operation == 'type':
+            item = items.get(self._canvas_id(args[0]))
+            return item[0] if item is not None else ''
+        return ''
+
+    def _canvas_id(self, tag):
+        try:
+            return int(tag)
+        except (TypeError, ValueError):
+            return None
+
+    def _listbox_items(self, widget):
+        variable = widget.options.get('listvariable')
+        if variable:
+            return list(self.splitlist(self.variables.get(variable, '')))
+        return widget.list_items
+
+    def _listbox_index(self, widget, index, size):
+        if index in ('end', 'active', 'anchor'):
+            return max(0, size - 1) if index != 'end' else size
+        return self.getint(index)
+
+    def _listbox(self, widget, operation, args):
+        items = self._listbox_items(widget)
+        if operation == 'curselection':
+            return tuple(sorted(i for i in widget.list_selection if i < len(items)))
+        if operation == 'size':
+            return len(items)
+        if operation == 'get':
+            first = self._listbox_index(widget, args[0], len(items))
+            if len(args) == 1:
+                return items[first] if 0 <= first < len(items) else ''
+            return tuple(items[first:self._listbox_index(widget, args[1], len(items)) + 1])
+        if operation == 'selection':
+            first = self._listbox_index(widget, args[1], len(items))
+            last = self._listbox_index(widget, args[2], len(items)) if len(args) > 2 else first
+            chosen = set(range(first, min(last, len(items) - 1) + 1))
+            if args[0] == 'includes':
+                return int(first in widget.list_selection)
+            if args[0] == 'set':
+                widget.list_selection |= chosen
+            elif args[0] == 'clear':
+                widget.list_selection -= chosen
+            return ''
+        if operation in ('insert', 'delete'):
+            if widget.options.get('listvariable'):
+                return '' # the items are edited through the variable
+            if operation == 'insert':
+                index = self._listbox_index(widget, args[0], len(items))
+                items[index:index] = [str(item) for item in args[1:]]
+            else:
+                first = self._listbox_index(widget, args[0], len(items))
+                last = self._listbox_index(widget, args[1], len(items)) if len(args) > 1 else first
+                del items[first:last + 1]
+                widget.list_selection = {i for i in widget.list_selection if i < first}
+            return ''
+        if operation in ('nearest', 'index'):
+            return 0 if operation == 'nearest' else self._listbox_index(widget, args[0], len(items))
+        return ''
+
+    def _tab_path(self, widget, tab):
+        tab = str(tab)
+        if tab in widget.tabs:
+            return tab
+        if tab == 'current':
+            return widget.current_tab
+        position = len(widget.tabs) if tab == 'end' else self.getint(tab)
+        if not 0 <= position < len(widget.tabs):
+            raise TclError(f'Slave index {tab} out of bounds')
+        return widget.tabs[position]
+
+    def _notebook(self, widget, operation, args):
+        if operation in ('add', 'insert'):
+            child = str(args[0] if operation == 'add' else args[1])
+            if child not in widget.tabs:
+                if operation == 'add':
+                    widget.tabs.append(child)
+                else:
+                    position = len(widget.tabs) if args[0] == 'end' else self.getint(args[0])
+                    widget.tabs.insert(position, child)
+            if not widget.current_tab:
+                widget.current_tab = child
+                self._queue_event(widget.path, '<<NotebookTabChanged>>')
+            return ''
+        if operation == 'tabs':
+            return tuple(widget.tabs)
+        if operation in ('forget', 'hide'):
+            child = self._tab_path(widget, args[0])
+            widget.tabs.remove(child)
+            if widget.current_tab == child:
+                widget.current_tab = widget.tabs[0] if widget.tabs else ''
+                self._queue_event(widget.path, '<<NotebookTabChanged>>')
+            return ''
+        if operation == 'select':
+            if not args:
+                return widget.current_tab
+            child = self._tab_path(widget, args[0])
+            if child != widget.current_tab:
+                widget.current_tab = child
+                self._queue_event(widget.path, '<<NotebookTabChanged>>')
+            return ''
+        if operation == 'index':
+            if args[0] == 'end':
+                return len(widget.tabs)
+            return widget.tabs.index(self._tab_path(widget, args[0]))
+        return ''
+
+_COMMANDS = {name[5:]: method for name, method in vars(NullInterpreter).items() if name.startswith('_cmd_')}
+_COMMANDS['::tkkit::configure_many'] = NullInterpreter._configure_many
+_COMMANDS['::tkkit::set_many'] = NullInterpreter._set_many
+_COMMANDS['::tkkit::grid_many'] = NullInterpreter._grid_many
+_CLASS_COMMANDS = {
+    'Treeview': NullInterpreter._treeview,
+    'Text': NullInterpreter._text,
+    'Canvas': NullInterpreter._canvas,
+    'Listbox': NullInterpreter._listbox,
+    'TNotebook': NullInterpreter._notebook,
+    'TScale': NullInterpreter._scale,
+    'Scale': NullInterpreter._scale,
+}
+for _cls in ('TEntry', 'TSpinbox', 'TCombobox', 'Entry', 'Spinbox'):
+    _CLASS_COMMANDS[_cls] = NullInterpreter._entry
+for _cls in ('TButton', 'TCheckbutton', 'TRadiobutton', 'Button', 'Checkbutton', 'Radiobutton'):
+    _CLASS_COMMANDS[_cls] = NullInterpreter._button
+
+class NullRoot(tkinter.Tk):
+    """A Tk root whose interpreter is a NullInterpreter, made by NullBackend.create_root()"""
+    def __init__(self, interpreter:NullInterpreter):
+        self.master = None
+        self.children = {}
+        self._tkloaded = True
+        self.tk = interpreter
+        self._tclCommands = []
+
+class NullBackend:
+    """
+        Runs an app without a display: tkinter's widget classes are kept, but the interpreter under them keeps
+        widgets, variables, traces, bindings and after() timers in memory and draws nothing.
+        Every Tk command is counted in ops, e.g. ops['Treeview insert'] or ops['grid configure'],
+        so the counts of a scenario can be checked against a budget.
+        Time is virtual: after() callbacks run when advance() moves the clock past them, or at update().
+        usage:
+            backend = NullBackend()
+            app = TKApp('Test', backend=backend)
+            app.show(window)
+            vm.rows.append(row)
+            backend.update()
+            assert backend.ops['Treeview insert'] == 1
+    """
+    def __init__(self):
+        self.ops = Counter()
+        self.interpreter = NullInterpreter(self)
+
+    def create_root(self) -> NullRoot:
+        return NullRoot(self.interpreter)
+
+    @property
+    def total_ops(self) -> int:
+        return sum(self.ops.values())
+
+    def reset_ops(self):
+        self.ops.clear()
+
+    @property
+    def now(self):
+        """Virtual time in ms"""
+        return self.interpreter.now
+
+    def update(self):
+        self.interpreter.update()
+
+    def advance(self, ms):
+        self.interpreter.advance(ms)
+
+    def widget(self, el) -> NullWidget:
+        """The in-memory state of a tk widget (or widget path): options, grid geometry, tree items, text..."""
+        return self.interpreter._widget(getattr(el, 'el', el))
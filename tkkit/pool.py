@@ -0,0 +1,118 @@
+from collections import OrderedDict
+
+class WidgetPool:
+    """
+        Keeps released tk widgets for reuse by later builds.
+        usage:
+            app = TKApp('My App', pool=WidgetPool(max_size=500))
+            app.replace('panel', new_panel) # the old panel's tk widgets are claimed by the new one
+            print(app.widget_pool.stats())
+
+        Tk widgets can't change their master, so widgets are pooled per
+        (widget class, master, style signature) and only per-instance options like text are reconfigured.
+    """
+    def __init__(self, max_size=500, max_per_key=50):
+        self.max_size = max_size
+        self.max_per_key = max_per_key
+        self._idle = OrderedDict() # widget path -> (key, tk widget), oldest first
+        self._by_key = {} # key -> [tk widget]
+        self._instance_options = {} # widget path -> option names set per instance
+        self._defaults = {} # (widget class, option) -> default value
+        self.hits = 0
+        self.misses = 0
+        self.released = 0
+        self.evictions = 0
+
+    @staticmethod
+    def style_signature(styles):
+        return tuple(sorted((k, repr(v)) for k, v in styles.items()))
+
+    def create(self, factory, master, styles, options):
+        """Returns an idle widget of the same class, master and styles configured with options, or a new one"""
+        key = (factory, str(master), self.style_signature(styles))
+        idle = self._by_key.get(key)
+        if idle:
+            el = idle.pop()
+            del self._idle[str(el)]
+            self.hits += 1
+            if options:
+                el.configure(**options)
+        else:
+            el = factory(master, **options, **styles)
+            self.misses += 1
+        self._instance_options[str(el)] = (key, tuple(options))
+        return el
+
+    def release(self, el):
+        """Unmap and reset a widget made by create() and keep it for reuse, evicting the oldest widgets past the limits"""
+        path = str(el)
+        if path not in self._instance_options:
+            el.destroy()
+            return
+        key, option_names = self._instance_options[path]
+        self._reset(el, key[0], option_names)
+        self.released += 1
+        idle = self._by_key.setdefault(key, [])
+        if len(idle) >= self.max_per_key:
+            self._evict(path, el)
+            return
+        idle.append(el)
+        self._idle[path] = (key, el)
+        while len(self._idle) > self.max_size:
+            oldest_path, (oldest_key, oldest) = next(iter(self._idle.items()))
+            self._forget(oldest_path, oldest_key, oldest)
+            self._evict(oldest_path, oldest)
+
+    def _default(self, factory, el, option):
+        if (factory, option) not in self._defaults:
+            query = option[:-1] if option.endswith('_') else option # from_ is passed as -from
+            self._defaults[(factory, option)] = el.configure(query)[3]
+        return self._defaults[(factory, option)]
+
+    def _reset(self, el, factory, option_names):
+        manager = el.winfo_manager()
+        if manager == 'grid':
+            el.grid_forget()
+        elif manager == 'pack':
+            el.pack_forget()
+        for sequence in el.bind():
+            el.unbind(sequence)
+        if option_names:
+            el.configure(**{option: self._default(factory, el, option) for option in option_names})
+        # commands and bindings of the previous owner are no longer referenced by tk, free their tcl commands
+        for name in list(getattr(el, '_tclCommands', None) or ()):
+            el.deletecommand(name)
+
+    def _forget(self, path, key, el):
+        del self._idle[path]
+        self._by_key[key].remove(el)
+
+    def _evict(self, path, el):
+        self.evictions += 1
+        del self._instance_options[path]
+        el.destroy()
+        # descendants of a destroyed frame are gone as well
+        prefix = path + '.'
+        for child_path in [p for p in self._instance_options if p.startswith(prefix)]:
+            if child_path in self._idle:
+                child_key, child = self._idle[child_path]
+                self._forget(child_path, child_key, child)
+            del self._instance_options[child_path]
+
+    def clear(self):
+        for path, (key, el) in list(self._idle.items()):
+            if path in self._idle: # may already be gone with an evicted master
+                self._forget(path, key, el)
+                self._evict(path, el)
+
+    def stats(self):
+        claims = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / claims if claims else 0.0,
+            'idle': len(self._idle),
+            'released': self.released,
+            'evictions': self.evictions,
+            'widgets_saved': self.hits, # tk widgets reused instead of created
+        }
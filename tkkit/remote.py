@@ -0,0 +1,276 @@
+import pickle
+import threading
+import time
+from collections import deque
+from functools import partial
+from multiprocessing import shared_memory
+from types import MappingProxyType
+from .view_model import ViewModel, BindedListUpdateType, FrozenList
+
+try:
+    import numpy as np
+except ImportError: # numpy is optional, arrays are only sent through shared memory when it's available
+    np = None
+
+# record kinds: (SET, field, value), (LIST, field, change code, data), (ARRAY, field, block name, shape, dtype)
+SET, LIST, ARRAY = 0, 1, 2
+_CHANGE_TYPES = tuple(BindedListUpdateType)
+_CHANGE_CODES = {change_type: code for code, change_type in enumerate(_CHANGE_TYPES)}
+_REPLAYABLE = {BindedListUpdateType.INSERT, BindedListUpdateType.EXTEND, BindedListUpdateType.INSERT_AT,
+               BindedListUpdateType.DELETE_ROW, BindedListUpdateType.SETITEM, BindedListUpdateType.SET_CELL}
+
+def _thaw(value):
+    """Lists and dicts back from the frozen snapshot a thread safe ViewModel notifies with"""
+    if isinstance(value, (tuple, list, FrozenList)):
+        return [_thaw(item) for item in value]
+    if isinstance(value, MappingProxyType):
+        return {key: _thaw(item) for key, item in value.items()}
+    return value
+
+class ViewModelPublisher:
+    """
+        Mirrors fields of a ViewModel to a ViewModelMirror in another process, over a multiprocessing Connection
+        (an end of Pipe(), or Listener/Client on a Unix socket). Field sets and BindedList changes are sent as
+        compact records in batches, a set drops the field's older records that are still queued, and numpy arrays
+        of shm_threshold bytes or more travel through shared memory instead of the pipe.
+        At most max_in_flight batches wait for the mirror to apply them, past that writers block once max_pending
+        records are queued, so a slow ui slows the engine down instead of piling up memory.
+        usage:
+            # engine process
+            publisher = ViewModelPublisher(vm, connection, fields=['rows', 'status'])
+            # ui process
+            ViewModelMirror(vm, connection).start(app)
+    """
+    def __init__(self, vm:ViewModel, connection, fields:list, batch_ms=5, max_pending=100_000, max_in_flight=4,
+                 shm_threshold=1 << 16):
+        self.vm = vm
+        self.connection = connection
+        self.batch_ms = batch_ms
+        self.max_pending = max_pending
+        self.max_in_flight = max_in_flight
+        self.shm_threshold = shm_threshold
+        self.sent_batches = 0
+        self.sent_records = 0
+        self.sent_bytes = 0
+        self._cond = threading.Condition()
+        self._pending = deque() # (field, generation, record)
+        self._generations = dict.fromkeys(fields, 0) # bumped by each set, older queued records of the field are dropped
+        self._acked = 0 # last batch applied by the mirror
+        self._blocks = {} # field -> [[SharedMemory, id of the last batch using it]]
+        self._closed = False
+        self._sending = False
+        for field in fields:
+            self._on_change(field, getattr(vm, field)) # initial state
+        self._subscriptions = [getattr(vm, field + '_').subscribe(partial(self._on_change, field)) for field in fields]
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        threading.Thread(target=self._receive_acks, daemon=True).start()
+
+    def _on_change(self, field, value, change_type=None, data=None):
+        if change_type in _REPLAYABLE:
+            record = (LIST, field, _CHANGE_CODES[change_type], data)
+        else: # a new value, or a sort that can't be replayed without its key
+            if self.vm._sync is not None: # thread safe models notify frozen snapshots, lists are FrozenLists there
+                value = _thaw(value)
+            elif isinstance(value, list):
+                value = list(value) # later changes are queued as their own records
+            record = (SET, field, value)
+        with self._cond:
+            while len(self._pending) >= self.max_pending and not self._closed:
+                self._cond.wait()
+            if record[0] == SET:
+                self._generations[field] += 1
+            elif change_type == BindedListUpdateType.SETITEM and isinstance(data[0], int):
+                self._drop_cells(field, data[0])
+            self._pending.append((field, self._generations[field], record))
+            self._cond.notify_all()
+
+    def _drop_cells(self, field, index):
+        """Setting a row is notified as its changed cells, then the row, the row alone is sent"""
+        pending = self._pending
+        set_cell = _CHANGE_CODES[BindedListUpdateType.SET_CELL]
+        while pending:
+            record = pending[-1][2]
+            if record[0] != LIST or record[1] != field or record[2] != set_cell or record[3][0] != index:
+                return
+            pending.pop()
+
+    def _receive_acks(self):
+        while True:
+            try:
+                batch_id = self.connection.recv()
+            except (EOFError, OSError): # the mirror went away
+                self.close()
+                return
+            with self._cond:
+                self._acked = batch_id
+                self._cond.notify_all()
+
+    def _share(self, field, array, batch_id):
+        array = np.ascontiguousarray(array)
+        blocks = self._blocks.setdefault(field, [])
+        for block in blocks:
+            if block[1] <= self._acked and block[0].size >= array.nbytes:
+                break
+        else:
+            block = [shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1)), 0]
+            blocks.append(block)
+        block[1] = batch_id
+        np.ndarray(array.shape, array.dtype, buffer=block[0].buf)[...] = array
+        return ARRAY, field, block[0].name, array.shape, array.dtype.str
+
+    def _encode(self, record, batch_id):
+        if record[0] == SET and np is not None and isinstance(record[2], np.ndarray) and record[2].nbytes >= self.shm_threshold:
+            return self._share(record[1], record[2], batch_id)
+        return record
+
+    def _run(self):
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._pending or self._closed)
+                if self._closed:
+                    return
+            time.sleep(self.batch_ms / 1000) # let a batch build up
+            with self._cond:
+                self._cond.wait_for(lambda: self.sent_batches - self._acked < self.max_in_flight or self._closed)
+                if self._closed:
+                    return
+                items = self._pending
+                self._pending = deque()
+                generations = dict(self._generations)
+                self._sending = True
+                self._cond.notify_all()
+            batch_id = self.sent_batches + 1
+            records = [self._encode(record, batch_id) for field, generation, record in items
+                       if generation == generations[field]]
+            data = pickle.dumps((batch_id, records), protocol=pickle.HIGHEST_PROTOCOL)
+            try:
+                self.connection.send_bytes(data)
+            except (EOFError, OSError):
+                with self._cond:
+                    self._sending = False
+                    self._closed = True
+                    self._cond.notify_all()
+                return
+            with self._cond:
+                self.sent_batches = batch_id
+                self.sent_records += len(records)
+                self.sent_bytes += len(data)
+                self._sending = False
+                self._cond.notify_all()
+
+    def flush(self, timeout=None) -> bool:
+        """Wait until everything queued so far has been applied by the mirror"""
+        with self._cond:
+            return self._cond.wait_for(lambda: self._closed or (not self._pending and not self._sending
+                                                                and self._acked >= self.sent_batches), timeout)
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        for subscription in self._subscriptions:
+            subscription.dispose()
+        if threading.current_thread() is not self._thread:
+            self._thread.join(1)
+        for blocks in self._blocks.values():
+            for block, _ in blocks:
+                block.close()
+                block.unlink()
+        self._blocks = {}
+
+class ViewModelMirror:
+    """
+        Applies the records of a ViewModelPublisher to a local ViewModel on the tk thread, through the usual
+        setattr and BindedList methods, so bound widgets update incrementally as if the changes were made here.
+        Each batch is acknowledged once applied, which paces the publisher to what the ui can keep up with.
+    """
+    def __init__(self, vm:ViewModel, connection, poll_ms=10):
+        self.vm = vm
+        self.connection = connection
+        self.poll_ms = poll_ms
+        self.applied_batches = 0
+        self.applied_records = 0
+        self.closed = False
+        self._batches = deque() # (batch id, records) received by the reader thread
+        self._blocks = {} # shared memory block name -> SharedMemory
+        self._widget = None
+        self._thread = threading.Thread(target=self._receive, daemon=True)
+        self._thread.start()
+
+    def _receive(self):
+        while True:
+            try:
+                data = self.connection.recv_bytes()
+            except (EOFError, OSError):
+                self.closed = True
+                return
+            self._batches.append(pickle.loads(data))
+
+    def start(self, master):
+        """Apply batches from the tk main loop of master (an app or widget)"""
+        self._widget = getattr(master, 'el', master)
+        self._widget.after(self.poll_ms, self._poll)
+        return self
+
+    def _poll(self):
+        self.apply_pending()
+        if not (self.closed and not self._batches):
+            self._widget.after(self.poll_ms, self._poll)
+
+    def _attach(self, name):
+        block = self._blocks.get(name)
+        if block is None:
+            block = self._blocks[name] = shared_memory.SharedMemory(name=name)
+            try: # the publisher owns the block, don't let this process' tracker unlink it on exit
+                from multiprocessing import resource_tracker
+                resource_tracker.unregister(block._name, 'shared_memory')
+            except Exception:
+                pass
+        return block
+
+    def _apply(self, record):
+        kind, field = record[0], record[1]
+        if kind == SET: # through the bindable, so lists become BindedLists that notify the records that follow
+            getattr(self.vm, field + '_').set_value(record[2])
+        elif kind == ARRAY:
+            _, _, name, shape, dtype = record
+            getattr(self.vm, field + '_').set_value(np.ndarray(shape, np.dtype(dtype), buffer=self._attach(name).buf).copy())
+        else:
+            change_type, data = _CHANGE_TYPES[record[2]], record[3]
+            items = getattr(self.vm, field)
+            if change_type == BindedListUpdateType.INSERT:
+                items.append(data)
+            elif change_type == BindedListUpdateType.EXTEND:
+                items.extend(data)
+            elif change_type == BindedListUpdateType.INSERT_AT:
+                items.insert(*data)
+            elif change_type == BindedListUpdateType.DELETE_ROW:
+                items.pop(data)
+            elif change_type == BindedListUpdateType.SETITEM:
+                items[data[0]] = data[1]
+            elif change_type == BindedListUpdateType.SET_CELL:
+                items.set_cell(*data)
+
+    def apply_pending(self) -> int:
+        """Apply the batches received so far, returns the number of records applied"""
+        applied = 0
+        while self._batches:
+            batch_id, records = self._batches.popleft()
+            with self.vm.synchronized(): # thread safe models notify once the whole batch is in
+                for record in records:
+                    self._apply(record)
+            applied += len(records)
+            self.applied_batches += 1
+            try:
+                self.connection.send(batch_id)
+            except (EOFError, OSError):
+                self.closed = True
+        self.applied_records += applied
+        return applied
+
+    def close(self):
+        self.closed = True
+        for block in self._blocks.values():
+            block.close()
+        self._blocks = {}
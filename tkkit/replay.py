@@ -0,0 +1,177 @@
+import gzip
+import json
+import time
+import weakref
+from tkinter import TclError
+from .view_model import is_model_update
+from .widgets import Button, ListBox, DataTable, TextBox
+
+FORMAT = 'tkkit-events'
+VERSION = 1
+
+def _open(path, mode):
+    if str(path).endswith('.gz'):
+        return gzip.open(path, mode + 't', encoding='utf-8')
+    return open(path, mode, encoding='utf-8')
+
+class EventRecorder:
+    """
+        Records user input on the named widgets of an app, one json line per event: [seconds, name, kind, value].
+        kind is "set" (a new value for the widget), "click" (a button) or "select" (a DataTable row index).
+        Writes from code, bound ViewModel values and set_value() calls, are not input and are left out.
+        usage:
+            recorder = app.record("session.jsonl.gz")
+            ...
+            app.stop_recording()
+    """
+    def __init__(self, app, path):
+        self.app = app
+        self.path = path
+        self.active = True
+        self.count = 0
+        self._file = _open(path, 'w')
+        self._file.write(json.dumps({'format': FORMAT, 'version': VERSION, 'started_at': time.time()}) + '\n')
+        self._started_at = time.perf_counter()
+        self._watched = weakref.WeakSet()
+        self._traces = [] # (tk variable, trace name)
+        self._buttons = [] # their command is wrapped while recording
+        self.watch_all()
+
+    def _record(self, name, kind, value=None):
+        if not self.active:
+            return
+        event = [round(time.perf_counter() - self._started_at, 4), name, kind, value]
+        self._file.write(json.dumps(event, separators=(',', ':'), default=str) + '\n')
+        self.count += 1
+
+    def watch_all(self):
+        """Start watching named widgets that aren't watched yet, e.g. after app.replace()"""
+        for name, widget in list(self.app.name_registry.items()):
+            if widget not in self._watched and widget.el is not None:
+                self._watched.add(widget)
+                self._watch(name, widget)
+
+    def _watch(self, name, widget):
+        el = widget.el
+        if isinstance(widget, Button):
+            if widget.on_click is not None:
+                def click():
+                    self._record(name, 'click')
+                    widget.handle_click()
+                el.configure(command=click)
+                self._buttons.append(widget)
+        elif isinstance(widget, ListBox):
+            el.bind('<<ListboxSelect>>', lambda event: self._record(name, 'set', widget.get_value()), add='+')
+        elif isinstance(widget, DataTable):
+            def select(event):
+                selection = el.selection()
+                if selection:
+                    self._record(name, 'select', el.index(selection[0]))
+            el.bind('<<TreeviewSelect>>', select, add='+')
+        elif isinstance(widget, TextBox) and widget.lines > 1:
+            el.bind('<KeyRelease>', lambda event: self._record(name, 'set', widget.get_value()), add='+')
+        elif widget.var_to_bind is not None:
+            def changed(*args):
+                if not is_model_update():
+                    self._record(name, 'set', widget.get_value())
+            self._traces.append((widget.var_to_bind, widget.var_to_bind.trace_add('write', changed)))
+
+    def stop(self):
+        if not self.active:
+            return
+        self.active = False # tk bindings can't be removed one by one, they stay as no-ops
+        for var, trace_name in self._traces:
+            try:
+                var.trace_remove('write', trace_name)
+            except TclError:
+                pass
+        self._traces = []
+        for button in self._buttons:
+            try:
+                if button.el is not None:
+                    button.el.configure(command=button.handle_click)
+            except TclError: # the window is already closed
+                pass
+        self._buttons = []
+        self._file.close()
+
+class ReplayReport:
+    """Per event kind: how long applying the event took (binding) and the tk update after it (render), in seconds"""
+    def __init__(self):
+        self.binding = {} # kind -> [seconds]
+        self.render = {}
+        self.replayed = 0
+        self.missing = 0 # events for names the app doesn't have
+        self.duration = 0.0
+
+    def add(self, kind, binding, render):
+        self.binding.setdefault(kind, []).append(binding)
+        self.render.setdefault(kind, []).append(render)
+        self.replayed += 1
+
+    @staticmethod
+    def _stats(samples):
+        ordered = sorted(samples)
+        return {
+            'count': len(ordered),
+            'mean_ms': sum(ordered) / len(ordered) * 1000,
+            'p95_ms': ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000,
+            'max_ms': ordered[-1] * 1000,
+        }
+
+    def summary(self) -> dict:
+        return {kind: {'binding': self._stats(self.binding[kind]), 'render': self._stats(self.render[kind])}
+                for kind in self.binding}
+
+    def __str__(self):
+        lines = [f'{self.replayed} events replayed in {self.duration:.2f}s, {self.missing} for missing widgets']
+        for kind, stats in self.summary().items():
+            binding, render = stats['binding'], stats['render']
+            lines.append(f"{kind:>7} x{binding['count']}: binding mean {binding['mean_ms']:.2f}ms p95 {binding['p95_ms']:.2f}ms, "
+                         f"render mean {render['mean_ms']:.2f}ms p95 {render['p95_ms']:.2f}ms")
+        return '\n'.join(lines)
+
+def read_events(path):
+    with _open(path, 'r') as f:
+        header = json.loads(f.readline())
+        if header.get('format') != FORMAT:
+            raise ValueError(f'{path} is not a tkkit event recording')
+        return [json.loads(line) for line in f if line.strip()]
+
+def apply_event(app, name, kind, value) -> bool:
+    widget = app.name_registry.get(name)
+    if widget is None or widget.el is None:
+        return False
+    if kind == 'click':
+        widget.handle_click()
+    elif kind == 'select':
+        children = widget.el.get_children()
+        if value < len(children):
+            widget.el.selection_set(children[value])
+    else:
+        widget.set_value(value)
+        if isinstance(widget, ListBox): # selection_set doesn't fire the event a click does
+            widget.el.event_generate('<<ListboxSelect>>')
+    return True
+
+def replay_events(app, path, speed=1.0) -> ReplayReport:
+    """
+    Feed a recording to app's widgets by name. speed scales the recorded pace, None replays as fast as possible.
+    Each event is timed while it's applied (bindings and listeners) and while tk processes the updates it caused."""
+    report = ReplayReport()
+    started_at = time.perf_counter()
+    for at, name, kind, value in read_events(path):
+        if speed is not None:
+            due = started_at + at / speed
+            while time.perf_counter() < due:
+                app.el.update()
+                time.sleep(min(0.001, max(0.0, due - time.perf_counter())))
+        applied_at = time.perf_counter()
+        if not apply_event(app, name, kind, value):
+            report.missing += 1
+            continue
+        rendered_at = time.perf_counter()
+        app.el.update()
+        report.add(kind, rendered_at - applied_at, time.perf_counter() - rendered_at)
+    report.duration = time.perf_counter() - started_at
+    return report
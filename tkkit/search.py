@@ -0,0 +1,42 @@
+from bisect import bisect_left, insort
+
+class PrefixIndex:
+    """
+        Case-insensitive prefix index over a large set of values for type-ahead, kept as a sorted array:
+        a lookup is a binary search plus the matches it returns, adding or removing a value is one insertion.
+        usage:
+            index = PrefixIndex(part_numbers)
+            index.matches('ab-12', limit=50)
+    """
+    def __init__(self, values=()):
+        self._keys = sorted(self._key(value) for value in values) # (casefolded text, text)
+
+    @staticmethod
+    def _key(value):
+        text = str(value)
+        return text.casefold(), text
+
+    def __len__(self):
+        return len(self._keys)
+
+    def add(self, value):
+        insort(self._keys, self._key(value))
+
+    def remove(self, value):
+        key = self._key(value)
+        index = bisect_left(self._keys, key)
+        if index < len(self._keys) and self._keys[index] == key:
+            del self._keys[index]
+
+    def matches(self, prefix:str, limit=50) -> list:
+        """Values starting with prefix in sorted order, at most limit of them"""
+        prefix = prefix.casefold()
+        keys = self._keys
+        result = []
+        start = bisect_left(keys, (prefix,))
+        for index in range(start, min(len(keys), start + limit)):
+            key, text = keys[index]
+            if not key.startswith(prefix):
+                break
+            result.append(text)
+        return result
@@ -0,0 +1,119 @@
+import threading
+from array import array
+
+try:
+    import numpy as np
+except ImportError: # numpy is optional, the pure python path is just slower
+    np = None
+
+class RingBuffer:
+    """
+        Fixed-capacity buffer of float samples for streaming plots, the oldest samples are overwritten.
+        usage:
+            vm.temperature = RingBuffer(1_000_000)
+            vm.temperature.append(21.5) # from any thread, Plot picks it up on its next frame
+    """
+    def __init__(self, capacity:int):
+        self.capacity = capacity
+        self._data = np.zeros(capacity) if np is not None else array('d', bytes(8 * capacity))
+        self._end = 0 # index of the next write
+        self._count = 0
+        self.version = 0 # bumped on every write, so readers can tell when to redraw
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return self._count
+
+    def append(self, value:float):
+        with self._lock:
+            self._data[self._end] = value
+            self._end = (self._end + 1) % self.capacity
+            self._count = min(self._count + 1, self.capacity)
+            self.version += 1
+
+    def extend(self, values):
+        if np is not None:
+            values = np.asarray(values, dtype=float)[-self.capacity:]
+        else:
+            values = array('d', values)[-self.capacity:]
+        with self._lock:
+            first = min(len(values), self.capacity - self._end)
+            self._data[self._end:self._end + first] = values[:first]
+            rest = len(values) - first
+            if rest:
+                self._data[:rest] = values[first:]
+            self._end = (self._end + len(values)) % self.capacity
+            self._count = min(self._count + len(values), self.capacity)
+            self.version += 1
+
+    def clear(self):
+        with self._lock:
+            self._end = 0
+            self._count = 0
+            self.version += 1
+
+    def to_array(self):
+        """Returns the samples oldest first, as a numpy array when numpy is available"""
+        with self._lock:
+            start = (self._end - self._count) % self.capacity
+            if start + self._count <= self.capacity:
+                return self._data[start:start + self._count].copy() if np is not None else self._data[start:start + self._count]
+            if np is not None:
+                return np.concatenate((self._data[start:], self._data[:self._end]))
+            return self._data[start:] + self._data[:self._end]
+
+def as_samples(value):
+    if isinstance(value, RingBuffer):
+        return value.to_array()
+    if value is None:
+        return []
+    if np is not None:
+        return np.asarray(value, dtype=float)
+    return value
+
+def envelope(samples, columns:int):
+    """
+    Reduce samples to (mins, maxs) per pixel column, or None when there are
+    fewer than two samples per column and the samples can be drawn as they are."""
+    count = len(samples)
+    if count <= 2 * columns:
+        return None
+    if np is not None:
+        bounds = (np.arange(columns) * count) // columns
+        return np.minimum.reduceat(samples, bounds), np.maximum.reduceat(samples, bounds)
+    bounds = [(i * count) // columns for i in range(columns + 1)]
+    mins = [min(samples[bounds[i]:bounds[i + 1]]) for i in range(columns)]
+    maxs = [max(samples[bounds[i]:bounds[i + 1]]) for i in range(columns)]
+    return mins, maxs
+
+def line_coords(samples, reduced, width:int, height:int, low:float, high:float) -> list:
+    """
+    Canvas coordinates of one polyline: a zigzag through the min/max of each column when
+    reduced by envelope(), otherwise a point per sample."""
+    scale = (height - 1) / (high - low) if high > low else 0.0
+    if reduced is not None:
+        mins, maxs = reduced
+        columns = len(mins)
+        if np is not None:
+            coords = np.empty(columns * 4)
+            xs = np.arange(columns, dtype=float)
+            coords[0::4] = xs
+            coords[1::4] = (height - 1) - (mins - low) * scale
+            coords[2::4] = xs
+            coords[3::4] = (height - 1) - (maxs - low) * scale
+            return coords.tolist()
+        coords = []
+        for x in range(columns):
+            coords.extend((x, (height - 1) - (mins[x] - low) * scale, x, (height - 1) - (maxs[x] - low) * scale))
+        return coords
+    count = len(samples)
+    step = (width - 1) / (count - 1) if count > 1 else 0.0
+    if np is not None:
+        coords = np.empty(count * 2)
+        coords[0::2] = np.arange(count) * step
+        coords[1::2] = (height - 1) - (np.asarray(samples, dtype=float) - low) * scale
+        return coords.tolist()
+    coords = []
+    for i, value in enumerate(samples):
+        coords.extend((i * step, (height - 1) - (value - low) * scale))
+    return coords
@@ -0,0 +1,136 @@
+import tkinter as tk
+from .widgets import *
+
+FLOW_TYPES = (Column, Row, Window, VStack, HStack) # stacks whose grid is laid out from a compiled plan
+_FLOW, _LEAF, _BUILD = 0, 1, 2 # how a child of a compiled stack is built
+
+def _can_flow(widget):
+    return type(widget) in FLOW_TYPES and not any(isinstance(child, WrapperWidget) for child in widget.children)
+
+def _fits(container, plan):
+    """True when a stack has the children and spacing its plan was compiled for"""
+    column, gap, weights, steps = plan
+    children = container.children
+    return (len(children) == len(steps) and container.gap == gap and container.weights == weights
+            and all(type(child) is step[0] for child, step in zip(children, steps)))
+
+def _compiled_layout(self, parent):
+    plan = self._template._plan(self)
+    if not _fits(self, plan): # the factory made another shape this time
+        return super(type(self), self).layout_tk_widget(parent)
+    updates = [] # grid commands of the whole subtree, sent to tcl in one call
+    built = [] # nested stacks' children, their post_container_build runs once they are placed
+    el = _build_flow(self, parent.el, plan, updates, built)
+    self.defer(self.app._call_bulk, '::tkkit::grid_many', updates)
+    for node in built:
+        self.defer(node.post_container_build)
+    return el
+
+def _grid_words(position, column, padx, pady, sticky):
+    words = ('-row', position, '-column', 0) if column else ('-row', 0, '-column', position)
+    words += ('-padx', padx, '-pady', pady)
+    return words + ('-sticky', sticky) if sticky is not None else words
+
+def _build_flow(container, master, plan, updates, built):
+    column, gap, weights, steps = plan
+    el = container.el = container.create_tk(tk.Frame, master)
+    path = str(el)
+    app, registry, hidden = container.app, container.name_registry, container.hidden
+    updates += ('columnconfigure' if column else 'rowconfigure', path, (0, '-weight', 1))
+    configure = 'rowconfigure' if column else 'columnconfigure'
+    for position, (node, step) in enumerate(zip(container.children, steps)):
+        cls, given_align, given_vertical_align, padding, expand, kind, align, vertical_align, binds_var, sub_plan, \
+            weight, grid, post_build = step
+        if not (node.align == given_align and node.vertical_align == given_vertical_align and node.padding == padding
+                and node.expand == expand and (kind != _FLOW or _fits(node, sub_plan))):
+            # built and placed the way Column and Row do it
+            child_el = node.build(container)
+            weight = container.get_weight(position, node)
+            grid = _grid_words(position, column, int(node.padding[1] + gap / 2), int(node.padding[0] + gap / 2),
+                               get_sticky(node.align, node.vertical_align))
+        elif kind == _BUILD:
+            child_el = node.build(container)
+        else: # what Widget.build does, with the alignment inherited when the plan was compiled
+            node.app = app
+            node.name_registry = registry
+            node.align = align
+            node.vertical_align = vertical_align
+            node.parent = container
+            node.hidden = hidden
+            node.var_to_bind = node.bind_var() if binds_var else None
+            if node.name is not None and node.name not in registry:
+                registry[node.name] = node
+            if kind == _FLOW:
+                child_el = _build_flow(node, el, sub_plan, updates, built)
+                built.extend(child for child, child_step in zip(node.children, sub_plan[3]) if child_step[-1])
+            else:
+                child_el = node.el = node.layout_tk_widget(container)
+            if node.subscriptions and child_el is not None:
+                child_el.bind('<Destroy>', node._on_destroy, add='+')
+        if weight != 0:
+            updates += (configure, path, (position, '-weight', weight))
+        updates += ('configure', str(child_el), grid)
+    return el
+
+class Template:
+    """
+        Compiles the layout of a subtree made many times, like cards or list rows. The first instance built is
+        analyzed once: alignment inheritance, sticky values, paddings, grid weights and which stacks can be laid out
+        directly. Later instances are built from that plan and only run what binds their own data (tk widget
+        creation, bindings, names), the grid options of the whole subtree go to tcl in a single call.
+        A stack whose children or spacing differ from the plan is built as usual.
+        usage:
+            @Template
+            def card(title, done, on_open):
+                return HStack([Label(title), CheckBox('Done', checked=done), Button('Open', on_click=on_open)])
+
+            VStack([card(task.title, task.done_, partial(open_task, task)) for task in tasks])
+    """
+    def __init__(self, factory):
+        self.factory = factory
+        self._classes = {} # stack class -> its subclass laid out by this template
+        self._plans = {} # (root class, align, vertical_align) -> plan
+
+    def __call__(self, *args, **kwargs) -> Widget:
+        widget = self.factory(*args, **kwargs)
+        if _can_flow(widget):
+            cls = type(widget)
+            compiled = self._classes.get(cls)
+            if compiled is None:
+                compiled = self._classes[cls] = type(cls.__name__, (cls,), {
+                    '__slots__': (), '_template': self, 'layout_tk_widget': _compiled_layout})
+            widget.__class__ = compiled
+        return widget
+
+    def _plan(self, root):
+        key = (type(root), root.align, root.vertical_align)
+        plan = self._plans.get(key)
+        if plan is None:
+            plan = self._plans[key] = self._flow_plan(root, root.align, root.vertical_align)
+        return plan
+
+    def _flow_plan(self, container, align, vertical_align):
+        column = isinstance(container, Column)
+        steps = []
+        for position, child in enumerate(container.children):
+            # inherited the way Widget.build does it
+            child_align = child.align if child.align is not None or align == 'fill' else align
+            child_vertical_align = child.vertical_align if child.vertical_align is not None or align == 'fill' else vertical_align
+            sub_plan = None
+            if _can_flow(child):
+                kind = _FLOW
+                sub_plan = self._flow_plan(child, child_align, child_vertical_align)
+            elif isinstance(child, Container) or type(child).get_child_widgets is not Widget.get_child_widgets:
+                kind = _BUILD
+            else:
+                kind = _LEAF
+            padding = child.padding
+            grid = _grid_words(position, column, int(padding[1] + container.gap / 2), int(padding[0] + container.gap / 2),
+                               get_sticky(child_align, child_vertical_align))
+            cls = type(child)
+            steps.append((cls, child.align, child.vertical_align, padding, child.expand, kind,
+                          child_align, child_vertical_align, cls.bind_var is not Widget.bind_var, sub_plan,
+                          container.get_weight(position, child), grid,
+                          cls.post_container_build is not Widget.post_container_build))
+        weights = list(container.weights) if container.weights is not None else None
+        return column, container.gap, weights, steps
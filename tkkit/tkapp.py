@@ -2,40 +2,226 @@ from tkinter import *
 from tkinter import ttk
 from .widgets import *
 from .exceptions import *
+from .layout import compile_layout, count_widgets, LayoutReport
+from .pool import WidgetPool
+from .replay import EventRecorder, ReplayReport, replay_events
+from .null_backend import NullBackend
+from .view_model import program_write
+import threading
+import time
+
+# run by set_attrs(), set_values() and templates, so a whole batch is one call into tcl instead of one per widget
+_BULK_PROCS = '''
+namespace eval ::tkkit {}
+proc ::tkkit::configure_many {updates} {
+    foreach {path options} $updates { $path configure {*}$options }
+}
+proc ::tkkit::set_many {updates} {
+    foreach {name value} $updates { set ::$name $value }
+}
+proc ::tkkit::grid_many {updates} {
+    foreach {command path options} $updates { grid $command $path {*}$options }
+}
+'''
 
 class TKApp:
-    def __init__(self, title=None):
-        self.el = Tk()
+    def __init__(self, title=None, pool:WidgetPool=None, backend:NullBackend=None):
+        # with a NullBackend nothing is drawn and no display is needed, tk commands are counted in backend.ops
+        self.backend = backend
+        self.el = backend.create_root() if backend is not None else Tk()
+        self.widget_pool = pool # released widgets are reused by later builds when a pool is given
         self.align = None
         self.vertical_align = None
+        self.geometry_queue = None # list of pending geometry calls while building in deferred mode
+        self.timings = {}
+        self.recorder:EventRecorder = None
+        self._thread_id = threading.get_ident() # tk is only touched from the thread that made it
+        self._bulk_procs = False
+        self._bulk_lock = threading.Lock()
+        self._queued_attrs = {} # name -> {prop: value}, from other threads until the tk thread applies them
+        self._queued_values = {}
+        self._bulk_scheduled = False
         if title is not None:
             self.el.title(title)
 
-    def show(self, window):
+    @property
+    def app(self):
+        return self
+
+    def show(self, window, flatten=False, deferred=False):
+        """
+        Build the window tree. With flatten=True stacks nested in a stack of the same direction are merged by
+        compile_layout first, the result is kept in self.layout_report.
+        With deferred=True all widgets are created first while the window is hidden, then the grid
+        options are applied in one pass and the window is mapped once at its final size.
+        Build and geometry times are kept in self.timings.
+        """
         if not isinstance(window, Container):
             raise LayoutException("root element has to be VStack or HStack") 
         self.name_registry = {}
+        self.window = window
+        self.layout_report = None
+        if flatten:
+            window, self.layout_report = compile_layout(window)
+            self.window = window
+        started_at = time.perf_counter()
+        if deferred:
+            self.el.withdraw()
+            self.geometry_queue = []
         main_el = window.build(self)
+        self.timings['build'] = time.perf_counter() - started_at
+        if self.layout_report is not None:
+            self.layout_report.build_time = self.timings['build']
         self.el.columnconfigure(0, weight=1)
         self.el.rowconfigure(0, weight=1)
         main_el.grid(row=0, column=0, sticky="wens")
+        if deferred:
+            self.flush_geometry()
+            self.el.update_idletasks()
+            self.el.deiconify()
+        self.timings['geometry'] = time.perf_counter() - started_at - self.timings['build']
+
+    def flush_geometry(self):
+        """Apply the queued geometry calls with propagation suspended on every master involved"""
+        queue = self.geometry_queue
+        self.geometry_queue = None
+        masters = {} # (master path, geometry manager) -> master
+        for func, args, kwargs in queue:
+            el = getattr(func, '__self__', None)
+            if not isinstance(el, Misc):
+                continue
+            name = func.__name__
+            if name in ('grid_configure', 'pack_configure'):
+                masters[(str(el.master), name[:4])] = el.master
+            elif name in ('grid_columnconfigure', 'grid_rowconfigure'):
+                masters[(str(el), 'grid')] = el
+        for (_, manager), master in masters.items():
+            getattr(master, f'{manager}_propagate')(False)
+        for func, args, kwargs in queue:
+            func(*args, **kwargs)
+        for (_, manager), master in masters.items():
+            getattr(master, f'{manager}_propagate')(True)
 
     def replace(self, widget_name, new_widget):
         old_widget = self.name_registry[widget_name]
         grid_info = old_widget.el.grid_info()
-        old_widget.el.grid_forget()
-        new_el = new_widget.build(old_widget.parent)
-        new_el.grid(row=grid_info['row'], column=grid_info['column'])
+        grid_info.pop('in', None)
+        parent = old_widget.parent
+        # release first, so the new widget can claim the old tk widgets from the pool
+        old_widget.release()
+        parent.replace_child(old_widget, new_widget)
+        new_el = new_widget.build(parent)
+        new_el.grid(**grid_info)
+        if self.recorder is not None:
+            self.recorder.watch_all()
         
 
+    def replace_child(self, old_child, new_child):
+        if self.window is old_child:
+            self.window = new_child
+
     def set_attr(self, widget_name, prop_name, value):
         self.name_registry[widget_name].el[prop_name] = value
 
     def set_text(self, widget_name, new_text):
         self.set_attr(widget_name, 'text', new_text)
 
+    def set_attrs(self, attrs:dict):
+        """
+        Set options of many named widgets in a single tcl call, all names are checked before anything changes.
+        Called from another thread, the batch is merged with other pending ones and applied on the tk thread.
+        usage:
+            app.set_attrs({'price_1': {'text': '10.5', 'foreground': 'green'}, 'price_2': {'text': '9.8'}})
+        """
+        self._check_names(attrs)
+        if threading.get_ident() == self._thread_id:
+            self._apply_attrs(attrs)
+            return
+        with self._bulk_lock:
+            for name, props in attrs.items():
+                self._queued_attrs.setdefault(name, {}).update(props)
+            self._schedule_bulk()
+
+    def set_texts(self, texts:dict):
+        self.set_attrs({name: {'text': text} for name, text in texts.items()})
+
+    def set_values(self, values:dict):
+        """
+        set_value() on many named widgets, widgets backed by a plain tk variable are set in a single tcl call,
+        the others after it. All names, and whether their widgets take a value, are checked before anything changes.
+        Bindings and traces fire as they would for set_value(). Safe to call from other threads like set_attrs().
+        """
+        self._check_names(values)
+        unsupported = [name for name, widget in ((name, self.name_registry[name]) for name in values)
+                       if widget.value_var() is None and type(widget).set_value is Widget.set_value]
+        if unsupported:
+            raise TypeError(f'no set_value() on widgets named {", ".join(map(repr, unsupported))}')
+        if threading.get_ident() == self._thread_id:
+            self._apply_values(values)
+            return
+        with self._bulk_lock:
+            self._queued_values.update(values)
+            self._schedule_bulk()
+
+    def _check_names(self, updates):
+        missing = [name for name in updates if name not in self.name_registry]
+        if missing:
+            raise KeyError(f'no widgets named {", ".join(map(repr, missing))}')
+
+    def _schedule_bulk(self): # with _bulk_lock held
+        if not self._bulk_scheduled:
+            self._bulk_scheduled = True
+            self.el.after(0, self._flush_bulk)
+
+    def _flush_bulk(self):
+        with self._bulk_lock:
+            attrs, self._queued_attrs = self._queued_attrs, {}
+            values, self._queued_values = self._queued_values, {}
+            self._bulk_scheduled = False
+        # names may have gone away with a replace() since they were checked
+        if attrs:
+            self._apply_attrs({name: props for name, props in attrs.items() if name in self.name_registry})
+        if values:
+            self._apply_values({name: value for name, value in values.items() if name in self.name_registry})
+
+    def _call_bulk(self, proc, words):
+        if not self._bulk_procs:
+            self.el.tk.eval(_BULK_PROCS)
+            self._bulk_procs = True
+        self.el.tk.call(proc, tuple(words))
+
+    def _apply_attrs(self, attrs):
+        words = []
+        for name, props in attrs.items():
+            el = self.name_registry[name].el
+            if el is not None and props:
+                words.append(str(el))
+                words.append(el._options(props)) # the conversions configure() does: trailing _, callbacks, lists
+        if words:
+            self._call_bulk('::tkkit::configure_many', words)
+
+    def _apply_values(self, values):
+        words = []
+        direct = [] # widgets whose set_value does more than writing a variable, set once the batch is in
+        for name, value in values.items():
+            widget = self.name_registry[name]
+            var = widget.value_var()
+            if var is None:
+                direct.append((widget, value))
+            else:
+                words.append(str(var))
+                words.append(value)
+        if words:
+            with program_write:
+                self._call_bulk('::tkkit::set_many', words)
+        for widget, value in direct:
+            widget.set_value(value)
+
     def get_value(self, widget_name):
-        return self.name_registry[widget_name].get_value()
+        widget = self.name_registry[widget_name]
+        if widget.hidden:
+            widget.catch_up()
+        return widget.get_value()
     
     def get_tk(self, widget_name):
         return self.name_registry[widget_name].el
@@ -43,5 +229,28 @@ class TKApp:
     def set_value(self, widget_name, new_value):
         self.name_registry[widget_name].set_value(new_value)
 
+    def record(self, path) -> EventRecorder:
+        """
+        Record user input on named widgets to path (gzipped when it ends with .gz), call after show().
+        A recording can be replayed against a fresh app with replay() to turn a real session into a repeatable test."""
+        self.stop_recording()
+        self.recorder = EventRecorder(self, path)
+        return self.recorder
+
+    def stop_recording(self):
+        if self.recorder is not None:
+            self.recorder.stop()
+            self.recorder = None
+
+    def replay(self, path, speed=1.0) -> ReplayReport:
+        """
+        Replay a recording against this app's named widgets at speed times the recorded pace, or as fast as
+        possible with speed=None. Returns binding and render timings per event kind.
+        usage:
+            app.show(window)
+            print(app.replay("session.jsonl.gz", speed=None))
+        """
+        return replay_events(self, path, speed)
+
     def run(self):
         self.el.mainloop()
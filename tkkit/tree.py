@@ -0,0 +1,69 @@
+from concurrent.futures import ThreadPoolExecutor
+from enum import Enum
+
+class NodeProvider:
+    """
+        Source of the nodes shown by a TreeView, subclass it. Nodes are any hashable ids, None is the hidden root.
+        children() is only called on a worker thread for levels the user expands, so it may be slow (disk, network, database).
+        describe() (text, has_children and values) also runs on a worker, for fetched children and for added or updated nodes.
+        usage:
+            class FolderProvider(NodeProvider):
+                def children(self, node):
+                    path = node or '/'
+                    return [os.path.join(path, name) for name in sorted(os.listdir(path))]
+                def text(self, node):
+                    return os.path.basename(node)
+                def has_children(self, node):
+                    return os.path.isdir(node)
+            TreeView(FolderProvider())
+    """
+    def children(self, node) -> list:
+        raise NotImplementedError('children is not implemented')
+
+    def text(self, node) -> str:
+        return str(node)
+
+    def has_children(self, node) -> bool: # may be optimistic, an empty level just shows no children once expanded
+        return True
+
+    def values(self, node) -> tuple: # one value per TreeView column
+        return ()
+
+    def describe(self, node) -> tuple:
+        return node, self.text(node), self.has_children(node), self.values(node)
+
+class NodeChangeType(Enum):
+    ADD = "add" # (ADD, node, parent), parent None for a top level node
+    REMOVE = "remove" # (REMOVE, node)
+    UPDATE = "update" # (UPDATE, node), text, values and expandability are read again
+    RELOAD = "reload" # (RELOAD, node), children are fetched again, None reloads the whole tree
+
+_executor = None
+
+def _submit(run):
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='tkkit-tree')
+    _executor.submit(run)
+
+def fetch_children(provider:NodeProvider, node, callback):
+    """Describe the children of node on the shared worker pool, callback(descriptions or exception) runs on that worker"""
+    def run():
+        try:
+            result = [provider.describe(child) for child in provider.children(node)]
+        except Exception as e:
+            result = e
+        callback(result)
+    _submit(run)
+
+def describe_nodes(provider:NodeProvider, nodes:list, callback):
+    """Describe nodes on the shared worker pool, callback([description or exception of each node]) runs on that worker"""
+    def run():
+        result = []
+        for node in nodes:
+            try:
+                result.append(provider.describe(node))
+            except Exception as e:
+                result.append(e)
+        callback(result)
+    _submit(run)
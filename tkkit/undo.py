@@ -0,0 +1,178 @@
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager, ExitStack
+from functools import partial
+from .view_model import ViewModelBindable, BindedList, BindedListUpdateType
+
+class UndoJournal:
+    """
+        Undo and redo for bound lists. Each change of a tracked BindedList is journaled as its inverse, which only
+        holds what the change overwrote or removed (a cell's old value, a deleted row), never a copy of the table.
+        Changes less than merge_within seconds apart make one undo step, up to max_step_size changes, so a steady
+        stream of edits doesn't grow one step forever. Past max_steps the oldest steps are dropped.
+        Undo and redo go through the list's own methods, so bound widgets update row by row as for any edit.
+        usage:
+            journal = UndoJournal(vm.rows_)
+            vm.rows.set_cell(3, 1, 'new')
+            journal.undo()
+            with journal.step(): # undone at once, however long it takes
+                for row in selected: vm.rows.set_cell(row, 2, 0)
+    """
+    def __init__(self, *bindables:ViewModelBindable, max_steps=200, merge_within=0.5, max_step_size=1000):
+        self.max_steps = max_steps
+        self.merge_within = merge_within
+        self.max_step_size = max_step_size # changes merged by time, a step() block is never split
+        self._undo = deque(maxlen=max_steps) # steps, each a list of (bindable, op, args) in the order they were made
+        self._redo = []
+        self._open = None # the step changes are added to
+        self._last_at = 0.0
+        self._grouping = 0
+        self._replaying = None # inverses journaled while undoing or redoing, they make the opposite step
+        self._cells = set() # cells and rows in the open step, an earlier entry already restores them
+        self._lists = {} # bindable -> the list its journal is attached to
+        self._subscriptions = []
+        self._lock = threading.RLock()
+        for bindable in bindables:
+            self.track(bindable)
+
+    def track(self, bindable:ViewModelBindable):
+        """Journal the changes of one more field, including replacing its list"""
+        self._attach(bindable)
+        self._subscriptions.append(bindable.subscribe(partial(self._on_change, bindable)))
+
+    def _attach(self, bindable):
+        value = bindable.get_value()
+        previous = self._lists.get(bindable)
+        if isinstance(previous, BindedList) and previous is not value:
+            previous.journal = None
+        if isinstance(value, BindedList):
+            value.journal = partial(self._record, bindable)
+        self._lists[bindable] = value
+        return previous
+
+    def _on_change(self, bindable, value, change_type=None, data=None):
+        if change_type is None and bindable.get_value() is not self._lists.get(bindable):
+            self._record(bindable, 'replace', self._attach(bindable))
+
+    def _record(self, bindable, op, args):
+        with self._lock:
+            entry = (bindable, op, args)
+            if self._replaying is not None:
+                self._replaying.append(entry)
+                return
+            now = time.monotonic()
+            if self._open is None or (not self._grouping and (now - self._last_at > self.merge_within
+                                                              or len(self._open) >= self.max_step_size)):
+                self._open = []
+                self._undo.append(self._open)
+                self._cells.clear()
+            self._last_at = now
+            self._redo.clear()
+            if op == 'set_cell' or op == 'setitem':
+                key = (bindable,) + args[:2] if op == 'set_cell' else (bindable, args[0])
+                if key in self._cells:
+                    return
+                self._cells.add(key)
+            else: # rows may have moved, indexes seen so far don't name the same cells any more
+                self._cells.clear()
+            self._open.append(entry)
+
+    def _apply(self, bindable, op, args):
+        if op == 'replace':
+            bindable.set_value(args)
+            if bindable.get_value() is not self._lists.get(bindable): # thread safe models notify _on_change later
+                self._record(bindable, 'replace', self._attach(bindable))
+            return
+        items = bindable.get_value()
+        if op == 'set_cell':
+            items.set_cell(*args)
+        elif op == 'setitem':
+            items[args[0]] = args[1]
+        elif op == 'pop':
+            items.pop(args)
+        elif op == 'insert':
+            items.insert(*args)
+        elif op == 'truncate':
+            for _ in range(len(items) - args):
+                items.pop()
+        elif op == 'reverse':
+            items.reverse()
+        elif op == 'restore': # the order before a sort, listeners redraw as they do for a sort
+            with items.lock:
+                current = list(items)
+                list.__setitem__(items, slice(None), args)
+                self._record(bindable, 'restore', current)
+                items.notify_func(BindedListUpdateType.SORT, None)
+
+    def _replay(self, source, target) -> bool:
+        with ExitStack() as stack:
+            for vm in {id(bindable.vm): bindable.vm for bindable in self._lists}.values():
+                stack.enter_context(vm.synchronized()) # no other writer gets between the entries of a step
+            with self._lock:
+                if not source:
+                    return False
+                step = source.pop()
+                self._open = None
+                self._replaying = []
+            try:
+                for bindable, op, args in reversed(step):
+                    self._apply(bindable, op, args)
+            finally:
+                with self._lock:
+                    target.append(self._replaying)
+                    self._replaying = None
+        return True
+
+    def undo(self) -> bool:
+        """Revert the last step, False when there's nothing to undo"""
+        return self._replay(self._undo, self._redo)
+
+    def redo(self) -> bool:
+        """Make the last undone step again, False when there's nothing to redo"""
+        return self._replay(self._redo, self._undo)
+
+    @property
+    def can_undo(self) -> bool:
+        return bool(self._undo)
+
+    @property
+    def can_redo(self) -> bool:
+        return bool(self._redo)
+
+    @contextmanager
+    def step(self):
+        """Make every change in the block one undo step"""
+        with self._lock:
+            if not self._grouping:
+                self._open = None
+            self._grouping += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._grouping -= 1
+                if not self._grouping:
+                    self._open = None
+
+    def checkpoint(self):
+        """End the current step, e.g. when the user moves to another cell, the next change starts a new one"""
+        with self._lock:
+            self._open = None
+
+    def clear(self):
+        with self._lock:
+            self._undo.clear()
+            self._redo.clear()
+            self._open = None
+
+    def close(self):
+        """Stop journaling, the lists are no longer watched"""
+        for subscription in self._subscriptions:
+            subscription.dispose()
+        self._subscriptions = []
+        for value in self._lists.values():
+            if isinstance(value, BindedList):
+                value.journal = None
+        self._lists = {}
+        self.clear()
@@ -1,6 +1,16 @@
 from enum import Enum
-from tkinter import Variable
+from tkinter import Variable, TclError
 from typing import Callable, Any
+from bisect import bisect_right
+from collections import deque
+from collections.abc import Sequence
+from contextlib import nullcontext
+from itertools import accumulate, chain
+from functools import partial
+from types import MappingProxyType
+import inspect
+import threading
+import weakref
 
 class BindedListUpdateType(Enum):
     INSERT = "insert"
@@ -14,77 +24,246 @@ class BindedListUpdateType(Enum):
     DELETE_ROW = "delete_row"
     SET_CELL = "set_cell"
 
+_NO_LOCK = nullcontext()
+_model_updates = threading.local() # depth of ViewModel changes being written into tk variables on this thread
+
+def is_model_update() -> bool:
+    """
+    True while a ViewModel change or a set_value() call is written into a tk variable,
+    so a trace can tell it from user input"""
+    return getattr(_model_updates, 'depth', 0) > 0
+
+class _ProgramWrite:
+    """Context for code writing into tk variables, see is_model_update()"""
+    def __enter__(self):
+        _model_updates.depth = getattr(_model_updates, 'depth', 0) + 1
+
+    def __exit__(self, *exc_info):
+        _model_updates.depth -= 1
+
+program_write = _ProgramWrite()
+
 class BindedList(list):
-    def __init__(self, notify_func: Callable[[BindedListUpdateType, Any], None], *args, **kwargs):
+    def __init__(self, notify_func: Callable[[BindedListUpdateType, Any], None], *args, lock=None, **kwargs):
         super().__init__(*args, **kwargs)
         self.notify_func = notify_func
+        self.lock = lock if lock is not None else _NO_LOCK # held across each mutation and its notification
+        self.journal = None # record(op, args) of an UndoJournal, called with the inverse of each change
 
     def append(self, item):
-        super().append(item)
-        self.notify_func(BindedListUpdateType.INSERT, item)
+        with self.lock:
+            super().append(item)
+            if self.journal is not None:
+                self.journal('pop', len(self) - 1)
+            self.notify_func(BindedListUpdateType.INSERT, item)
 
     def __setitem__(self, index, value):
-        if isinstance(value, list):
-            # If setting a row, check if it's a cell update
-            if isinstance(self[index], list) and len(self[index]) == len(value):
-                for i in range(len(value)):
-                    if self[index][i] != value[i]:
-                        self.notify_func(BindedListUpdateType.SET_CELL, (index, i, value[i]))
-        super().__setitem__(index, value)
-        self.notify_func(BindedListUpdateType.SETITEM, (index, value))
+        with self.lock:
+            changed_cells = []
+            old_value = self[index]
+            if isinstance(value, list):
+                # If setting a row, check if it's a cell update
+                if isinstance(old_value, list) and len(old_value) == len(value):
+                    changed_cells = [i for i in range(len(value)) if old_value[i] != value[i]]
+            restore = list(self) if self.journal is not None and isinstance(index, slice) else None
+            super().__setitem__(index, value)
+            if self.journal is not None:
+                if restore is not None:
+                    self.journal('restore', restore)
+                else:
+                    self.journal('setitem', (index if index >= 0 else len(self) + index, old_value))
+            for i in changed_cells:
+                self.notify_func(BindedListUpdateType.SET_CELL, (index, i, value[i]))
+            self.notify_func(BindedListUpdateType.SETITEM, (index, value))
 
     def remove(self, value):
-        index = self.index(value)
-        super().remove(value)
-        self.notify_func(BindedListUpdateType.DELETE_ROW, index)
+        with self.lock:
+            index = self.index(value)
+            removed = self[index]
+            super().remove(value)
+            if self.journal is not None:
+                self.journal('insert', (index, removed))
+            self.notify_func(BindedListUpdateType.DELETE_ROW, index)
 
     def pop(self, index=-1):
-        # Calculate the real index when using negative index
-        if index < 0:
-            index = len(self) + index
-        value = super().pop(index)
-        self.notify_func(BindedListUpdateType.DELETE_ROW, index)
-        return value
+        with self.lock:
+            # Calculate the real index when using negative index
+            if index < 0:
+                index = len(self) + index
+            value = super().pop(index)
+            if self.journal is not None:
+                self.journal('insert', (index, value))
+            self.notify_func(BindedListUpdateType.DELETE_ROW, index)
+            return value
 
     def extend(self, iterable):
-        super().extend(iterable)
-        self.notify_func(BindedListUpdateType.EXTEND, iterable)
+        iterable = list(iterable) # listeners get the items, not a consumed iterator
+        with self.lock:
+            super().extend(iterable)
+            if self.journal is not None:
+                self.journal('truncate', len(self) - len(iterable))
+            self.notify_func(BindedListUpdateType.EXTEND, iterable)
 
     def insert(self, index, value):
-        super().insert(index, value)
-        self.notify_func(BindedListUpdateType.INSERT_AT, (index, value))
+        with self.lock:
+            length = len(self)
+            super().insert(index, value)
+            if self.journal is not None: # the position list.insert clamps index to
+                self.journal('pop', min(max(index + length if index < 0 else index, 0), length))
+            self.notify_func(BindedListUpdateType.INSERT_AT, (index, value))
 
     def sort(self, *, key=None, reverse=False):
-        super().sort(key=key, reverse=reverse)
-        self.notify_func(BindedListUpdateType.SORT, None)
+        with self.lock:
+            restore = list(self) if self.journal is not None else None
+            super().sort(key=key, reverse=reverse)
+            if restore is not None:
+                self.journal('restore', restore)
+            self.notify_func(BindedListUpdateType.SORT, None)
 
     def reverse(self):
-        super().reverse()
-        self.notify_func(BindedListUpdateType.REVERSE, None)
+        with self.lock:
+            super().reverse()
+            if self.journal is not None:
+                self.journal('reverse', None)
+            self.notify_func(BindedListUpdateType.REVERSE, None)
 
     def delete_row(self, index):
         """Custom method to delete a row and notify listeners."""
-        del self[index]
-        self.notify_func(BindedListUpdateType.DELETE_ROW, index)
+        with self.lock:
+            if index < 0:
+                index = len(self) + index
+            removed = self[index] if self.journal is not None else None
+            del self[index]
+            if self.journal is not None:
+                self.journal('insert', (index, removed))
+            self.notify_func(BindedListUpdateType.DELETE_ROW, index)
 
     def set_cell(self, row_index, col_index, value):
         """Custom method to set a cell value and notify listeners."""
-        self[row_index][col_index] = value
-        self.notify_func(BindedListUpdateType.SET_CELL, (row_index, col_index, value))
+        with self.lock:
+            row = self[row_index]
+            old_value = row[col_index]
+            row[col_index] = value
+            if self.journal is not None:
+                self.journal('set_cell', (row_index if row_index >= 0 else len(self) + row_index, col_index, old_value))
+            self.notify_func(BindedListUpdateType.SET_CELL, (row_index, col_index, value))
+
+# list changes a paused subscription can replay from their data alone, other changes make it deliver the whole value
+_REPLAYABLE_CHANGES = frozenset((BindedListUpdateType.INSERT, BindedListUpdateType.EXTEND, BindedListUpdateType.INSERT_AT,
+                                 BindedListUpdateType.DELETE_ROW, BindedListUpdateType.SET_CELL))
+_WHOLE_VALUE = object()
+
+class Subscription:
+    """
+        Handle of a listener added with ViewModelBindable.subscribe, dispose() removes it.
+        A weak subscription holds bound methods weakly and ends by itself once the owner is collected.
+        A paused subscription collects notifications instead: a new value supersedes everything collected before it,
+        list changes are kept in order up to max_collected, and flush() or the last resume() delivers them.
+    """
+    max_collected = 10000 # past that many list changes, the whole value is delivered instead
+
+    def __init__(self, bindable, callback:Callable, owner=None, weak=False):
+        self.bindable = bindable
+        if weak and inspect.ismethod(callback):
+            self._callback = weakref.WeakMethod(callback)
+        else:
+            self._callback = lambda: callback
+        self._owner = weakref.ref(owner) if weak and owner is not None else None
+        self._finalizers = []
+        self.active = True
+        self._paused = 0 # pause() calls not resumed yet
+        self._collected = None # None, _WHOLE_VALUE, or [args of the list changes]
+
+    def add_finalizer(self, func:Callable[[], None]) -> None:
+        """Run func when the subscription is disposed, e.g. to remove a Tk variable trace"""
+        self._finalizers.append(func)
+
+    def __call__(self, *args):
+        callback = self._callback()
+        if callback is None or (self._owner is not None and self._owner() is None):
+            self.dispose()
+            return None
+        if self._paused:
+            self._collect(args)
+            return None
+        return callback(*args)
+
+    def _collect(self, args):
+        collected = self._collected
+        if collected is _WHOLE_VALUE: # the list changes are already in the value delivered at flush
+            return
+        if len(args) == 1 or args[1] not in _REPLAYABLE_CHANGES or (collected is not None and len(collected) >= self.max_collected):
+            self._collected = _WHOLE_VALUE
+        elif collected is None:
+            self._collected = [args]
+        else:
+            collected.append(args)
+
+    def pause(self, times=1) -> None:
+        self._paused += times
+
+    def resume(self) -> None:
+        self._paused -= 1
+        if not self._paused:
+            self.flush()
+
+    def flush(self) -> None:
+        """Deliver what was collected while paused, the subscription stays paused"""
+        collected, self._collected = self._collected, None
+        if collected is None or not self.active:
+            return
+        callback = self._callback()
+        if callback is None:
+            self.dispose()
+            return
+        if collected is _WHOLE_VALUE:
+            callback(self.bindable.get_value())
+            return
+        for args in collected:
+            try:
+                callback(*args)
+            except TypeError: # a listener of plain values, one delivery is enough
+                callback(self.bindable.get_value())
+                return
+
+    def dispose(self) -> None:
+        if not self.active:
+            return
+        self.active = False
+        self.bindable.remove_listener(self)
+        for func in self._finalizers:
+            try:
+                func()
+            except TclError: # the interpreter or variable is already gone
+                pass
+        self._finalizers = []
 
 class ViewModelBindable[T]:
     def __init__(self, vm, attr_name:str):
         self.vm = vm
         self.attr_name = attr_name
         self.listeners = []
+        self._origin = None # listener whose change is being applied, it isn't notified of its own change
         # Wrap list with BindedList if the value is a list
         value = getattr(self.vm, self.attr_name)
         if isinstance(value, list):
-            setattr(self.vm, self.attr_name, BindedList(self._notify_list_change, value))
+            setattr(self.vm, self.attr_name, BindedList(self._notify_list_change, value, lock=vm.synchronized()))
 
     def _notify_list_change(self, change_type: BindedListUpdateType, data: Any):
-        value = getattr(self.vm, self.attr_name)
-        for listener in self.listeners:
+        vm = self.vm
+        sync = vm._sync
+        if sync is None:
+            self._deliver_list_change(getattr(vm, self.attr_name), change_type, data)
+            if vm._owner is not None:
+                vm._notify_owners()
+        else: # called with the model locked, delivered in order once it's unlocked
+            snapshot = sync.publish_change(self.attr_name, getattr(vm, self.attr_name), change_type, data)
+            sync.pending.append(partial(self._deliver_list_change, snapshot, change_type, data))
+            if vm._owner is not None:
+                sync.pending.append(vm._notify_owners)
+
+    def _deliver_list_change(self, value, change_type: BindedListUpdateType, data: Any):
+        for listener in tuple(self.listeners): # listeners may be disposed while notifying
             try:
                 listener(value, change_type, data)
             except TypeError:
@@ -93,22 +272,50 @@ class ViewModelBindable[T]:
     def on_change(self, callback:Callable[[T], None]):
         self.listeners.append(callback)
         return self
+
+    def subscribe(self, callback:Callable[[T], None], owner=None, weak=False) -> Subscription:
+        """
+        Like on_change, but returns a Subscription that can be disposed.
+        With weak=True, bound methods are held weakly and the subscription ends when owner is collected.
+        """
+        subscription = Subscription(self, callback, owner=owner, weak=weak)
+        self.listeners.append(subscription)
+        return subscription
+
+    def remove_listener(self, listener) -> None:
+        try:
+            self.listeners.remove(listener)
+        except ValueError:
+            pass
     
     def get_value(self) -> T:
         return getattr(self.vm, self.attr_name)
     
     def set_value(self, new_value:T) -> None:
         if isinstance(new_value, list):
-            new_value = BindedList(self._notify_list_change, new_value)
+            new_value = BindedList(self._notify_list_change, new_value, lock=self.vm.synchronized())
         return setattr(self.vm, self.attr_name, new_value)
 
+    def set_value_from(self, origin, new_value:T) -> None:
+        """Set the value on behalf of a listener (e.g. a bound tk variable), which is not notified back"""
+        with self.vm.synchronized():
+            self._origin = origin
+            try:
+                self.set_value(new_value)
+            finally:
+                self._origin = None
+
     def notify(self) -> None:
         """
         Notify all listeners that the value has changed.
         """
-        value = getattr(self.vm, self.attr_name)
+        self._deliver(getattr(self.vm, self.attr_name), self._origin)
+
+    def _deliver(self, value, origin=None) -> None:
         # Pass the new value to the listener
-        for listener in self.listeners:
+        for listener in tuple(self.listeners):
+            if listener is origin: # don't echo a change back to where it came from
+                continue
             try:
                 listener(value)
             except TypeError:
@@ -116,27 +323,540 @@ class ViewModelBindable[T]:
                 if isinstance(value, BindedList):
                     pass  # List changes are handled by _notify_list_change
 
-    def connect_tk_var(self, tk_var:Variable, true_to_one=False) -> None:
+    def connect_tk_var(self, tk_var:Variable, true_to_one=False, owner=None) -> Subscription:
+        # last value known to be in tk_var, so unchanged values are skipped without a Tcl round-trip
+        last_value = tk_var.get()
+        writing = False
+
         # Update Tkinter variable when ViewModelBindable changes
         def update_tk_var(value):
-            # Only update tk_var if the value is different
+            nonlocal last_value, writing
             tk_value = value
             if true_to_one: # used to convert tk Variable's checkbox binding
                 tk_value = 1 if value else 0
-            if tk_value != tk_var.get():
-                tk_var.set(tk_value)
+            if tk_value != last_value:
+                last_value = tk_value
+                writing = True
+                _model_updates.depth = getattr(_model_updates, 'depth', 0) + 1
+                try:
+                    tk_var.set(tk_value)
+                finally:
+                    writing = False
+                    _model_updates.depth -= 1
 
-        self.on_change(update_tk_var)
+        subscription = self.subscribe(update_tk_var, owner=owner, weak=owner is not None)
 
         # Update ViewModelBindable when Tkinter variable changes
         def update_view_model(*args):
-            new_value = tk_var.get()
+            nonlocal last_value
+            if writing: # the trace of our own write in update_tk_var
+                return
+            new_value = last_value = tk_var.get()
             if true_to_one:
                 new_value = True if new_value else False
-            setattr(self.vm, self.attr_name, new_value)
+            self.set_value_from(subscription, new_value)
+
+        trace_name = tk_var.trace_add("write", update_view_model)
+        subscription.add_finalizer(lambda: tk_var.trace_remove("write", trace_name))
+        return subscription
+
+    # operators, each returns a bindable derived from this one that widgets and listeners can bind to
+
+    def map(self, func:Callable[[T], Any]) -> 'DerivedBindable':
+        """func(value) of each value"""
+        return MappedBindable(self, func)
+
+    def filter(self, predicate:Callable[[T], bool]) -> 'DerivedBindable':
+        """Only the values predicate accepts"""
+        return FilteredBindable(self, predicate)
+
+    def distinct(self, key:Callable[[T], Any]=None) -> 'DerivedBindable':
+        """Only values that differ from the last one passed on (or whose key differs)"""
+        return DistinctBindable(self, key)
+
+    def debounce(self, seconds:float, master) -> 'DerivedBindable':
+        """The latest value once no change came for seconds, e.g. search after typing pauses"""
+        return DebouncedBindable(self, seconds, master)
+
+    def throttle(self, seconds:float, master) -> 'DerivedBindable':
+        """At most one value per seconds: the first change right away, the latest one when the interval ends"""
+        return ThrottledBindable(self, seconds, master)
+
+
+def _compares_elementwise(value):
+    return value.__class__.__name__ in ("DataFrame", "Series", "ndarray")
+
+def _has_changed(old_value, value):
+    # Use a more robust comparison, DataFrames and numpy arrays compare element-wise
+    return (_compares_elementwise(value) or _compares_elementwise(old_value)
+            or old_value != value and (old_value is not None or value is not None))
+
+def _freeze_items(items):
+    return tuple(_freeze(item) if isinstance(item, (list, dict)) else item for item in items)
+
+def _freeze(value):
+    if isinstance(value, list):
+        return _freeze_items(value)
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    return value
+
+class FrozenList(Sequence):
+    """
+        Immutable copy of a list field in the snapshots of a thread safe ViewModel, compares equal to tuples and
+        lists with the same items. The items are kept in chunks, and the copy made after a change shares every
+        chunk the change didn't touch, so a change costs about the square root of the length, not a full copy.
+    """
+    __slots__ = ('_chunks', '_ends')
+    CHUNK = 512
+
+    def __init__(self, items=()):
+        items = tuple(items)
+        size = self.CHUNK
+        self._chunks = tuple(items[start:start + size] for start in range(0, len(items), size))
+        self._ends = tuple(accumulate(len(chunk) for chunk in self._chunks))
+
+    @classmethod
+    def _of(cls, chunks, ends):
+        frozen = cls.__new__(cls)
+        frozen._chunks = chunks
+        frozen._ends = ends
+        return frozen
+
+    def __len__(self):
+        return self._ends[-1] if self._ends else 0
+
+    def _locate(self, index):
+        chunk = bisect_right(self._ends, index)
+        return chunk, index - (self._ends[chunk - 1] if chunk else 0)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return tuple(self)[index]
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError('FrozenList index out of range')
+        chunk, offset = self._locate(index)
+        return self._chunks[chunk][offset]
+
+    def __iter__(self):
+        return chain.from_iterable(self._chunks)
+
+    def __eq__(self, other):
+        if isinstance(other, (FrozenList, tuple, list)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(tuple(self))
+
+    def __repr__(self):
+        return f'FrozenList({list(self)!r})'
+
+    def __reduce__(self):
+        return FrozenList, (tuple(self),)
+
+    def _splice(self, chunk, replacement):
+        """A copy with chunk replaced by the replacement chunks, the chunks before it are shared"""
+        chunks = self._chunks[:chunk] + tuple(part for part in replacement if part) + self._chunks[chunk + 1:]
+        return FrozenList._of(chunks, tuple(accumulate(len(part) for part in chunks)))
+
+    def appended(self, items:tuple) -> 'FrozenList':
+        if not self._chunks:
+            return FrozenList(items)
+        size = self.CHUNK
+        last = self._chunks[-1] + items[:max(0, size - len(self._chunks[-1]))]
+        rest = items[len(last) - len(self._chunks[-1]):]
+        return self._splice(len(self._chunks) - 1,
+                            (last,) + tuple(rest[start:start + size] for start in range(0, len(rest), size)))
+
+    def replaced(self, index, item) -> 'FrozenList':
+        chunk, offset = self._locate(index)
+        part = self._chunks[chunk]
+        part = part[:offset] + (item,) + part[offset + 1:]
+        return FrozenList._of(self._chunks[:chunk] + (part,) + self._chunks[chunk + 1:], self._ends)
+
+    def inserted(self, index, item) -> 'FrozenList':
+        length = len(self)
+        index = min(max(index + length if index < 0 else index, 0), length) # where list.insert puts it
+        if index == length:
+            return self.appended((item,))
+        chunk, offset = self._locate(index)
+        part = self._chunks[chunk]
+        part = part[:offset] + (item,) + part[offset:]
+        half = len(part) // 2
+        return self._splice(chunk, (part[:half], part[half:]) if len(part) > 2 * self.CHUNK else (part,))
+
+    def deleted(self, index) -> 'FrozenList':
+        chunk, offset = self._locate(index)
+        part = self._chunks[chunk]
+        return self._splice(chunk, (part[:offset] + part[offset + 1:],))
+
+def _freeze_change(previous:FrozenList, value:list, change_type:BindedListUpdateType, data):
+    """The frozen list after one change, sharing what didn't change with the previous frozen copy"""
+    if change_type == BindedListUpdateType.INSERT:
+        return previous.appended((_freeze(data),))
+    if change_type == BindedListUpdateType.EXTEND:
+        return previous.appended(_freeze_items(data))
+    if change_type == BindedListUpdateType.INSERT_AT:
+        index, item = data
+        return previous.inserted(index, _freeze(item))
+    if change_type == BindedListUpdateType.DELETE_ROW:
+        return previous.deleted(data + len(previous) if data < 0 else data)
+    if change_type in (BindedListUpdateType.SETITEM, BindedListUpdateType.SET_CELL) and isinstance(data[0], int):
+        index = data[0] + len(value) if data[0] < 0 else data[0]
+        return previous.replaced(index, _freeze(value[index]))
+    return None # sorted or reversed, frozen again as a whole
+
+class DerivedBindable(ViewModelBindable):
+    """
+        Bindable computed from a source bindable by an operator. It listens to its source only while it has
+        listeners itself, so a derived bindable dropped by its widgets costs nothing. Writes (e.g. from a bound
+        tk variable) go to the source. Timed operators run on the tk after() loop of master, a TKApp or a widget,
+        changes from other threads are handed to the tk thread first.
+        usage:
+            vm.query_.debounce(0.3, app).on_change(search)
+            Label(vm.level_.throttle(0.1, app).map(lambda level: f'{level:.0f}%').distinct())
+    """
+    def __init__(self, source:ViewModelBindable):
+        # there's no field behind a derived bindable, the value is kept here
+        self.vm = source.vm
+        self.attr_name = source.attr_name
+        self.listeners = []
+        self._origin = None
+        self.source = source
+        self._subscription = None
+        self._value = None
+
+    def _initial(self):
+        """The value when not listening to the source"""
+        return self.source.get_value()
 
-        tk_var.trace_add("write", update_view_model)
+    def _on_source_change(self, value, change_type=None, data=None):
+        self._emit(value)
 
+    def _emit(self, value):
+        self._value = value
+        self._deliver(value, self._origin)
+
+    def _listen(self):
+        if self._subscription is None:
+            self._value = self._initial()
+            self._subscription = self.source.subscribe(self._on_source_change)
+
+    def on_change(self, callback):
+        self._listen()
+        return super().on_change(callback)
+
+    def subscribe(self, callback, owner=None, weak=False) -> Subscription:
+        self._listen()
+        return super().subscribe(callback, owner=owner, weak=weak)
+
+    def remove_listener(self, listener) -> None:
+        super().remove_listener(listener)
+        if not self.listeners:
+            self.dispose()
+
+    def dispose(self) -> None:
+        """Stop listening to the source, until a listener is added again"""
+        if self._subscription is not None:
+            self._subscription.dispose()
+            self._subscription = None
+
+    def get_value(self):
+        return self._value if self._subscription is not None else self._initial()
+
+    def set_value(self, new_value) -> None:
+        self.source.set_value(new_value)
+
+    def notify(self) -> None:
+        self._deliver(self.get_value(), self._origin)
+
+class MappedBindable(DerivedBindable):
+    def __init__(self, source, func):
+        super().__init__(source)
+        self.func = func
+
+    def _initial(self):
+        return self.func(self.source.get_value())
+
+    def _on_source_change(self, value, change_type=None, data=None):
+        self._emit(self.func(value))
+
+    def set_value(self, new_value) -> None: # there's no way back through func, the value is kept until the source changes
+        self._emit(new_value)
+
+class FilteredBindable(DerivedBindable):
+    def __init__(self, source, predicate):
+        super().__init__(source)
+        self.predicate = predicate
+
+    def _initial(self):
+        value = self.source.get_value()
+        return value if self.predicate(value) else self._value
+
+    def _on_source_change(self, value, change_type=None, data=None):
+        if self.predicate(value):
+            self._emit(value)
+
+class DistinctBindable(DerivedBindable):
+    def __init__(self, source, key=None):
+        super().__init__(source)
+        self.key = key
+        self._last_key = None
+
+    def _key(self, value):
+        key = self.key(value) if self.key is not None else value
+        return _freeze(key) # a list changed in place must not compare equal to itself
+
+    def _initial(self):
+        value = self.source.get_value()
+        self._last_key = self._key(value)
+        return value
+
+    def _on_source_change(self, value, change_type=None, data=None):
+        key = self._key(value)
+        if _has_changed(self._last_key, key):
+            self._last_key = key
+            self._emit(value)
+
+class _TimedBindable(DerivedBindable):
+    def __init__(self, source, seconds, master):
+        if master is None:
+            raise ValueError(f'{type(self).__name__} needs master, the TKApp or widget whose after() loop runs its timer')
+        super().__init__(source)
+        self.ms = max(0, round(seconds * 1000))
+        self.master = master # a TKApp, a tkkit widget or a tk widget
+        app = getattr(master, 'app', None)
+        # tk is only touched from the thread that made it, the thread that sets up the operator for a tk widget
+        self._thread_id = getattr(app, '_thread_id', None) or threading.get_ident()
+        self._lock = threading.Lock()
+        self._incoming = None # the latest value from another thread, taken on the tk thread
+        self._hop_scheduled = False
+        self._latest = None
+        self._timer = None
+
+    def _tk(self):
+        return getattr(self.master, 'el', self.master)
+
+    def _on_source_change(self, value, change_type=None, data=None):
+        if threading.get_ident() == self._thread_id:
+            self._on_value(value)
+            return
+        # e.g. a field set from a button handler, which runs on a worker thread
+        with self._lock:
+            self._incoming = value
+            scheduled, self._hop_scheduled = self._hop_scheduled, True
+        if not scheduled:
+            self._tk().after(0, self._take_incoming)
+
+    def _take_incoming(self):
+        with self._lock:
+            value, self._incoming = self._incoming, None
+            self._hop_scheduled = False
+        if self._subscription is not None: # not disposed in the meantime
+            self._on_value(value)
+
+    def _on_value(self, value):
+        raise NotImplementedError
+
+    def dispose(self) -> None:
+        super().dispose()
+        timer, self._timer = self._timer, None
+        if timer is not None:
+            try:
+                self._tk().after_cancel(timer)
+            except TclError:
+                pass
+
+class DebouncedBindable(_TimedBindable):
+    def _on_value(self, value):
+        self._latest = value
+        if self._timer is not None:
+            self._tk().after_cancel(self._timer)
+        self._timer = self._tk().after(self.ms, self._fire)
+
+    def _fire(self):
+        self._timer = None
+        self._emit(self._latest)
+
+class ThrottledBindable(_TimedBindable):
+    def __init__(self, source, seconds, master):
+        super().__init__(source, seconds, master)
+        self._trailing = False # a change came in during the current interval
+
+    def _on_value(self, value):
+        self._latest = value
+        if self._timer is not None:
+            self._trailing = True
+            return
+        self._timer = self._tk().after(self.ms, self._interval_end) # the interval starts with this value
+        self._emit(value)
+
+    def _interval_end(self):
+        if not self._trailing:
+            self._timer = None
+            return
+        self._trailing = False
+        self._timer = self._tk().after(self.ms, self._interval_end) # the value sent now starts a new interval
+        self._emit(self._latest)
+
+class PathBindable(ViewModelBindable):
+    """
+        Bindable of a field of a nested ViewModel, reached from the outermost model, e.g. vm.order.customer.name_.
+        The path is resolved once and kept, reads and writes go straight to the field. It is resolved again only
+        when a model on the path is replaced, then listeners get the new field's value if it differs.
+        While the path is broken (a model on it is None or another value) the value is default, '' so that bound
+        labels and entries clear; set it on the bindable for another fallback.
+    """
+    default = ''
+
+    def __init__(self, root, path:tuple):
+        self.vm = root
+        self.attr_name = '.'.join(path)
+        self.path = path
+        self.listeners = []
+        self._origin = None
+        self._field = None # bindable of the field the path resolves to, None while it is broken
+        self._subscription = None # to the field, held while this has listeners
+        self._routes = [] # (model, name) of the models the path goes through
+        self._resolve()
+
+    def _resolve(self) -> bool:
+        """Walk the path from the root, True when it leads to another field than before"""
+        for model, name in self._routes:
+            model._routes[name].discard(self)
+        self._routes = []
+        model = self.vm
+        for name in self.path[:-1]:
+            model._routes.setdefault(name, set()).add(self)
+            self._routes.append((model, name))
+            model = getattr(model, name)
+            if not isinstance(model, ViewModel):
+                model = None
+                break
+        field = model._bindable(self.path[-1]) if model is not None else None
+        if field is self._field:
+            return False
+        self._field = field
+        if self._subscription is not None:
+            self._subscription.dispose()
+            self._subscription = None
+        if field is not None and self.listeners: # also after the path was broken, when nothing was subscribed
+            self._subscription = field.subscribe(self._on_field_change)
+        return True
+
+    def _reroute(self):
+        """A model on the path was replaced"""
+        old_value = self.get_value()
+        if self._resolve() and _has_changed(old_value, self.get_value()):
+            self.notify()
+
+    def _on_field_change(self, value, change_type=None, data=None):
+        if change_type is None:
+            self._deliver(value, self._origin)
+        else:
+            self._deliver_list_change(value, change_type, data)
+
+    def _listen(self):
+        if self._subscription is None and self._field is not None:
+            self._subscription = self._field.subscribe(self._on_field_change)
+
+    def on_change(self, callback):
+        self._listen()
+        return super().on_change(callback)
+
+    def subscribe(self, callback, owner=None, weak=False) -> Subscription:
+        self._listen()
+        return super().subscribe(callback, owner=owner, weak=weak)
+
+    def remove_listener(self, listener) -> None:
+        super().remove_listener(listener)
+        if not self.listeners and self._subscription is not None:
+            self._subscription.dispose()
+            self._subscription = None
+
+    def get_value(self):
+        field = self._field
+        return field.get_value() if field is not None else self.default
+
+    def set_value(self, new_value) -> None:
+        field = self._field
+        if field is None:
+            raise AttributeError(f"can't set {self.attr_name}, a model on the path is missing")
+        field.set_value(new_value)
+
+    def notify(self) -> None:
+        self._deliver(self.get_value(), self._origin)
+
+class _ModelSync:
+    """
+        Write lock of a thread-safe ViewModel. Notifications queued while it is held are delivered in order
+        once it is released, outside the lock, so a listener waiting on the tk thread can't deadlock a writer.
+    """
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._depth = 0
+        self._draining = False
+        self.pending = deque() # notifications, in the order of the writes they describe
+        self.snapshot = MappingProxyType({}) # replaced, never mutated, so it can be read without the lock
+        self._staged = None # the next snapshot, published when the outermost lock is released
+
+    def __enter__(self):
+        self._lock.acquire()
+        self._depth += 1
+        return self
+
+    def __exit__(self, *exc_info):
+        self._depth -= 1
+        outermost = self._depth == 0
+        if outermost and self._staged is not None:
+            self.snapshot = MappingProxyType(self._staged)
+            self._staged = None
+        self._lock.release()
+        if outermost and self.pending:
+            self._drain()
+
+    def publish(self, name, value):
+        """Stage a frozen copy of value for the next snapshot, called with the lock held"""
+        frozen = FrozenList(_freeze_items(value)) if isinstance(value, list) else _freeze(value)
+        if self._staged is None:
+            self._staged = dict(self.snapshot)
+        self._staged[name] = frozen
+        return frozen
+
+    def publish_change(self, name, value:list, change_type:BindedListUpdateType, data):
+        """Like publish, for one change of a bound list"""
+        previous = (self._staged if self._staged is not None else self.snapshot).get(name)
+        if not isinstance(previous, FrozenList):
+            return self.publish(name, value)
+        frozen = _freeze_change(previous, value, change_type, data)
+        if frozen is None or len(frozen) != len(value): # mutated behind BindedList's back, e.g. by clear()
+            return self.publish(name, value)
+        if self._staged is None:
+            self._staged = dict(self.snapshot)
+        self._staged[name] = frozen
+        return frozen
+
+    def _drain(self):
+        with self._lock:
+            if self._draining: # another thread, or a write from a listener of this one, is delivering
+                return
+            self._draining = True
+        while True:
+            with self._lock:
+                if not self.pending:
+                    self._draining = False
+                    return
+                deliver = self.pending.popleft()
+            try:
+                deliver()
+            except BaseException:
+                with self._lock:
+                    self._draining = False
+                raise
 
 class ViewModel:
     """
@@ -145,26 +865,151 @@ class ViewModel:
             vm.text = "Hello"
             Label(vm.text_) # bind vm.text to Label's text property
             vm.text = "World" # Label's text property will be updated
+
+        A ViewModel assigned to a field of another one is nested, bindings through it follow the path from the
+        outermost model, so they move to the new model when one on the path is replaced. A change notifies the
+        listeners of that field, and of the fields holding its models (vm.order_), not the other fields:
+            vm.order = Order()
+            vm.order.customer = Customer()
+            Label(vm.order.customer.name_)
+            vm.order.customer.name = "Ada" # only the label of the name and listeners of vm.order_ are notified
+            vm.order = Order() # the label shows the new order's customer name
+        A model belongs to the field it was last assigned to.
+
+        With ViewModel(thread_safe=True), fields and bound lists can be written from any thread:
+        writes are serialized per model, listeners get immutable snapshots (lists become FrozenLists) that match
+        the change they are told about, and vm.snapshot() reads a consistent copy of all fields without locking.
+            with vm.synchronized(): # several writes seen together by snapshot readers
+                vm.done += 1
+                vm.results.append(row)
     """
-    def __init__(self):
+    def __init__(self, thread_safe=False):
         self._listeners = {} # attr_name -> ViewModelBindable
+        self._sync = _ModelSync() if thread_safe else None
+        self._owner = None # (weakref of the model, field name) holding this model, when it is nested
+        self._routes = {} # field name -> PathBindables whose path goes through the model in that field
+        self._paths = {} # path -> PathBindable, of the paths starting at this model
 
     def __getattribute__(self, name:str):
-        if name.endswith('_'):
-            attr_name = name[:-1]
-            if attr_name not in self._listeners:
-                self._listeners[attr_name] = ViewModelBindable(self, attr_name)
-            return self._listeners[attr_name]
+        if name.endswith('_') and not name.startswith('__'):
+            if self._owner is not None:
+                return self._path_bindable(name[:-1])
+            return self._bindable(name[:-1])
         return object.__getattribute__(self, name)
+
+    def _bindable(self, attr_name) -> ViewModelBindable:
+        listeners = self._listeners
+        if attr_name not in listeners:
+            with self.synchronized():
+                if attr_name not in listeners:
+                    listeners[attr_name] = ViewModelBindable(self, attr_name)
+        return listeners[attr_name]
+
+    def _path_bindable(self, attr_name) -> ViewModelBindable:
+        path = [attr_name]
+        model = self
+        while model._owner is not None:
+            parent = model._owner[0]()
+            if parent is None:
+                break
+            path.append(model._owner[1])
+            model = parent
+        if model is self:
+            return self._bindable(attr_name)
+        path = tuple(reversed(path))
+        bindable = model._paths.get(path)
+        if bindable is None:
+            with model.synchronized():
+                bindable = model._paths.get(path)
+                if bindable is None:
+                    bindable = model._paths[path] = PathBindable(model, path)
+        return bindable
+
+    def _holds(self, model) -> bool:
+        """True when model is this one or one of the models holding it"""
+        holder = self
+        while holder is not model:
+            owner = holder._owner
+            holder = owner[0]() if owner is not None else None
+            if holder is None:
+                return False
+        return True
+
+    def _adopt(self, name, old_value, value):
+        """Move the nesting link from the model replaced in a field to the one assigned"""
+        if isinstance(old_value, ViewModel) and old_value._owner is not None and old_value._owner[1] == name \
+                and old_value._owner[0]() is self:
+            object.__setattr__(old_value, '_owner', None)
+        if isinstance(value, ViewModel) and not self._holds(value): # a model can't be nested in itself
+            object.__setattr__(value, '_owner', (weakref.ref(self), name))
+
+    def _field_replaced(self, name):
+        """Resolve the paths through the field again and tell the fields holding this model"""
+        routes = self._routes.get(name)
+        if routes:
+            for bindable in tuple(routes):
+                bindable._reroute()
+        if self._owner is not None:
+            self._notify_owners()
+
+    def _notify_owners(self):
+        """Notify the listeners of the fields holding this model, up to the outermost one, of a change inside"""
+        owner = self._owner
+        while owner is not None:
+            model = owner[0]()
+            if model is None:
+                return
+            bindable = model._listeners.get(owner[1])
+            if bindable is not None and bindable.listeners:
+                bindable.notify()
+            owner = model._owner
     
     def __getattr__(self, name):
         return 0
 
+    def synchronized(self):
+        """Context that holds the model's write lock, a no-op unless the model is thread safe"""
+        sync = self.__dict__.get('_sync')
+        return sync if sync is not None else _NO_LOCK
+
+    def snapshot(self) -> MappingProxyType:
+        """Read-only copy of the fields, consistent across fields and lock-free for thread safe models"""
+        sync = self.__dict__.get('_sync')
+        if sync is not None:
+            return sync.snapshot
+        return MappingProxyType({name: _freeze(value) for name, value in self.__dict__.items() if not name.startswith('_')})
+
+    def _current(self, name):
+        """The value of a field, None when it isn't set (not the 0 of __getattr__)"""
+        try:
+            return object.__getattribute__(self, name)
+        except AttributeError:
+            return None
+
     def __setattr__(self, name, value):
-        old_value = None
-        if hasattr(self, name):
-            old_value = getattr(self, name)
+        sync = self.__dict__.get('_sync')
+        field = not name.startswith('_')
+        if sync is not None and field:
+            with sync:
+                bindable = self._listeners.get(name)
+                if bindable is not None and isinstance(value, list) and not isinstance(value, BindedList):
+                    value = BindedList(bindable._notify_list_change, value, lock=sync)
+                old_value = self._current(name)
+                object.__setattr__(self, name, value)
+                snapshot = sync.publish(name, value)
+                if _has_changed(old_value, value):
+                    if field and (isinstance(value, ViewModel) or isinstance(old_value, ViewModel)):
+                        self._adopt(name, old_value, value)
+                    if bindable is not None:
+                        sync.pending.append(partial(bindable._deliver, snapshot, bindable._origin))
+                    sync.pending.append(partial(self._field_replaced, name))
+            return
+        old_value = self._current(name)
         object.__setattr__(self, name, value)
-        # Use a more robust comparison
-        if (value.__class__.__name__ == "DataFrame" or old_value != value and (old_value is not None or value is not None)) and name in self._listeners:
-            self._listeners[name].notify()
\ No newline at end of file
+        if _has_changed(old_value, value):
+            if field and (isinstance(value, ViewModel) or isinstance(old_value, ViewModel)):
+                self._adopt(name, old_value, value)
+            if name in self._listeners:
+                self._listeners[name].notify()
+            if field:
+                self._field_replaced(name)
@@ -3,11 +3,19 @@ import tkinter as tk
 from tkinter.scrolledtext import ScrolledText
 from tkinter import ttk
 from tkinter import filedialog 
+import os
 import threading
-from functools import reduce
+from collections import deque, OrderedDict
+from functools import partial, reduce
+from types import MappingProxyType
 from .view_model import ViewModelBindable
 from typing import Self, List, Any, Optional
-from .view_model import ViewModelBindable, BindedListUpdateType
+from .view_model import ViewModelBindable, BindedListUpdateType, Subscription, program_write
+from .export import TableExport
+from .series import RingBuffer, as_samples, envelope, line_coords
+from .images import RawImage, FrameStream, ImageLoader, ImageCache, is_raw_frame
+from .tree import NodeProvider, NodeChangeType, fetch_children, describe_nodes
+from .search import PrefixIndex
 
 def get_sticky(align:str, vertical_align:str):
     """
@@ -21,18 +29,46 @@ def get_sticky(align:str, vertical_align:str):
     else:
         return sticky
 
+EMPTY_STYLES = MappingProxyType({})
+_DESCRIBED_CHANGES = (NodeChangeType.ADD, NodeChangeType.UPDATE) # tree changes whose nodes are described on a worker
+_interned_styles = {}
+_square_paddings = {}
+
+def intern_styles(styles:dict):
+    """
+    Returns a shared read-only copy of the styles, so that large forms with the same
+    styles on every widget hold a single dict."""
+    if not styles:
+        return EMPTY_STYLES
+    try:
+        key = frozenset(styles.items())
+    except TypeError: # unhashable style values are kept per widget
+        return MappingProxyType(styles)
+    shared = _interned_styles.get(key)
+    if shared is None:
+        shared = MappingProxyType(styles)
+        if len(_interned_styles) < 4096:
+            _interned_styles[key] = shared
+    return shared
+
 class Widget:
+    # subclasses declare their own attributes in __slots__, so specs of large forms carry no __dict__
+    __slots__ = ('styles', 'align', 'vertical_align', 'expand', 'name', 'padding', 'el', 'subscriptions',
+                 'app', 'name_registry', 'parent', 'var_to_bind', 'hidden', '__weakref__')
+
     # override if there's additional arguments
     def __init__(self, name:str=None, align=None, vertical_align=None, expand=0, padding=(0, 0), **kwargs):
-        self.styles = kwargs
+        self.styles = intern_styles(kwargs)
         self.align = align
         self.vertical_align = vertical_align
         self.expand = expand
         self.name:str = name
         self.padding:str = padding
         self.el:tk.Widget = None
+        self.subscriptions:tuple[Subscription, ...] = ()
+        self.hidden = 0 # number of ancestors hiding this widget (unselected tabs, false ShowIfs)
         if isinstance(padding, int): # padding could be int, or (int, int) as (padx, pady)
-            self.padding = (padding, padding)
+            self.padding = _square_paddings.setdefault(padding, (padding, padding))
 
     def bind_var(self): # override if there's binding variable, none for skipping
         return None
@@ -41,42 +77,143 @@ class Widget:
         return self.var_to_bind.get()
     
     def set_value(self, value):
-        self.var_to_bind.set(value)
+        with program_write:
+            self.var_to_bind.set(value)
+
+    def value_var(self): # the tk variable set_value writes as is, None when setting a value takes more than that
+        return self.var_to_bind if type(self).set_value is Widget.set_value else None
 
     def post_container_build(self):
         pass
 
+    def observe(self, bindable:ViewModelBindable, callback) -> Subscription:
+        """
+        Listen to a bindable while this widget lives. The listener is held weakly and
+        disposed when the widget is released or its tk widget is destroyed."""
+        subscription = bindable.subscribe(callback, owner=self, weak=True)
+        if self.hidden:
+            subscription.pause(self.hidden)
+        self.subscriptions += (subscription,)
+        return subscription
+
+    def connect(self, bindable:ViewModelBindable, tk_var:tk.Variable, true_to_one=False) -> Subscription:
+        """Two-way bind a tk variable to a bindable for as long as this widget lives"""
+        subscription = bindable.connect_tk_var(tk_var, true_to_one=true_to_one, owner=self)
+        if self.hidden:
+            subscription.pause(self.hidden)
+        self.subscriptions += (subscription,)
+        return subscription
+
+    def set_hidden(self, hidden:bool):
+        """
+        Called by containers that hide or show this subtree. While hidden, bound updates are only collected,
+        and delivered in one pass once no ancestor hides the widget anymore."""
+        self.hidden += 1 if hidden else -1
+        for subscription in self.subscriptions:
+            if hidden:
+                subscription.pause()
+            else:
+                subscription.resume()
+        for child in self.get_child_widgets():
+            child.set_hidden(hidden)
+
+    def catch_up(self):
+        """Apply the updates collected while hidden without showing the widget, e.g. before reading its value"""
+        for subscription in self.subscriptions:
+            subscription.flush()
+
+    def dispose(self):
+        for subscription in self.subscriptions:
+            subscription.dispose()
+        self.subscriptions = ()
+
+    def _on_destroy(self, event):
+        self.dispose()
+
+    def create_tk(self, factory, master, **options) -> tk.Widget:
+        """
+        Create the tk widget with this widget's styles, or claim an idle one of the same class
+        and styles from the app's widget pool."""
+        if self.app.widget_pool is None:
+            return factory(master, **options, **self.styles)
+        return self.app.widget_pool.create(factory, master, self.styles, options)
+
+    def get_child_widgets(self) -> List[Self]:
+        return []
+
+    def reset_tk_widget(self): # override to clear content that options don't cover before the tk widget is pooled
+        pass
+
+    def release(self):
+        """
+        Give the tk widgets of this subtree back to the app's widget pool, or destroy them without a pool."""
+        if self.el is None:
+            return
+        for child in self.get_child_widgets():
+            child.release()
+        self.dispose()
+        if self.name is not None and self.name_registry.get(self.name) is self:
+            del self.name_registry[self.name]
+        if self.app.widget_pool is None:
+            self.el.destroy()
+        else:
+            self.reset_tk_widget()
+            self.app.widget_pool.release(self.el)
+        self.el = None
+
+    def defer(self, func, *args, **kwargs):
+        """
+        Run a geometry call (grid, pack, row/columnconfigure) now, or queue it until the whole
+        tree is built when the app builds in deferred mode."""
+        queue = self.app.geometry_queue
+        if queue is None:
+            func(*args, **kwargs)
+        else:
+            queue.append((func, args, kwargs))
+
     def build(self, parent:Self) -> tk.Widget: # should never be overridden
+        self.app = parent.app
         self.name_registry = parent.name_registry
         if self.align is None and parent.align != 'fill':
             self.align = parent.align
         if self.vertical_align is None and parent.align != 'fill':
             self.vertical_align = parent.vertical_align
         self.parent = parent
+        self.hidden = getattr(parent, 'hidden', 0)
         self.var_to_bind = self.bind_var()
         if self.name is not None and self.name not in self.name_registry:
             self.name_registry[self.name] = self
         self.el = self.layout_tk_widget(parent)
+        if self.subscriptions and self.el is not None:
+            self.el.bind('<Destroy>', self._on_destroy, add='+')
         return self.el
 
+    def replace_child(self, old_child:Self, new_child:Self):
+        pass
+
     def layout_tk_widget(self, parent) -> tk.Widget:
         raise NotImplementedError('layout_tk_widget is not implemented')
 
 class WrapperWidget(Widget):
+    __slots__ = ('children',)
+
     def __init__(self, children, **kwargs):
         self.children = children
         super().__init__(**kwargs)
 
 class Container(Widget):
-    def __init__(self, children=None, expand=1, align='fill', name=None, gap=0, **kwargs):
+    __slots__ = ('children', 'gap', 'weights')
+
+    def __init__(self, children=None, expand=1, align='fill', name=None, gap=0, weights=None, **kwargs):
         self.children = children
         self.gap = gap
+        self.weights = weights # grid weight per real child, overrides child.expand (set by the layout compiler)
         super().__init__(name=name, expand=expand, align=align, **kwargs)
 
     def build(self, parent:Self) -> tk.Widget:
         super().build(parent)
         for child in self.children:
-            child.post_container_build()
+            self.defer(child.post_container_build)
         return self.el
 
     def get_real_children(self):
@@ -88,74 +225,121 @@ class Container(Widget):
             return acc
         return reduce(reduce_children, self.children, [])
 
+    def get_weight(self, index, child):
+        if self.weights is not None:
+            return self.weights[index]
+        return child.expand
+
+    def get_child_widgets(self):
+        return self.get_real_children()
+
+    def release(self):
+        for child in self.children:
+            if isinstance(child, WrapperWidget): # wrappers are never built, but listen for their children
+                child.dispose()
+        super().release()
+
+    def replace_child(self, old_child, new_child):
+        for children in [self.children] + [child.children for child in self.children if isinstance(child, WrapperWidget)]:
+            for index, child in enumerate(children):
+                if child is old_child:
+                    children[index] = new_child
+                    return
+
+    def reset_tk_widget(self):
+        columns, rows = self.el.grid_size()
+        for index in range(columns):
+            self.el.columnconfigure(index, weight=0)
+        for index in range(rows):
+            self.el.rowconfigure(index, weight=0)
+
 class Column(Container):
+    __slots__ = ()
+
     def layout_tk_widget(self, parent):
-        self.el = tk.Frame(parent.el, **self.styles)
-        self.el.columnconfigure(0, weight=1)
+        self.el = self.create_tk(tk.Frame, parent.el)
+        self.defer(self.el.columnconfigure, 0, weight=1)
         for index, child in enumerate(self.get_real_children()):
-            if child.expand != 0:
-                self.el.rowconfigure(index, weight=child.expand)
+            weight = self.get_weight(index, child)
+            if weight != 0:
+                self.defer(self.el.rowconfigure, index, weight=weight)
             padding = child.padding
             child_el = child.build(self)
-            child_el.grid(row=index, column=0, padx=int(padding[1]+self.gap/2), pady=int(padding[0]+self.gap/2),
-                          sticky=get_sticky(child.align, child.vertical_align))
+            self.defer(child_el.grid, row=index, column=0, padx=int(padding[1]+self.gap/2), pady=int(padding[0]+self.gap/2),
+                       sticky=get_sticky(child.align, child.vertical_align))
         return self.el
             
 class Row(Container):
+    __slots__ = ()
+
     def __init__(self, children=None, expand=0, align='fill', name=None, **kwargs):
         super().__init__(children, expand=expand, align=align, name=name, **kwargs)
 
     def layout_tk_widget(self, parent):
-        self.el = tk.Frame(parent.el, **self.styles)
-        self.el.rowconfigure(0, weight=1)
+        self.el = self.create_tk(tk.Frame, parent.el)
+        self.defer(self.el.rowconfigure, 0, weight=1)
         for index, child in enumerate(self.get_real_children()):
             child_el = child.build(self)
-            if child.expand != 0:
-                self.el.columnconfigure(index, weight=child.expand)
+            weight = self.get_weight(index, child)
+            if weight != 0:
+                self.defer(self.el.columnconfigure, index, weight=weight)
             padding = child.padding
-            child_el.grid(row=0, column=index, padx=int(padding[1]+self.gap/2), pady=int(padding[0]+self.gap/2),
-                          sticky=get_sticky(child.align, child.vertical_align))
+            self.defer(child_el.grid, row=0, column=index, padx=int(padding[1]+self.gap/2), pady=int(padding[0]+self.gap/2),
+                       sticky=get_sticky(child.align, child.vertical_align))
         return self.el
 
 class Window(Column):
-    pass
+    __slots__ = ()
 
 class VStack(Column):
-    pass
+    __slots__ = ()
 
 class HStack(Row):
-    pass
+    __slots__ = ()
 
 class Button(Widget):
+    __slots__ = ('text', 'on_click')
+
     def __init__(self, text="Button", name=None, on_click=None, **kwargs):
-        if isinstance(text, ViewModelBindable):
-            text.on_change(lambda value: self.el.config(text=value))
-            self.text = text.get_value()
-        else:
-            self.text = text
+        self.text = text
         self.on_click = on_click
         super().__init__(name=name, **kwargs)
 
+    def _update_text(self, value):
+        self.el.config(text=value)
+
     def handle_click(self):
         handler_thread = threading.Thread(target=self.on_click, daemon=True)
         handler_thread.start()
 
     def layout_tk_widget(self, parent):
         command = self.handle_click if self.on_click is not None else None
-        return ttk.Button(parent.el, text=self.text, command=command, **self.styles)
+        text = self.text
+        if isinstance(text, ViewModelBindable):
+            self.observe(text, self._update_text)
+            text = text.get_value()
+        return self.create_tk(ttk.Button, parent.el, text=text, command=command)
     
 class Label(Widget):
+    __slots__ = ('text',)
+
     def __init__(self, text="Label", name=None, **kwargs):
         self.text = text
         super().__init__(name=name, **kwargs)
 
+    def _update_text(self, value):
+        self.el.config(text=value)
+
     def layout_tk_widget(self, parent):
-        if isinstance(self.text, ViewModelBindable):
-            self.text.on_change(lambda value: self.el.config(text=value))
-            self.text = self.text.get_value()
-        return ttk.Label(parent.el, text=self.text, **self.styles)
+        text = self.text
+        if isinstance(text, ViewModelBindable):
+            self.observe(text, self._update_text)
+            text = text.get_value()
+        return self.create_tk(ttk.Label, parent.el, text=text)
     
 class TextBox(Widget):
+    __slots__ = ('text', 'password', 'lines', 'scrollable')
+
     def __init__(self, text="", password=False, lines=1, scrollable=True, name=None, **kwargs):
         self.text = text
         self.password = password
@@ -164,10 +348,10 @@ class TextBox(Widget):
         super().__init__(name=name, **kwargs)
 
     def bind_var(self):
-        var_to_bind = tk.StringVar()
+        var_to_bind = tk.StringVar(master=self.app.el)
         if isinstance(self.text, ViewModelBindable):
             var_to_bind.set(self.text.get_value())
-            self.text.connect_tk_var(var_to_bind)
+            self.connect(self.text, var_to_bind)
             self.text = self.text.get_value()
         return var_to_bind
     
@@ -182,7 +366,21 @@ class TextBox(Widget):
             self.el.delete(1.0, 'end')
             self.el.insert("end", value)
         else:
-            self.var_to_bind.set(value)
+            with program_write:
+                self.var_to_bind.set(value)
+
+    def value_var(self):
+        return self.var_to_bind if self.lines == 1 and type(self).set_value is TextBox.set_value else None
+
+    def reset_tk_widget(self):
+        if self.lines > 1:
+            self.el.delete('1.0', 'end')
+
+    def release(self):
+        frame = getattr(self.el, 'frame', None) # ScrolledText lives in its own frame and is never pooled
+        super().release()
+        if frame is not None:
+            frame.destroy()
 
     def layout_tk_widget(self, parent):
         show = '*' if self.password else None
@@ -192,11 +390,114 @@ class TextBox(Widget):
             if self.scrollable:
                 return ScrolledText(parent.el, height=self.lines, **self.styles)
             else:
-                return tk.Text(parent.el, height=self.lines, **self.styles)
+                return self.create_tk(tk.Text, parent.el, height=self.lines)
         else:
-            return ttk.Entry(parent.el, textvariable=self.var_to_bind, show=show, **self.styles)
+            return self.create_tk(ttk.Entry, parent.el, textvariable=self.var_to_bind, show=show)
+
+class LogView(TextBox):
+    """
+        Read-only scrolled text for high-rate logs.
+        usage:
+            log = LogView(max_lines=5000)
+            log.append("started") # from any thread
+            LogView(vm.log_lines_) # or follow appends to a bound list
+
+        Appended lines are queued and written once per frame with a single insert,
+        only the last max_lines are kept, and the view only follows new lines while scrolled to the bottom.
+    """
+    __slots__ = ('source', 'max_lines', 'frame_ms', '_pending', '_line_count', '_clear_requested', '_flush_id')
+
+    def __init__(self, source=None, lines=10, max_lines=10000, frame_ms=16, name=None, **kwargs):
+        self.source = source
+        self.max_lines = max_lines
+        self.frame_ms = frame_ms
+        self._pending = deque() # deque.append is atomic, so writers never take a lock
+        self._line_count = 0
+        self._clear_requested = False
+        self._flush_id = None
+        super().__init__(text=None, lines=max(lines, 2), scrollable=True, name=name, **kwargs)
+
+    def append(self, line):
+        self._pending.append(str(line))
+
+    def extend(self, lines):
+        self._pending.extend(map(str, lines))
+
+    def clear(self):
+        self._pending.clear()
+        self._clear_requested = True
+
+    def bind_var(self):
+        return None
+
+    def set_value(self, value):
+        self.clear()
+        self.extend(str(value).splitlines())
+
+    def _on_source_change(self, value, change_type=None, data=None):
+        if change_type == BindedListUpdateType.INSERT:
+            self.append(data)
+        elif change_type == BindedListUpdateType.EXTEND:
+            self.extend(data)
+        else: # replaced, or lines removed, inserted or reordered: shown again from the list
+            self.clear()
+            self.extend(value[-self.max_lines:] if value else ())
+
+    def _flush(self):
+        if self.el is None:
+            return
+        pending = self._pending
+        count = len(pending)
+        if self._clear_requested:
+            self._clear_requested = False
+            self.el.configure(state='normal')
+            self.el.delete('1.0', 'end')
+            self.el.configure(state='disabled')
+            self._line_count = 0
+        if count > 0:
+            # lines that would be trimmed right away are never inserted
+            for _ in range(count - self.max_lines):
+                pending.popleft()
+            count = min(count, self.max_lines)
+            text = '\n'.join([pending.popleft() for _ in range(count)])
+            at_bottom = self.el.yview()[1] >= 1.0
+            self.el.configure(state='normal')
+            self.el.insert('end', '\n' + text if self._line_count else text)
+            self._line_count += count
+            excess = self._line_count - self.max_lines
+            if excess > 0:
+                self.el.delete('1.0', f'{excess + 1}.0')
+                self._line_count -= excess
+            self.el.configure(state='disabled')
+            if at_bottom:
+                self.el.see('end')
+        self._flush_id = self.el.after(self.frame_ms, self._flush)
+
+    def reset_tk_widget(self):
+        pass
+
+    def _stop_flush(self, event=None):
+        if self.el is not None and self._flush_id is not None:
+            self.el.after_cancel(self._flush_id)
+            self._flush_id = None
+
+    def release(self):
+        self._stop_flush()
+        super().release()
+
+    def layout_tk_widget(self, parent):
+        el = super().layout_tk_widget(parent)
+        el.configure(state='disabled')
+        if isinstance(self.source, ViewModelBindable):
+            self.observe(self.source, self._on_source_change)
+            self.extend((self.source.get_value() or ())[-self.max_lines:])
+        el.bind('<Destroy>', self._stop_flush, add='+') # also when a parent is destroyed without release
+        self._flush_id = el.after(self.frame_ms, self._flush)
+        return el
 
 class CheckBox(Widget):
+    __slots__ = ('text', 'on_click', 'checked')
+
     def __init__(self, text="CheckBox", name=None, checked=False, on_click=None, **kwargs):
         self.text = text
         self.on_click = on_click
@@ -204,10 +505,10 @@ class CheckBox(Widget):
         super().__init__(name=name, **kwargs)
 
     def bind_var(self):
-        var_to_bind = tk.IntVar()
+        var_to_bind = tk.IntVar(master=self.app.el)
         if isinstance(self.checked, ViewModelBindable):
             var_to_bind.set(self.checked.get_value())
-            self.checked.connect_tk_var(var_to_bind, true_to_one=True)
+            self.connect(self.checked, var_to_bind, true_to_one=True)
             self.checked = self.checked.get_value()
         elif self.checked:
             var_to_bind.set(1)
@@ -217,12 +518,15 @@ class CheckBox(Widget):
         return self.var_to_bind.get() == 1
     
     def set_value(self, value):
-        self.var_to_bind.set(value == 1)
+        with program_write:
+            self.var_to_bind.set(value == 1)
 
     def layout_tk_widget(self, parent):
-        return ttk.Checkbutton(parent.el, text=self.text, command=self.on_click, variable=self.var_to_bind, **self.styles)
+        return self.create_tk(ttk.Checkbutton, parent.el, text=self.text, command=self.on_click, variable=self.var_to_bind)
     
 class RadioGroup(WrapperWidget):
+    __slots__ = ('_value', 'on_change')
+
     def __init__(
         self,
         children: List[Widget],
@@ -237,26 +541,35 @@ class RadioGroup(WrapperWidget):
 
         # Check if value is bindable
         if isinstance(self._value, ViewModelBindable):
-            self._value.on_change(self._update_selection_from_bindable)
+            self.subscriptions += (self._value.subscribe(self._update_selection_from_bindable),)
 
-        # Set up the variable shared by all radio buttons
-        self.var_to_bind = tk.StringVar()
-        if isinstance(self._value, ViewModelBindable):
-            self.var_to_bind.set(self._value.get_value())
-        elif self._value is not None:
-            self.var_to_bind.set(self._value)
+        self.var_to_bind = None # made with the first radio button built, in the interpreter of its app
 
         # Configure each radio button
         for child in self.children:
             if isinstance(child, RadioButton):
-                child.var_to_bind = self.var_to_bind
-                child.bind_var = lambda: self.var_to_bind
+                child.group = self
+
+    def group_var(self, app) -> tk.StringVar:
+        """The variable shared by all radio buttons"""
+        if self.var_to_bind is None:
+            var_to_bind = tk.StringVar(master=app.el)
+            if isinstance(self._value, ViewModelBindable):
+                var_to_bind.set(self._value.get_value())
+            elif self._value is not None:
+                var_to_bind.set(self._value)
+            var_to_bind.trace_add("write", self._handle_selection_change)
+            self.var_to_bind = var_to_bind
+        return self.var_to_bind
 
-        self.var_to_bind.trace_add("write", self._handle_selection_change)
+    def bind_var(self):
+        return self.group_var(self.app)
 
     def _update_selection_from_bindable(self, new_value):
         """Update the selected radio button based on the bindable value."""
-        self.var_to_bind.set(new_value)
+        if self.var_to_bind is not None:
+            with program_write:
+                self.var_to_bind.set(new_value)
 
     def _handle_selection_change(self, *args):
         """Handle the selection change event and call the on_change callback."""
@@ -272,12 +585,13 @@ class RadioGroup(WrapperWidget):
 
     def set_value(self, value):
         """Set the selected radio button by value."""
-        self.var_to_bind.set(value)
+        with program_write:
+            self.var_to_bind.set(value)
 
     def layout_tk_widget(self, parent):
         self.parent = parent
         self.name_registry = parent.name_registry
-        frame = tk.Frame(parent.el, **self.styles)
+        frame = self.create_tk(tk.Frame, parent.el)
         for child in self.children:
             child_el = child.build(self)
             child_el.pack(anchor='w')
@@ -286,6 +600,8 @@ class RadioGroup(WrapperWidget):
 
 
 class RadioButton(Widget):
+    __slots__ = ('text', 'on_click', 'value', 'selected', 'group')
+
     def __init__(self, text="RadioButton", value=None, name=None, selected=False, on_click=None, **kwargs):
         if value is None:
             value = text
@@ -293,11 +609,14 @@ class RadioButton(Widget):
         self.on_click = on_click
         self.value = value
         self.selected = selected
+        self.group:RadioGroup = None
         super().__init__(name=name, **kwargs)
 
     def bind_var(self):
+        if self.group is not None:
+            return self.group.group_var(self.app)
         if self.name not in self.name_registry or self.name_registry[self.name].var_to_bind is None:
-            var_to_bind = tk.StringVar()
+            var_to_bind = tk.StringVar(master=self.app.el)
         else:
             var_to_bind = self.name_registry[self.name].var_to_bind
         if self.selected:
@@ -305,38 +624,118 @@ class RadioButton(Widget):
         return var_to_bind
 
     def layout_tk_widget(self, parent):
-        return ttk.Radiobutton(
+        return self.create_tk(
+            ttk.Radiobutton,
             parent.el,
             text=self.text,
             value=self.value,
             command=self.on_click,
             variable=self.var_to_bind,
-            **self.styles
         )
 
 
 class ComboBox(Widget):
-    def __init__(self, values=(), selected=None, name=None, on_change=None, **kwargs):
+    """
+        A dropdown of values, values can be bound to a ViewModel list.
+        With autocomplete=True, values are kept in a PrefixIndex instead of the dropdown, and the dropdown
+        lists the first max_matches values starting with the typed text (filtered debounce_ms after the last key),
+        which keeps it fast with hundreds of thousands of values.
+    """
+    __slots__ = ('values', 'on_change', 'selected', 'autocomplete', 'max_matches', 'debounce_ms',
+                 'index', '_mirror', '_debounce_id')
+
+    def __init__(self, values=(), selected=None, name=None, on_change=None, autocomplete=False, max_matches=50,
+                 debounce_ms=150, **kwargs):
         self.values = values
         self.on_change = on_change
         self.selected = selected
+        self.autocomplete = autocomplete
+        self.max_matches = max_matches
+        self.debounce_ms = debounce_ms
+        self.index:PrefixIndex = None
+        self._mirror = None # copy of the bound list, so index-only list changes can tell which value went away
+        self._debounce_id = None
         super().__init__(name=name, **kwargs)
 
     def bind_var(self):
-        var_to_bind = tk.StringVar(value=self.selected)
+        var_to_bind = tk.StringVar(master=self.app.el, value=self.selected)
         if isinstance(self.selected, ViewModelBindable):
             var_to_bind.set(self.selected.get_value())
-            self.selected.connect_tk_var(var_to_bind)
+            self.connect(self.selected, var_to_bind)
             self.selected = self.selected.get_value()
         return var_to_bind
 
+    def _on_values_change(self, values, change_type=None, data=None):
+        if not self.autocomplete:
+            self.el['values'] = tuple(values)
+            return
+        if change_type == BindedListUpdateType.INSERT:
+            self._mirror.append(data)
+            self.index.add(data)
+        elif change_type == BindedListUpdateType.EXTEND:
+            data = list(data)
+            self._mirror.extend(data)
+            for value in data:
+                self.index.add(value)
+        elif change_type == BindedListUpdateType.INSERT_AT:
+            position, value = data
+            self._mirror.insert(position, value)
+            self.index.add(value)
+        elif change_type == BindedListUpdateType.DELETE_ROW:
+            self.index.remove(self._mirror.pop(data))
+        elif change_type == BindedListUpdateType.SETITEM:
+            position, value = data
+            self.index.remove(self._mirror[position])
+            self._mirror[position] = value
+            self.index.add(value)
+        elif change_type in (BindedListUpdateType.SORT, BindedListUpdateType.REVERSE):
+            self._mirror = list(values) # same values, only the mirror's order changes
+        elif change_type is None: # the list was replaced
+            self._mirror = list(values)
+            self.index = PrefixIndex(self._mirror)
+
+    def _on_key(self, event):
+        if event.keysym in ('Up', 'Down', 'Left', 'Right', 'Return', 'Escape', 'Tab'):
+            return
+        if self._debounce_id is not None:
+            self.el.after_cancel(self._debounce_id)
+        self._debounce_id = self.el.after(self.debounce_ms, self._update_matches)
+
+    def _update_matches(self):
+        self._debounce_id = None
+        if self.el is not None:
+            self.el['values'] = self.index.matches(self.var_to_bind.get(), self.max_matches)
+
+    def _on_post(self): # the dropdown is about to open, don't wait for the debounce
+        if self._debounce_id is not None:
+            self.el.after_cancel(self._debounce_id)
+        self._update_matches()
+
+    def release(self):
+        if self.el is not None and self._debounce_id is not None:
+            self.el.after_cancel(self._debounce_id)
+            self._debounce_id = None
+        super().release()
+
     def layout_tk_widget(self, parent):
-        widget = ttk.Combobox(parent.el, values=self.values, textvariable=self.var_to_bind, **self.styles)
+        values = self.values
+        if isinstance(values, ViewModelBindable):
+            self.observe(values, self._on_values_change)
+            values = values.get_value()
+        if self.autocomplete:
+            self._mirror = list(values)
+            self.index = PrefixIndex(self._mirror)
+            widget = self.create_tk(ttk.Combobox, parent.el, textvariable=self.var_to_bind, postcommand=self._on_post)
+            widget.bind('<KeyRelease>', self._on_key)
+        else:
+            widget = self.create_tk(ttk.Combobox, parent.el, values=tuple(values), textvariable=self.var_to_bind)
         if self.on_change is not None:
             widget.bind('<<ComboboxSelected>>', lambda val:self.on_change())
         return widget
     
 class ListBox(Widget):
+    __slots__ = ('list_items', 'value_binder', 'on_change', 'value', 'lines', 'multiple')
+
     def __init__(self, list_items=(), value=None, lines=5, multiple=False, name=None, on_change=None, **kwargs):
         self.list_items = list_items
         self.value_binder = None
@@ -349,13 +748,13 @@ class ListBox(Widget):
     def bind_var(self):
         if isinstance(self.value, ViewModelBindable):
             self.value_binder = self.value
-            self.value_binder.on_change(lambda v: self.set_value(v))
+            self.observe(self.value_binder, self.set_value)
             self.value = self.value.get_value()
 
-        var_to_bind = tk.StringVar()
+        var_to_bind = tk.StringVar(master=self.app.el)
         if isinstance(self.list_items, ViewModelBindable):
             var_to_bind.set(self.list_items.get_value())
-            self.list_items.connect_tk_var(var_to_bind)
+            self.connect(self.list_items, var_to_bind)
             self.list_items = self.list_items.get_value()
         else:
             var_to_bind.set(self.list_items)
@@ -379,7 +778,7 @@ class ListBox(Widget):
 
     def layout_tk_widget(self, parent):
         select_mode = tk.EXTENDED if self.multiple else tk.BROWSE
-        self_el = tk.Listbox(parent.el, height=self.lines, listvariable=self.var_to_bind, selectmode=select_mode, **self.styles)
+        self_el = self.create_tk(tk.Listbox, parent.el, height=self.lines, listvariable=self.var_to_bind, selectmode=select_mode)
         def on_selected():
             if self.value_binder is not None:
                 self.value_binder.set_value(self.get_value())
@@ -389,6 +788,8 @@ class ListBox(Widget):
         return self_el
     
 class Slider(Widget):
+    __slots__ = ('value', 'min', 'max', 'on_change')
+
     def __init__(self, value=0, min=0, max=100,  name=None, on_change=None, **kwargs):
         self.value = value
         self.min = min
@@ -397,20 +798,22 @@ class Slider(Widget):
         super().__init__(name=name, **kwargs)
 
     def bind_var(self):
-        var_to_bind = tk.DoubleVar(value=self.value)
+        var_to_bind = tk.DoubleVar(master=self.app.el, value=self.value)
         if isinstance(self.value, ViewModelBindable):
             var_to_bind.set(self.value.get_value())
-            self.value.connect_tk_var(var_to_bind)
+            self.connect(self.value, var_to_bind)
             self.value = self.value.get_value()
         return var_to_bind
 
     def layout_tk_widget(self, parent):
-        widget = ttk.Scale(parent.el, from_=self.min, to=self.max, variable=self.var_to_bind, **self.styles)
+        widget = self.create_tk(ttk.Scale, parent.el, from_=self.min, to=self.max, variable=self.var_to_bind)
         if self.on_change is not None:
             widget.bind('<ButtonRelease-1>', lambda val:self.on_change())
         return widget
 
 class NumericUpDown(Widget):
+    __slots__ = ('value', 'min', 'max', 'on_change')
+
     def __init__(self, value=None, min=0, max=100, name=None, on_change=None, **kwargs):
         self.value = value
         self.min = min
@@ -419,26 +822,28 @@ class NumericUpDown(Widget):
         super().__init__(name=name, **kwargs)
 
     def bind_var(self):
-        var_to_bind = tk.IntVar()
+        var_to_bind = tk.IntVar(master=self.app.el)
         if isinstance(self.value, ViewModelBindable):
             var_to_bind.set(self.value.get_value())
-            self.value.connect_tk_var(var_to_bind)
+            self.connect(self.value, var_to_bind)
             self.value = self.value.get_value()
         else:
             var_to_bind.set(self.value)
         return var_to_bind
 
     def layout_tk_widget(self, parent):
-        return ttk.Spinbox(parent.el, from_=self.min, to=self.max, textvariable=self.var_to_bind, command=self.on_change, **self.styles)
+        return self.create_tk(ttk.Spinbox, parent.el, from_=self.min, to=self.max, textvariable=self.var_to_bind, command=self.on_change)
     
 class ProgressBar(Widget):
+    __slots__ = ('value',)
+
     def __init__(self, value=None, name=None, **kwargs):
         self.value = value
         super().__init__(name=name, **kwargs)
 
     def bind_var(self):
         if isinstance(self.value, ViewModelBindable):
-            self.value.on_change(lambda v: self.set_value(v))
+            self.observe(self.value, self.set_value)
             self.value = self.value.get_value()
         return None
 
@@ -449,38 +854,75 @@ class ProgressBar(Widget):
         self.el['value'] = value
 
     def layout_tk_widget(self, parent):
-        el = ttk.Progressbar(parent.el, **self.styles)
+        el = self.create_tk(ttk.Progressbar, parent.el)
         el['value'] = self.value
         return el
     
 class GroupBox(Widget):
+    __slots__ = ('children', 'text', 'column')
+
     def __init__(self, text='Frame', children=[], name=None, **kwargs):
         self.children = children
         self.text = text
         super().__init__(name=name, **kwargs)
 
     def layout_tk_widget(self, parent):
-        self.el = ttk.LabelFrame(parent.el, text=self.text, **self.styles)
-        self.column = Column(self.children, **self.styles).build(self)
-        self.el.columnconfigure(0, weight=1)
-        self.el.rowconfigure(0, weight=1)
-        self.column.grid(row=0, column=0, sticky="wens")
+        self.el = self.create_tk(ttk.LabelFrame, parent.el, text=self.text)
+        self.column = Column(self.children, **self.styles)
+        column_el = self.column.build(self)
+        self.defer(self.el.columnconfigure, 0, weight=1)
+        self.defer(self.el.rowconfigure, 0, weight=1)
+        self.defer(column_el.grid, row=0, column=0, sticky="wens")
         return self.el
+
+    def get_child_widgets(self):
+        return [self.column]
     
 class TabControl(Widget):
+    """
+        Notebook with a Column of children per tab. Widgets in the tabs that aren't selected are hidden:
+        their bound updates are collected and applied when their tab is selected.
+    """
+    __slots__ = ('tabs', 'tab_columns', 'shown_tab')
+
     def __init__(self, tabs={'Tab': []}, name=None, **kwargs):
         self.tabs = tabs
         super().__init__(name=name, **kwargs)
 
     def layout_tk_widget(self, parent):
-        self.el = ttk.Notebook(parent.el, **self.styles)
+        self.el = self.create_tk(ttk.Notebook, parent.el)
+        self.tab_columns = []
         for label, children in self.tabs.items():
-            frame_el = Column(children).build(self)
-            frame_el.pack(fill='both', expand=True)
-            self.el.add(frame_el, text=label)
+            column = Column(children)
+            frame_el = column.build(self)
+            self.tab_columns.append(column)
+            self.defer(frame_el.pack, fill='both', expand=True)
+            self.defer(self.el.add, frame_el, text=label)
+        self.shown_tab = 0 # tk selects the first tab added
+        for column in self.tab_columns[1:]:
+            column.set_hidden(True)
+        self.el.bind('<<NotebookTabChanged>>', self._on_tab_changed)
         return self.el
+
+    def _on_tab_changed(self, event):
+        selected = str(self.el.select())
+        for index, column in enumerate(self.tab_columns):
+            if str(column.el) == selected and index != self.shown_tab:
+                self.tab_columns[self.shown_tab].set_hidden(True)
+                self.shown_tab = index
+                column.set_hidden(False)
+                return
+
+    def get_child_widgets(self):
+        return self.tab_columns
+
+    def reset_tk_widget(self):
+        for tab in self.el.tabs():
+            self.el.forget(tab)
     
 class FilePicker(Widget):
+    __slots__ = ('text', 'filetypes', 'multiple', 'dir', 'value', 'button', 'label', 'row')
+
     def __init__(self, text="Select File...", value='', filetypes=[('All files', '*.*')], multiple=False, dir=False, name=None, **kwargs):
         self.text = text
         self.filetypes = filetypes
@@ -515,43 +957,271 @@ class FilePicker(Widget):
     def layout_tk_widget(self, parent):
         self.button = Button(self.text, on_click=self.on_pick_file)
         self.label = Label(self.value, width=30)
-        return Row([self.button, self.label], **self.styles).build(parent)
+        self.row = Row([self.button, self.label], **self.styles)
+        return self.row.build(parent)
+
+    def release(self):
+        if self.el is None:
+            return
+        if self.name is not None and self.name_registry.get(self.name) is self:
+            del self.name_registry[self.name]
+        self.row.release() # the row's frame is this widget's el
+        self.el = None
     
 class Canvas(Widget):
+    __slots__ = ()
+
+    def reset_tk_widget(self):
+        self.el.delete('all')
+
     def layout_tk_widget(self, parent):
-        return tk.Canvas(parent.el, **self.styles)
+        return self.create_tk(tk.Canvas, parent.el)
     
+class Plot(Canvas):
+    """
+        Streaming line plot of one or more series on a canvas.
+        usage:
+            vm.temperature = RingBuffer(1_000_000)
+            Plot([vm.temperature_, vm.pressure_], colors=['red', 'blue'], width=600, height=200)
+
+        A series is a RingBuffer, a numpy array or a list, bound or not. Each series is one canvas line
+        whose coords are replaced at most once per frame with the min/max envelope of every pixel column.
+    """
+    __slots__ = ('series', 'colors', 'y_range', 'fps', '_items', '_drawn', '_dirty', '_frame_id')
+
+    DEFAULT_COLORS = ('#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd', '#8c564b')
+
+    def __init__(self, series=(), colors=None, y_range=None, fps=30, name=None, **kwargs):
+        self.series = list(series)
+        self.colors = list(colors) if colors is not None else [self.DEFAULT_COLORS[i % len(self.DEFAULT_COLORS)] for i in range(len(self.series))]
+        self.y_range = y_range # (low, high), or None to fit all series
+        self.fps = fps
+        self._items = []
+        self._drawn = None # what was drawn last: (canvas size, [(series value id, version)])
+        self._dirty = True
+        self._frame_id = None
+        kwargs.setdefault('background', 'white')
+        kwargs.setdefault('highlightthickness', 0)
+        super().__init__(name=name, **kwargs)
+
+    def _mark_dirty(self, *args):
+        self._dirty = True
+
+    def _series_values(self):
+        return [series.get_value() if isinstance(series, ViewModelBindable) else series for series in self.series]
+
+    def _draw(self):
+        if self.el is None:
+            return
+        values = self._series_values()
+        state = ((self.el.winfo_width(), self.el.winfo_height()), [(id(value), getattr(value, 'version', None)) for value in values])
+        if self._dirty or state != self._drawn:
+            self._dirty = False
+            self._drawn = state
+            width, height = state[0]
+            samples = [as_samples(value) for value in values]
+            reduced = [envelope(series_samples, width) for series_samples in samples]
+            low, high = self.y_range if self.y_range is not None else self._fit(samples, reduced)
+            for item, series_samples, series_reduced in zip(self._items, samples, reduced):
+                if len(series_samples) < 2 or width < 2:
+                    self.el.coords(item, 0, 0, 0, 0)
+                else:
+                    self.el.coords(item, *line_coords(series_samples, series_reduced, width, height, low, high))
+        self._frame_id = self.el.after(max(1, int(1000 / self.fps)), self._draw)
+
+    @staticmethod
+    def _fit(samples, reduced):
+        lows, highs = [], []
+        for series_samples, series_reduced in zip(samples, reduced):
+            if len(series_samples) == 0:
+                continue
+            mins, maxs = series_reduced if series_reduced is not None else (series_samples, series_samples)
+            lows.append(min(mins))
+            highs.append(max(maxs))
+        if not lows:
+            return 0.0, 1.0
+        return float(min(lows)), float(max(highs))
+
+    def release(self):
+        if self.el is not None and self._frame_id is not None:
+            self.el.after_cancel(self._frame_id)
+            self._frame_id = None
+        super().release()
+
+    def layout_tk_widget(self, parent):
+        el = super().layout_tk_widget(parent)
+        self._items = [el.create_line(0, 0, 0, 0, fill=color) for color in self.colors]
+        for series in self.series:
+            if isinstance(series, ViewModelBindable):
+                self.observe(series, self._mark_dirty)
+        self._dirty = True
+        self._frame_id = el.after(max(1, int(1000 / self.fps)), self._draw)
+        return el
+
 class PictureBox(Widget):
-    def __init__(self, image=None, name=None, **kwargs):
+    """
+        Shows a PhotoImage, an image file, or live frames.
+        Files (PictureBox("cat.png", size=(128, 128))) are decoded and scaled by an ImageLoader on worker threads
+        and cached across widgets, a blank placeholder of the same size is shown until they are ready.
+        For live frames bind image to a ViewModel field holding numpy arrays or RawImages, e.g. PictureBox(vm.camera_frame_).
+        Frames are converted to PPM/PGM off the tk thread and drawn into one reused PhotoImage,
+        frames arriving faster than they can be shown are dropped.
+    """
+    __slots__ = ('image', 'size', 'loader', 'frame_ms', 'photo', 'stream', '_frame_photo', '_poll_id',
+                 '_loading', '_lock', '_incoming', '_hop_scheduled')
+
+    def __init__(self, image=None, size=None, loader:ImageLoader=None, frame_ms=10, name=None, **kwargs):
         self.image = image
+        self.size = size # (width, height) that image files are scaled to fit
+        self.loader = loader # ImageLoader.default() when None
+        self.frame_ms = frame_ms
+        self.photo = None
+        self.stream:FrameStream = None # started by the first frame, stopped when a file or image replaces the frames
+        self._frame_photo = None # the PhotoImage frames are drawn into
+        self._poll_id = None
+        self._loading = None # the file being loaded, a later value cancels showing it
+        self._lock = threading.Lock()
+        self._incoming = None # the latest bound value from another thread, shown on the tk thread
+        self._hop_scheduled = False
         super().__init__(name=name, **kwargs)
 
     def get_value(self):
         raise RuntimeError('PictureBox only supports set_value')
     
     def set_value(self, value):
-        self.el['image'] = value
+        """A raw frame, an image file, a PhotoImage, or None to show nothing"""
+        self._loading = None
+        if is_raw_frame(value):
+            self._submit_frame(value)
+            return
+        self._stop_stream()
+        if isinstance(value, (str, os.PathLike)):
+            self._load_file(value)
+        else:
+            self.photo = value
+            self.el['image'] = value if value is not None else ''
+
+    def _load_file(self, path):
+        loader = self.loader if self.loader is not None else ImageLoader.default()
+        self._loading = path
+        if loader.load(self.el, path, self.size, partial(self._show_loaded, path)) is None and self.size is not None:
+            self.photo = loader.placeholder(self.el, self.size)
+            self.el['image'] = self.photo
+
+    def _show_loaded(self, path, photo):
+        if self.el is not None and self._loading is path:
+            self._loading = None
+            self.photo = photo # the label alone doesn't keep the image alive once the cache evicts it
+            self.el['image'] = photo
+
+    def frame_stats(self):
+        """Frames received, shown and dropped, display fps, conversion time and arrival-to-display latency"""
+        return self.stream.stats() if self.stream is not None else None
+
+    def _submit_frame(self, frame):
+        if self.stream is None:
+            self._start_stream()
+        self.stream.submit(frame)
+
+    def _on_frame(self, value):
+        if threading.get_ident() == self.app._thread_id:
+            self.set_value(value)
+            return
+        # a frame goes straight to a running stream, anything else is shown on the tk thread, latest value first
+        with self._lock:
+            if is_raw_frame(value) and self.stream is not None and not self._hop_scheduled:
+                self.stream.submit(value)
+                return
+            self._incoming = value
+            scheduled, self._hop_scheduled = self._hop_scheduled, True
+        if not scheduled:
+            self.el.after(0, self._take_incoming)
+
+    def _take_incoming(self):
+        with self._lock:
+            value, self._incoming = self._incoming, None
+            self._hop_scheduled = False
+        if self.el is not None:
+            self.set_value(value)
+
+    def _start_stream(self):
+        if self._frame_photo is None:
+            self._frame_photo = tk.PhotoImage(master=self.el)
+        with self._lock:
+            self.stream = FrameStream()
+        self._poll_id = self.el.after(self.frame_ms, self._poll)
+
+    def _stop_stream(self):
+        with self._lock:
+            stream, self.stream = self.stream, None
+        if stream is not None:
+            stream.close()
+        if self.el is not None and self._poll_id is not None:
+            self.el.after_cancel(self._poll_id)
+            self._poll_id = None
+
+    def _poll(self):
+        if self.el is None or self.stream is None:
+            return
+        data = self.stream.take()
+        if data is not None:
+            self._frame_photo.configure(data=data)
+            if self.photo is not self._frame_photo: # a file or no image was shown so far
+                self.photo = self._frame_photo
+                self.el['image'] = self.photo
+        self._poll_id = self.el.after(self.frame_ms, self._poll)
+
+    def release(self):
+        self._stop_stream()
+        super().release()
 
     def layout_tk_widget(self, parent):
-        return ttk.Label(parent.el, image=self.image, **self.styles)
+        image = self.image
+        if isinstance(image, ViewModelBindable):
+            # frames may come from any thread once bound, the stream starts with the first one
+            self.el = self.create_tk(ttk.Label, parent.el)
+            self.observe(image, self._on_frame)
+            image = image.get_value()
+            if image is not None:
+                self.set_value(image)
+            return self.el
+        if is_raw_frame(image) or isinstance(image, (str, os.PathLike)):
+            self.el = self.create_tk(ttk.Label, parent.el)
+            self.set_value(image)
+            return self.el
+        return self.create_tk(ttk.Label, parent.el, image=image)
     
 class ShowIf(WrapperWidget):
+    """Shows its children while the condition is true, hidden children only collect their bound updates"""
+    __slots__ = ('condition_bindable', 'hiding')
+
     def __init__(self, condition_bindable:ViewModelBindable, children:list[Widget]=[], **kwargs):
         if not isinstance(condition_bindable, ViewModelBindable):
             raise RuntimeError('condition in ShowIf must be ViewModelBindable like "should_show_"')
         self.condition_bindable = condition_bindable
-        condition_bindable.on_change(lambda v: self.update())
+        self.hiding = False
         super().__init__(children, **kwargs)
+        # ShowIf is never built itself, its container disposes this when released
+        self.subscriptions += (condition_bindable.subscribe(self._on_condition_change),)
+
+    def _on_condition_change(self, value):
+        self.update()
 
     def update(self):
-        if self.condition_bindable.get_value():
+        visible = bool(self.condition_bindable.get_value())
+        if visible:
             for child in self.children:
                 child.el.grid()
         else:
             for child in self.children:
                 child.el.grid_remove()
+        if visible == self.hiding:
+            self.hiding = not visible
+            for child in self.children:
+                child.set_hidden(self.hiding)
 
     def post_container_build(self):
+        self.hiding = False # the children were just built
         self.update()
 
     def layout_tk_widget(self, parent):
@@ -560,6 +1230,8 @@ class ShowIf(WrapperWidget):
     
     
 class DataTable(Widget):
+    __slots__ = ('header', 'table_data', '_selected_item', '_selected_index', '_bindings')
+
     def __init__(
         self,
         header: List[str]=None,
@@ -570,9 +1242,10 @@ class DataTable(Widget):
         selected_index: Optional[int | ViewModelBindable] = None,
         **kwargs
     ):
+        self._bindings = [] # (bindable, listener) pairs, observed once the table is built
         if data_frame is not None:
             if isinstance(data_frame, ViewModelBindable):
-                data_frame.on_change(self._update_from_data_frame)
+                self._bindings.append((data_frame, self._update_from_data_frame))
                 df = data_frame.get_value()
             else:
                 df = data_frame
@@ -588,21 +1261,21 @@ class DataTable(Widget):
 
         # Check if table_data is bindable
         if isinstance(self.table_data, ViewModelBindable):
-            self.table_data.on_change(self._handle_table_data_change)
+            self._bindings.append((self.table_data, self._handle_table_data_change))
             self.table_data = self.table_data.get_value()
 
         # Check if header is bindable
         if isinstance(self.header, ViewModelBindable):
-            self.header.on_change(self._update_header)
+            self._bindings.append((self.header, self._update_header))
             self.header = self.header.get_value()
 
         # Check if selected_item is bindable
         if isinstance(self._selected_item, ViewModelBindable):
-            self._selected_item.on_change(self._update_selected_item_from_bindable)
+            self._bindings.append((self._selected_item, self._update_selected_item_from_bindable))
 
         # Check if selected_index is bindable
         if isinstance(self._selected_index, ViewModelBindable):
-            self._selected_index.on_change(self._update_selected_index_from_bindable)
+            self._bindings.append((self._selected_index, self._update_selected_index_from_bindable))
 
     def _update_from_data_frame(self, new_df):
         """Update table when the bindable DataFrame changes."""
@@ -615,8 +1288,13 @@ class DataTable(Widget):
         self.table_data = new_data
         if change_type is None:
             self._refresh_table()
-        elif change_type == BindedListUpdateType.INSERT:
-            self._insert_row(len(self.table_data) - 1, data)
+        elif change_type == BindedListUpdateType.INSERT: # appended, also when replayed after the list grew further
+            self._insert_row(tk.END, data)
+        elif change_type == BindedListUpdateType.EXTEND:
+            for row in data:
+                self._insert_row(tk.END, row)
+        elif change_type in (BindedListUpdateType.SORT, BindedListUpdateType.REVERSE): # every row may have moved
+            self._refresh_table()
         elif change_type == BindedListUpdateType.INSERT_AT:
             index, row = data
             self._insert_row(index, row)
@@ -711,8 +1389,25 @@ class DataTable(Widget):
         for row in self.table_data:
             self.el.insert("", tk.END, values=row)
 
+    def export(self, path, format=None, where=None, key=None, reverse=False,
+               progress: Optional[ViewModelBindable] = None, throughput: Optional[ViewModelBindable] = None,
+               chunk_size=1000, on_done=None) -> TableExport:
+        """
+        Stream the table rows to a csv or jsonl file on a worker thread.
+        where/key/reverse filter and sort the exported view without copying rows,
+        progress (0-100) and throughput (rows/s) are published to the given bindables.
+        """
+        return TableExport(self.header, self.table_data, path, format=format, where=where, key=key, reverse=reverse,
+                           progress=progress, throughput=throughput, chunk_size=chunk_size, on_done=on_done).start()
+
+    def reset_tk_widget(self):
+        self.el.delete(*self.el.get_children())
+        self.el["columns"] = ()
+
     def layout_tk_widget(self, parent):
-        self.el = ttk.Treeview(parent.el, **self.styles)
+        self.el = self.create_tk(ttk.Treeview, parent.el)
+        for bindable, listener in self._bindings:
+            self.observe(bindable, listener)
         self._refresh_table()
         self.el.bind('<<TreeviewSelect>>', self._on_select)
         return self.el
@@ -731,4 +1426,246 @@ class DataTable(Widget):
             if isinstance(self._selected_item, ViewModelBindable):
                 self._selected_item.set_value(self.table_data[index])
             else:
-                self._selected_item = self.table_data[index]
\ No newline at end of file
+                self._selected_item = self.table_data[index]
+
+
+class TreeView(Widget):
+    """
+        Browses a hierarchy from a NodeProvider, only the levels the user expands are inserted.
+        Children are fetched on a worker thread when a node is opened, with a "Loading..." row meanwhile.
+        Changes are applied in order, nodes added or updated by them are described on the worker first.
+        Once more than max_items rows are loaded, the least recently collapsed subtrees are unloaded
+        and fetched again when reopened.
+        usage:
+            vm.tree_changes = []
+            TreeView(FolderProvider(), columns=['Size'], changes=vm.tree_changes_, selected_node=vm.selected_path_)
+            vm.tree_changes.append((NodeChangeType.ADD, '/tmp/new.txt', '/tmp')) # pushed to the tree as it happens
+    """
+    __slots__ = ('provider', 'columns', 'changes', 'selected_node', 'max_items', 'poll_ms', '_iids', '_nodes',
+                 '_loaded', '_collapsed', '_requests', '_results', '_changes', '_describing', '_described', '_poll_id',
+                 '_next_id', '_item_count')
+
+    def __init__(self, provider:NodeProvider, columns:List[str]=None, changes:ViewModelBindable=None,
+                 selected_node: Optional[Any | ViewModelBindable] = None, max_items=10000, poll_ms=15, name=None, **kwargs):
+        self.provider = provider
+        self.columns = columns or []
+        self.changes = changes # ViewModel list of (NodeChangeType, node[, parent[, index]]), entries present at build are ignored
+        self.selected_node = selected_node
+        self.max_items = max_items
+        self.poll_ms = poll_ms
+        self._poll_id = None
+        super().__init__(name=name, **kwargs)
+
+    def _reset_state(self):
+        self._iids = {} # node -> tk item id
+        self._nodes = {} # tk item id -> node
+        self._loaded = set() # item ids whose children are inserted, '' is the root
+        self._collapsed = OrderedDict() # loaded item ids collapsed by the user, least recently first
+        self._requests = {} # item id -> token of the fetch in flight
+        self._results = deque() # (item id, token, descriptions or exception) appended by workers
+        self._changes = deque() # changes not applied yet, they wait while earlier ones are described
+        self._describing = None # the changes whose nodes are being described
+        self._described = deque() # (changes, descriptions) appended by workers
+        self._next_id = 0
+        self._item_count = 0
+
+    def get_value(self):
+        selection = self.el.selection()
+        return self._nodes.get(selection[0]) if selection else None
+
+    def _insert(self, parent_iid, description, index='end'):
+        node, text, has_children, values = description
+        if node in self._iids: # already added by a change while its level was loading
+            return self._iids[node]
+        self._next_id += 1
+        iid = f'n{self._next_id}'
+        self._iids[node] = iid
+        self._nodes[iid] = node
+        self.el.insert(parent_iid, index, iid=iid, text=text, values=values)
+        if has_children:
+            self.el.insert(iid, 'end', iid=iid + '.loading', text='Loading...')
+        self._item_count += 1
+        return iid
+
+    def _request(self, iid):
+        self._next_id += 1
+        token = self._requests[iid] = self._next_id
+        results = self._results
+        fetch_children(self.provider, self._nodes.get(iid), lambda result: results.append((iid, token, result)))
+        self._schedule_poll()
+
+    def _schedule_poll(self):
+        if self._poll_id is None:
+            self._poll_id = self.el.after(self.poll_ms, self._poll)
+
+    def _poll(self):
+        self._poll_id = None
+        if self.el is None or not self.el.winfo_exists():
+            return
+        while self._results:
+            iid, token, result = self._results.popleft()
+            if self._requests.get(iid) != token: # unloaded, reloaded or removed meanwhile
+                continue
+            del self._requests[iid]
+            self._fill(iid, result)
+        while self._described:
+            changes, descriptions = self._described.popleft()
+            if changes is not self._describing: # the tree was reset meanwhile
+                continue
+            self._describing = None
+            for change, description in zip(changes, descriptions):
+                self._apply_change(change, description)
+            self._apply_changes()
+        if self._requests or self._describing is not None:
+            self._poll_id = self.el.after(self.poll_ms, self._poll)
+        self._trim()
+
+    def _fill(self, iid, result):
+        placeholder = iid + '.loading'
+        if isinstance(result, Exception): # left unloaded, opening the node again retries
+            if self.el.exists(placeholder):
+                self.el.item(placeholder, text=f'Failed to load: {result}')
+            return
+        if self.el.exists(placeholder):
+            self.el.delete(placeholder)
+        for description in result:
+            self._insert(iid, description)
+        self._loaded.add(iid)
+
+    def _forget(self, iid):
+        """Drop the bookkeeping of an item and everything below it, the caller deletes the tk items"""
+        stack = [iid]
+        while stack:
+            iid = stack.pop()
+            if iid != '':
+                if iid not in self._nodes: # a placeholder
+                    continue
+                del self._iids[self._nodes.pop(iid)]
+                self._item_count -= 1
+            self._loaded.discard(iid)
+            self._collapsed.pop(iid, None)
+            self._requests.pop(iid, None)
+            stack.extend(self.el.get_children(iid))
+
+    def _unload(self, iid):
+        """Remove the children of an item, leaving a placeholder so they are fetched again on open"""
+        children = self.el.get_children(iid)
+        for child in children:
+            self._forget(child)
+        self.el.delete(*children)
+        self._loaded.discard(iid)
+        self._requests.pop(iid, None)
+        self.el.insert(iid, 'end', iid=iid + '.loading', text='Loading...')
+
+    def _trim(self):
+        while self._item_count > self.max_items and self._collapsed:
+            iid, _ = self._collapsed.popitem(last=False)
+            self._unload(iid)
+
+    def _on_open(self, event):
+        iid = self.el.focus()
+        self._collapsed.pop(iid, None)
+        if iid in self._loaded or iid in self._requests:
+            return
+        if self.el.exists(iid + '.loading'):
+            self.el.item(iid + '.loading', text='Loading...')
+            self._request(iid)
+
+    def _on_close(self, event):
+        iid = self.el.focus()
+        if iid in self._loaded:
+            self._collapsed[iid] = None
+            self._trim()
+
+    def _on_select(self, event):
+        node = self.get_value()
+        if isinstance(self.selected_node, ViewModelBindable):
+            self.selected_node.set_value(node)
+        else:
+            self.selected_node = node
+
+    def _on_changes(self, changes, change_type=None, data=None):
+        if change_type == BindedListUpdateType.INSERT:
+            self._changes.append(data)
+        elif change_type == BindedListUpdateType.INSERT_AT:
+            self._changes.append(data[1])
+        elif change_type == BindedListUpdateType.EXTEND:
+            self._changes.extend(data)
+        elif change_type is None and changes: # the list was replaced, apply it as one batch
+            self._changes.extend(changes)
+        if self._describing is None:
+            self._apply_changes()
+
+    def _apply_changes(self):
+        """Apply the queued changes in order, up to the next run of adds and updates, whose nodes go to the worker"""
+        changes = self._changes
+        while changes:
+            if changes[0][0] in _DESCRIBED_CHANGES:
+                batch = self._describing = []
+                while changes and changes[0][0] in _DESCRIBED_CHANGES:
+                    batch.append(changes.popleft())
+                described = self._described
+                describe_nodes(self.provider, [change[1] for change in batch],
+                               lambda descriptions: described.append((batch, descriptions)))
+                self._schedule_poll()
+                return
+            self._apply_change(changes.popleft())
+
+    def _apply_change(self, change, description=None):
+        kind, node, *rest = change
+        if isinstance(description, Exception): # describe() failed, the node is left as it is
+            return
+        if kind == NodeChangeType.RELOAD:
+            iid = '' if node is None else self._iids.get(node)
+            if iid is not None:
+                self._unload(iid)
+                if iid == '' or self.el.item(iid, 'open'):
+                    self._request(iid)
+            return
+        iid = self._iids.get(node)
+        if kind == NodeChangeType.ADD:
+            parent = rest[0] if rest else None
+            parent_iid = '' if parent is None else self._iids.get(parent)
+            if parent_iid is None: # the parent isn't shown, the node is fetched with its level
+                return
+            if parent_iid in self._loaded:
+                self._insert(parent_iid, description, rest[1] if len(rest) > 1 else 'end')
+            elif not self.el.get_children(parent_iid): # a leaf gaining its first child
+                self.el.insert(parent_iid, 'end', iid=parent_iid + '.loading', text='Loading...')
+        elif iid is None:
+            return
+        elif kind == NodeChangeType.REMOVE:
+            self._forget(iid)
+            self.el.delete(iid)
+        elif kind == NodeChangeType.UPDATE:
+            _, text, has_children, values = description
+            self.el.item(iid, text=text, values=values)
+            if not has_children and self.el.get_children(iid):
+                self._unload(iid)
+                self.el.delete(iid + '.loading')
+            elif has_children and not self.el.get_children(iid):
+                self._unload(iid)
+
+    def release(self):
+        if self.el is not None and self._poll_id is not None:
+            self.el.after_cancel(self._poll_id)
+            self._poll_id = None
+        super().release()
+
+    def reset_tk_widget(self):
+        self.el.delete(*self.el.get_children())
+
+    def layout_tk_widget(self, parent):
+        self._reset_state()
+        self.el = self.create_tk(ttk.Treeview, parent.el, columns=self.columns,
+                                 show='tree headings' if self.columns else 'tree')
+        for column in self.columns:
+            self.el.heading(column, text=column)
+        if isinstance(self.changes, ViewModelBindable):
+            self.observe(self.changes, self._on_changes)
+        self.el.bind('<<TreeviewOpen>>', self._on_open)
+        self.el.bind('<<TreeviewClose>>', self._on_close)
+        self.el.bind('<<TreeviewSelect>>', self._on_select)
+        self.el.insert('', 'end', iid='.loading', text='Loading...')
+        self._request('')
+        return self.el